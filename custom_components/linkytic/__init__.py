@@ -8,19 +8,27 @@ import logging
 from homeassistant.components import usb
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import (
+    DATA_SERIAL_NUMBER,
+    DEADBAND_DEFAULTS,
     DOMAIN,
+    LANES_DEFAULT_INTERVALS,
     LINKY_IO_ERRORS,
+    OPTIONS_DEADBANDS,
+    OPTIONS_DISCOVERY,
+    OPTIONS_HOLDOVER,
     OPTIONS_REALTIME,
     SETUP_PRODUCER,
     SETUP_SERIAL,
     SETUP_THREEPHASE,
     SETUP_TICMODE,
+    TICMODE_HISTORIC,
     TICMODE_STANDARD,
 )
+from .coordinator import LinkyTICCoordinator
 from .serial_reader import LinkyTICReader
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
@@ -30,8 +38,9 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up linkytic from a config entry."""
-    # Create the serial reader thread and start it
+    # Create the serial reader and start it (within the event loop, or in its own thread as a fallback)
     port = entry.data.get(SETUP_SERIAL)
+    s_n = entry.data.get(DATA_SERIAL_NUMBER)
     try:
         serial_reader = LinkyTICReader(
             title=entry.title,
@@ -40,19 +49,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             producer_mode=entry.data.get(SETUP_PRODUCER),
             three_phase=entry.data.get(SETUP_THREEPHASE),
             real_time=entry.options.get(OPTIONS_REALTIME),
+            lane_intervals=lane_intervals(entry),
+            holdover=entry.options.get(OPTIONS_HOLDOVER),
+            serial_number=s_n,
         )
-        serial_reader.start()
-
-        async def read_serial_number(serial: LinkyTICReader):
-            while serial.serial_number is None:
-                await asyncio.sleep(1)
-                # Check for any serial error that occurred in the serial thread context
-                if serial.setup_error:
-                    raise serial.setup_error
-            return serial.serial_number
-
-        s_n = await asyncio.wait_for(read_serial_number(serial_reader), timeout=5)
-        # TODO: check if S/N is the one saved in config entry, if not this is a different meter!
+        await serial_reader.async_start(hass.loop)
+        if serial_reader.setup_error:
+            raise serial_reader.setup_error
+        if s_n is None:
+            # First setup: wait for the meter address (ADSC/ADCO) to identify the device, then save it
+            s_n = await asyncio.wait_for(
+                serial_reader.async_wait_serial_number(), timeout=5
+            )
+            hass.config_entries.async_update_entry(
+                entry, data={**entry.data, DATA_SERIAL_NUMBER: s_n}
+            )
+        else:
+            # Identified by the serial number saved: check it once read
+            entry.async_create_background_task(
+                hass,
+                async_check_serial_number(hass, entry, serial_reader),
+                f"{DOMAIN}_{entry.entry_id}_check_serial_number",
+            )
 
     # Error when opening serial port.
     except LINKY_IO_ERRORS as e:
@@ -60,7 +78,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Timeout waiting for S/N to be read.
     except TimeoutError as e:
-        serial_reader.signalstop("linkytic_timeout")
+        # Free the port for the next setup attempt
+        await serial_reader.async_stop("linkytic_timeout")
         raise ConfigEntryNotReady(
             "Connected to serial port but coulnd't read serial number before timeout: check if TIC is connected and active."
         ) from e
@@ -70,13 +89,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, serial_reader.signalstop)
     # Add options callback
     entry.async_on_unload(entry.add_update_listener(update_listener))
-    entry.async_on_unload(lambda: serial_reader.signalstop("config_entry_unload"))
-    # Add the serial reader to HA and initialize sensors
+    # Awaited by the unload: the port is free for the reader of a reloaded entry
+    entry.async_on_unload(lambda: serial_reader.async_stop("config_entry_unload"))
+    # Add the serial reader coordinator to HA and initialize sensors, updated at each frame by the coordinator
+    coordinator = LinkyTICCoordinator(
+        hass,
+        serial_reader,
+        entry.options.get(OPTIONS_DISCOVERY, False),
+        deadbands(entry),
+    )
+    coordinator.async_start()
+    entry.async_on_unload(coordinator.async_stop)
+    entry.async_on_unload(
+        coordinator.async_add_reconfigure_listener(
+            lambda: async_save_ticmode(hass, entry, serial_reader)
+        )
+    )
     try:
-        hass.data[DOMAIN][entry.entry_id] = serial_reader
+        hass.data[DOMAIN][entry.entry_id] = coordinator
     except KeyError:
         hass.data[DOMAIN] = {}
-        hass.data[DOMAIN][entry.entry_id] = serial_reader
+        hass.data[DOMAIN][entry.entry_id] = coordinator
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -90,19 +123,95 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_check_serial_number(
+    hass: HomeAssistant, entry: ConfigEntry, serial_reader: LinkyTICReader
+) -> None:
+    """Check that the serial number read is the one saved: if the meter has been replaced, save the new one and reload the entry to identify the new device."""
+    s_n = await serial_reader.async_wait_serial_number()
+    if s_n == entry.data.get(DATA_SERIAL_NUMBER):
+        _LOGGER.debug("%s: serial number %s checked", entry.title, s_n)
+        return
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, DATA_SERIAL_NUMBER: s_n}
+    )
+    hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry):
     """Handle options update."""
     # Retrieved the serial reader for this config entry
     try:
-        serial_reader = hass.data[DOMAIN][entry.entry_id]
+        coordinator = hass.data[DOMAIN][entry.entry_id]
     except KeyError:
         _LOGGER.error(
             "Can not update options for %s: failed to get the serial reader object",
             entry.title,
         )
         return
+    serial_reader = coordinator.reader
+    if (
+        entry.options.get(OPTIONS_DISCOVERY, False) != coordinator.discovery
+        or entry.data.get(SETUP_SERIAL) != serial_reader.port
+    ):
+        # Entities are only added at setup: reload to add or discover them. A new port needs a new reader.
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+    # Apply the meter setup on the open connection, the TIC mode at the next frame boundary
+    serial_reader.reconfigure(
+        entry.data.get(SETUP_TICMODE) == TICMODE_STANDARD,
+        entry.data.get(SETUP_PRODUCER, False),
+        entry.data.get(SETUP_THREEPHASE, False),
+    )
     # Update its options
-    serial_reader.update_options(entry.options.get(OPTIONS_REALTIME))
+    serial_reader.update_options(
+        entry.options.get(OPTIONS_REALTIME),
+        lane_intervals(entry),
+        entry.options.get(OPTIONS_HOLDOVER),
+    )
+    # Applied by the measurement sensors from their next value
+    coordinator.deadbands = deadbands(entry)
+
+
+@callback
+def async_save_ticmode(
+    hass: HomeAssistant, entry: ConfigEntry, serial_reader: LinkyTICReader
+) -> None:
+    """Save the TIC mode read once settled: the previous mode is restored if the one set can not be validated (see LinkyTICReader.reconfigure)."""
+    if not serial_reader.mode_validated:
+        return
+    ticmode = TICMODE_STANDARD if serial_reader.std_mode else TICMODE_HISTORIC
+    if entry.data.get(SETUP_TICMODE) == ticmode:
+        return
+    _LOGGER.warning(
+        "%s: no frame could be read in the TIC mode set, back to the %s mode",
+        entry.title,
+        "standard" if serial_reader.std_mode else "historic",
+    )
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, SETUP_TICMODE: ticmode}
+    )
+
+
+def lane_intervals(entry: ConfigEntry) -> dict[str, float]:
+    """Get the publish rate lanes intervals set in the options."""
+    return {
+        lane: entry.options[lane]
+        for lane in LANES_DEFAULT_INTERVALS
+        if entry.options.get(lane) is not None
+    }
+
+
+def deadbands(entry: ConfigEntry) -> dict[str, tuple[float, float, float]]:
+    """Get the deadband settings of the measurement sensors classes set in the options, the defaults otherwise."""
+    settings = {}
+    for deadband_class, (absolute, relative, max_silence) in DEADBAND_DEFAULTS.items():
+        absolute_key, relative_key, max_silence_key = OPTIONS_DEADBANDS[deadband_class]
+        settings[deadband_class] = (
+            entry.options.get(absolute_key, absolute),
+            entry.options.get(relative_key, relative),
+            entry.options.get(max_silence_key, max_silence),
+        )
+    return settings
 
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry):
@@ -11,11 +11,12 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, SETUP_TICMODE, TICMODE_STANDARD
-from .entity import LinkyTICEntity
+from .const import DOMAIN
+from .coordinator import LinkyTICCoordinator
+from .entity import LinkyTICEntity, async_setup_entities
 from .serial_reader import LinkyTICReader
 from .status_register import StatusRegister
 
@@ -100,19 +101,30 @@ async def async_setup_entry(
     _LOGGER.debug("%s: setting up binary sensor plateform", config_entry.title)
     # Retrieve the serial reader object
     try:
-        serial_reader = hass.data[DOMAIN][config_entry.entry_id]
+        coordinator: LinkyTICCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     except KeyError:
         _LOGGER.error(
             "%s: can not init binaries sensors: failed to get the serial reader object",
             config_entry.title,
         )
         return
-    # Init sensors
-    sensors: list[BinarySensorEntity] = [
+    await async_setup_entities(
+        coordinator,
+        config_entry,
+        lambda: build_binary_sensors(config_entry, coordinator.reader),
+        async_add_entities,
+    )
+
+
+def build_binary_sensors(
+    config_entry: ConfigEntry, serial_reader: LinkyTICReader
+) -> list[LinkyTICEntity]:
+    """Build the binary sensors of the TIC mode read (see LinkyTICReader.reconfigure)."""
+    sensors: list[LinkyTICEntity] = [
         SerialConnectivity(config_entry.title, config_entry.entry_id, serial_reader)
     ]
 
-    if config_entry.data.get(SETUP_TICMODE) == TICMODE_STANDARD:
+    if serial_reader.std_mode:
         sensors.extend(
             StatusRegisterBinarySensor(
                 name=name,
@@ -127,8 +139,7 @@ async def async_setup_entry(
             )
             for field, name, devclass, icon_off, icon_on, inverted in STATUS_REGISTER_SENSORS
         )
-
-    async_add_entities(sensors, True)
+    return sensors
 
 
 class SerialConnectivity(LinkyTICEntity, BinarySensorEntity):
@@ -157,6 +168,15 @@ class SerialConnectivity(LinkyTICEntity, BinarySensorEntity):
         """Value of the sensor."""
         return self._serial_controller.is_connected
 
+    @property
+    def extra_state_attributes(self) -> dict[str, bool | int]:
+        """Get HA sensor extra attributes: the reconnection failure and the stalls of the link."""
+        return {
+            "échec de reconnexion": self._serial_controller.connection_failed,
+            "liaison bloquée": self._serial_controller.stalled,
+            "blocages": self._serial_controller.stalls,
+        }
+
 
 class StatusRegisterBinarySensor(LinkyTICEntity, BinarySensorEntity):
     """Binary sensor for binary status register fields."""
@@ -184,6 +204,7 @@ class StatusRegisterBinarySensor(LinkyTICEntity, BinarySensorEntity):
 
         self._config_title = config_title
         self._binary_state = False  # Default state.
+        self._version = 0  # version of the tag value last processed
         self._inverted = inverted
         self._field = field
         self._attr_name = name
@@ -215,12 +236,27 @@ class StatusRegisterBinarySensor(LinkyTICEntity, BinarySensorEntity):
         value, _ = self._update()
         if not value:
             return
-        self._binary_state = cast(bool, self._field.value.get_status(value))
+        decoded = self._serial_controller.get_decoded_status()
+        if decoded is None or self._field not in decoded.fields:
+            return  # Failsafe, state is unchanged.
+        self._binary_state = cast(bool, decoded.fields[self._field])
+
+    @callback
+    def async_handle_notification(self, forced_update: bool) -> None:
+        """Update the state from the serial reader memory cache and write it."""
+        self.update()
+        super().async_handle_notification(forced_update)
 
     # TODO: factor _update function to remove copy from sensors entities
     def _update(self) -> tuple[Optional[str], Optional[str]]:
-        """Get value and/or timestamp from cached data. Responsible for updating sensor availability."""
-        value, timestamp = self._serial_controller.get_values(self._tag)
+        """Get value and/or timestamp from cached data. Responsible for updating sensor availability. Returns (None, None) if there is no data or if it has not changed since last call."""
+        value, timestamp, version = self._serial_controller.get_versioned_values(
+            self._tag
+        )
+        if version and version == self._version:
+            # Nothing changed since last update
+            return None, None
+        self._version = version
         _LOGGER.debug(
             "%s: retrieved %s value from serial controller: (%s, %s)",
             self._config_title,
@@ -21,7 +21,13 @@ from homeassistant.core import callback
 from homeassistant.helpers import selector
 
 from .const import (
+    DEADBAND_DEFAULTS,
     DOMAIN,
+    HOLDOVER_DEFAULT,
+    LANES_DEFAULT_INTERVALS,
+    OPTIONS_DEADBANDS,
+    OPTIONS_DISCOVERY,
+    OPTIONS_HOLDOVER,
     OPTIONS_REALTIME,
     SETUP_PRODUCER,
     SETUP_PRODUCER_DEFAULT,
@@ -41,27 +47,78 @@ from .serial_reader import CannotConnect, CannotRead, linky_tic_tester
 
 _LOGGER = logging.getLogger(__name__)
 
+TICMODE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(
+                value=TICMODE_HISTORIC, label=TICMODE_HISTORIC_LABEL
+            ),
+            selector.SelectOptionDict(
+                value=TICMODE_STANDARD, label=TICMODE_STANDARD_LABEL
+            ),
+        ]
+    ),
+)
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(SETUP_SERIAL, default=SETUP_SERIAL_DEFAULT): str,  # type: ignore
-        vol.Required(SETUP_TICMODE, default=TICMODE_HISTORIC): selector.SelectSelector(  # type: ignore
-            selector.SelectSelectorConfig(
-                options=[
-                    selector.SelectOptionDict(
-                        value=TICMODE_HISTORIC, label=TICMODE_HISTORIC_LABEL
-                    ),
-                    selector.SelectOptionDict(
-                        value=TICMODE_STANDARD, label=TICMODE_STANDARD_LABEL
-                    ),
-                ]
-            ),
-        ),
+        vol.Required(SETUP_TICMODE, default=TICMODE_HISTORIC): TICMODE_SELECTOR,  # type: ignore
         vol.Required(SETUP_PRODUCER, default=SETUP_PRODUCER_DEFAULT): bool,  # type: ignore
         vol.Required(SETUP_THREEPHASE, default=SETUP_THREEPHASE_DEFAULT): bool,  # type: ignore
     }
 )
 
 
+# Publish rate lanes intervals, in seconds (0: as soon as a frame brings a new value)
+LANE_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=3600,
+        step=1,
+        unit_of_measurement="s",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+
+# Hold-over window on serial errors, in seconds (0: values unavailable as soon as the link is lost)
+HOLDOVER_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=3600,
+        step=1,
+        unit_of_measurement="s",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+
+# Measurement sensors deadbands: absolute (sensor unit) and relative (% of the published value), see DEADBAND_DEFAULTS
+DEADBAND_ABSOLUTE_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0, max=1000, step=1, mode=selector.NumberSelectorMode.BOX
+    )
+)
+DEADBAND_RELATIVE_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=100,
+        step=0.5,
+        unit_of_measurement="%",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+# Max silence of a value held back by a deadband, in seconds (0: published right away)
+DEADBAND_MAX_SILENCE_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=86400,
+        step=1,
+        unit_of_measurement="s",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+
+
 class LinkyTICConfigFlow(ConfigFlow, domain=DOMAIN):  # type:ignore
     """Handle a config flow for linkytic."""
 
@@ -114,6 +171,41 @@ class LinkyTICConfigFlow(ConfigFlow, domain=DOMAIN):  # type:ignore
             description_placeholders={"url_help": URL_HELP},
         )
 
+    async def async_step_reconfigure(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the meter setup changes, applied to the running reader (see LinkyTICReader.reconfigure)."""
+        entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
+        assert entry is not None
+        if user_input is not None:
+            # The update listener reconfigures the reader: no reload needed
+            self.hass.config_entries.async_update_entry(
+                entry, data={**entry.data, **user_input}
+            )
+            return self.async_abort(reason="reconfigure_successful")
+
+        return self.async_show_form(
+            step_id="reconfigure",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        SETUP_TICMODE,
+                        default=entry.data.get(SETUP_TICMODE),  # type: ignore
+                    ): TICMODE_SELECTOR,
+                    vol.Required(
+                        SETUP_PRODUCER,
+                        default=entry.data.get(SETUP_PRODUCER, SETUP_PRODUCER_DEFAULT),  # type: ignore
+                    ): bool,
+                    vol.Required(
+                        SETUP_THREEPHASE,
+                        default=entry.data.get(
+                            SETUP_THREEPHASE, SETUP_THREEPHASE_DEFAULT
+                        ),  # type: ignore
+                    ): bool,
+                }
+            ),
+        )
+
     # async def async_step_usb(self, discovery_info: UsbServiceInfo) -> FlowResult:
     #     """Handle a flow initialized by USB discovery."""
     #     return await self.async_step_discovery(dataclasses.asdict(discovery_info))
@@ -130,12 +222,17 @@ class LinkyTICConfigFlow(ConfigFlow, domain=DOMAIN):  # type:ignore
 class OptionsFlowHandler(OptionsFlow):
     """Handles the options of a Linky TIC connection."""
 
+    def __init__(self) -> None:
+        """Init the options flow."""
+        self._options: dict[str, Any] = {}
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Manage the options."""
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            self._options = user_input
+            return await self.async_step_deadbands()
 
         return self.async_show_form(
             step_id="init",
@@ -144,7 +241,52 @@ class OptionsFlowHandler(OptionsFlow):
                     vol.Required(
                         OPTIONS_REALTIME,
                         default=self.config_entry.options.get(OPTIONS_REALTIME),  # type: ignore
-                    ): bool
+                    ): bool,
+                    **{
+                        vol.Required(
+                            lane,
+                            default=self.config_entry.options.get(lane, interval),  # type: ignore
+                        ): LANE_INTERVAL_SELECTOR
+                        for lane, interval in LANES_DEFAULT_INTERVALS.items()
+                    },
+                    vol.Required(
+                        OPTIONS_DISCOVERY,
+                        default=self.config_entry.options.get(OPTIONS_DISCOVERY, False),  # type: ignore
+                    ): bool,
+                    vol.Required(
+                        OPTIONS_HOLDOVER,
+                        default=self.config_entry.options.get(
+                            OPTIONS_HOLDOVER, HOLDOVER_DEFAULT
+                        ),  # type: ignore
+                    ): HOLDOVER_SELECTOR,
                 }
             ),
         )
+
+    async def async_step_deadbands(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the deadbands of the measurement sensors classes."""
+        if user_input is not None:
+            return self.async_create_entry(
+                title="", data={**self._options, **user_input}
+            )
+
+        schema: dict[vol.Marker, Any] = {}
+        for deadband_class, defaults in DEADBAND_DEFAULTS.items():
+            for key, default, deadband_selector in zip(
+                OPTIONS_DEADBANDS[deadband_class],
+                defaults,
+                (
+                    DEADBAND_ABSOLUTE_SELECTOR,
+                    DEADBAND_RELATIVE_SELECTOR,
+                    DEADBAND_MAX_SILENCE_SELECTOR,
+                ),
+            ):
+                schema[
+                    vol.Required(
+                        key,
+                        default=self.config_entry.options.get(key, default),  # type: ignore
+                    )
+                ] = deadband_selector
+        return self.async_show_form(step_id="deadbands", data_schema=vol.Schema(schema))
@@ -6,6 +6,9 @@ from serial import PARITY_EVEN, SEVENBITS, STOPBITS_ONE, SerialException
 
 DOMAIN = "linkytic"
 
+# Fired when fields of the status register (STGE) change, with the before/after values of these fields
+EVENT_STATUS_CHANGED = f"{DOMAIN}_status_changed"
+
 # Some termios exceptions are uncaught by pyserial
 LINKY_IO_ERRORS = (SerialException, error)
 
@@ -24,12 +27,104 @@ SETUP_PRODUCER_DEFAULT = False
 SETUP_THREEPHASE = "three_phase"
 SETUP_THREEPHASE_DEFAULT = False
 
+# Meter serial number (ADSC/ADCO) saved in the config entry data once read
+DATA_SERIAL_NUMBER = "serial_number"
+
 OPTIONS_REALTIME = "real_time"
+# Without the real time option, tags updates are notified at most once per polling interval (seconds): the cadence of
+# the sensor platform polling the entities used to be updated at
+POLLING_INTERVAL = 30
+
+# Entities discovery: only the entities of the tags read by a complete frame are added, the others once their tag shows up
+OPTIONS_DISCOVERY = "discovery"
+
+# Serial errors hold-over: the values read stay valid this long (seconds) while reconnecting, before being cleared
+OPTIONS_HOLDOVER = "holdover"
+HOLDOVER_DEFAULT = 30
+
+# Publish rate lanes: updates of the tags of a lane are notified at most once per lane interval (seconds, 0 for as soon
+# as a frame brings a new value). Tags not listed in a lane are in the change lane.
+OPTIONS_LANE_FAST = "lane_fast"
+OPTIONS_LANE_SLOW = "lane_slow"
+OPTIONS_LANE_CHANGE = "lane_change"
+OPTIONS_LANE_DIAGNOSTIC = "lane_diagnostic"
+LANES_DEFAULT_INTERVALS = {
+    OPTIONS_LANE_FAST: 0,
+    OPTIONS_LANE_SLOW: 60,
+    OPTIONS_LANE_CHANGE: 0,
+    OPTIONS_LANE_DIAGNOSTIC: 300,
+}
+LANES_TAGS = {
+    # Power and current
+    OPTIONS_LANE_FAST: (
+        "IINST",
+        "IINST1",
+        "IINST2",
+        "IINST3",
+        "PAPP",
+        "IRMS1",
+        "IRMS2",
+        "IRMS3",
+        "SINSTS",
+        "SINSTS1",
+        "SINSTS2",
+        "SINSTS3",
+        "SINSTI",
+        "SINST1",
+    ),
+    # Voltages and clock
+    OPTIONS_LANE_SLOW: (
+        "URMS1",
+        "URMS2",
+        "URMS3",
+        "UMOY1",
+        "UMOY2",
+        "UMOY3",
+        "DATE",
+    ),
+    # Identification, contract and messages
+    OPTIONS_LANE_DIAGNOSTIC: (
+        "ADCO",
+        "ADSC",
+        "VTIC",
+        "PRM",
+        "OPTARIF",
+        "NGTF",
+        "LTARF",
+        "HHPHC",
+        "MOTDETAT",
+        "PPOT",
+        "MSG1",
+        "MSG2",
+        "PJOURF+1",
+        "PPOINTE",
+    ),
+}
+
+# Measurement sensors publishing: values held back by a deadband are published at least this often (seconds)
+DEADBAND_MAX_SILENCE = 300
+# Deadbands of the measurement sensors classes: absolute (sensor unit), relative (% of the published value) and max
+# silence (seconds). Each setting is an option of the class, deadband_<class>_<setting>.
+OPTIONS_DEADBAND = "deadband"
+DEADBAND_SETTINGS = ("absolute", "relative", "max_silence")
+DEADBAND_DEFAULTS = {
+    "voltage": (2, 0, DEADBAND_MAX_SILENCE),
+    "current": (1, 10, DEADBAND_MAX_SILENCE),
+    "power": (20, 2, DEADBAND_MAX_SILENCE),
+    "apparent_power": (20, 2, DEADBAND_MAX_SILENCE),
+}
+OPTIONS_DEADBANDS = {
+    deadband_class: tuple(
+        f"{OPTIONS_DEADBAND}_{deadband_class}_{setting}"
+        for setting in DEADBAND_SETTINGS
+    )
+    for deadband_class in DEADBAND_DEFAULTS
+}
 
 URL_HELP = "https://github.com/hekmon/linkytic?tab=readme-ov-file#installation"
 URL_ISSUES = "https://github.com/hekmon/linkytic/issues"
 
-# Protocol configuration
+# Protocol configuration (stream markers and tags catalog: see protocol.py)
 # #  https://www.enedis.fr/media/2035/download
 
 BYTESIZE = SEVENBITS
@@ -37,13 +132,27 @@ PARITY = PARITY_EVEN
 STOPBITS = STOPBITS_ONE
 
 MODE_STANDARD_BAUD_RATE = 9600
-MODE_STANDARD_FIELD_SEPARATOR = b"\x09"
-
 MODE_HISTORIC_BAUD_RATE = 1200
-MODE_HISTORIC_FIELD_SEPARATOR = b"\x20"
 
-LINE_END = b"\r\n"
-FRAME_END = b"\r\x03\x02\n"
+# Reconnection attempts are spaced by a jittered exponential backoff (seconds), the connection being reported as failed
+# after a number of attempts. Local devices are watched to retry as soon as their path appears again, restarting the
+# backoff.
+RECONNECT_DELAY_MIN = 0.5
+RECONNECT_DELAY_MAX = 300
+RECONNECT_FAILURE_ATTEMPTS = 10
+
+# Stall watchdog: the link is declared stalled (and the serial connection reopened) when no valid group has been read
+# for STALL_FRAME_PERIODS frame periods, or no frame end (complete or not) for twice as long. The frame period is the
+# duration of a long frame of the mode (bytes) at its baud rate.
+MODE_STANDARD_FRAME_SIZE = 1200
+MODE_HISTORIC_FRAME_SIZE = 300
+STALL_FRAME_PERIODS = 5
+
+# Stopping a reader waits this long (seconds) at most for its serial connection to be closed
+READER_STOP_TIMEOUT = 2
+
+# Invalid groups (noisy line) are logged in aggregate, at most once per interval (seconds)
+INVALID_GROUPS_LOG_INTERVAL = 60
 
 SHORT_FRAME_DETECTION_TAGS = ["ADIR1", "ADIR2", "ADIR3"]
 SHORT_FRAME_FORCED_UPDATE_TAGS = [
@@ -0,0 +1,118 @@
+"""Push coordinator for linkytic integration."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import EVENT_STATUS_CHANGED
+from .serial_reader import LinkyTICReader
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LinkyTICCoordinator:
+    """Deliver the serial reader updates to the linkytic entities, once per frame.
+
+    Entities do not poll: each one registers a listener for its tag and is called, within the event loop, when the
+    frame completion brings a new value for it. Entities without a tag are only called when every entity must
+    refresh (connection state changes, first full frame).
+    Status register changes are fired as EVENT_STATUS_CHANGED events.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        reader: LinkyTICReader,
+        discovery: bool = False,
+        deadbands: dict[str, tuple[float, float, float]] | None = None,
+    ) -> None:
+        """Init the coordinator of a serial reader."""
+        self.hass = hass
+        self.reader = reader
+        # Entities are only added once their tag has been read (see async_add_discovered_entities)
+        self.discovery = discovery
+        # Deadband settings of the measurement sensors classes, the defaults for the classes missing (see
+        # RegularIntSensor): absolute, relative (%) and max silence
+        self.deadbands = deadbands or {}
+        self._listeners: dict[str | None, list[Callable[[bool], None]]] = {}
+        self._reconfigure_listeners: list[Callable[[], None]] = []
+        self._unregister: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Start receiving the serial reader notifications."""
+        self._unregister = [
+            self.reader.register_push_notif(self._handle_notifications),
+            self.reader.register_status_notif(self._handle_status_change),
+            self.reader.register_reconfigure_notif(self._async_reconfigured),
+        ]
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop receiving the serial reader notifications."""
+        for unregister in self._unregister:
+            unregister()
+        self._unregister = []
+
+    @callback
+    def async_add_listener(
+        self, tag: str | None, update_callback: Callable[[bool], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for the updates of a tag (None for refreshes only). The callback receives the forced update flag. Returns a function to remove the listener."""
+        listeners = self._listeners.setdefault(tag, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+            if not listeners:
+                del self._listeners[tag]
+
+        return remove_listener
+
+    @callback
+    def async_add_reconfigure_listener(
+        self, reconfigure_callback: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for the serial reader reconfigurations (see LinkyTICReader.reconfigure): the tags read may have changed. Returns a function to remove the listener."""
+        self._reconfigure_listeners.append(reconfigure_callback)
+        return lambda: self._reconfigure_listeners.remove(reconfigure_callback)
+
+    @callback
+    def _async_reconfigured(self) -> None:
+        """Call the reconfiguration listeners, the serial reader calling from within the event loop."""
+        for reconfigure_callback in list(self._reconfigure_listeners):
+            reconfigure_callback()
+
+    def _handle_notifications(self, notifications: dict[str, bool] | None) -> None:
+        """Receive the serial reader notifications, from the reader thread or the event loop."""
+        if self.reader.notifies_in_event_loop:
+            self._async_dispatch(notifications)
+        else:
+            self.hass.loop.call_soon_threadsafe(self._async_dispatch, notifications)
+
+    @callback
+    def _async_dispatch(self, notifications: dict[str, bool] | None) -> None:
+        """Call the listeners of the updated tags, or all of them on refresh."""
+        if notifications is None:
+            _LOGGER.debug("%s: refreshing every entity", self.reader.name)
+            for listeners in list(self._listeners.values()):
+                for update_callback in list(listeners):
+                    update_callback(False)
+            return
+        for tag, forced_update in notifications.items():
+            for update_callback in self._listeners.get(tag, ()):
+                update_callback(forced_update)
+
+    def _handle_status_change(self, status_change: dict[str, Any]) -> None:
+        """Fire the status register changes as an event, from the reader thread or the event loop."""
+        if self.reader.notifies_in_event_loop:
+            self.hass.bus.async_fire(EVENT_STATUS_CHANGED, status_change)
+        else:
+            self.hass.loop.call_soon_threadsafe(
+                self.hass.bus.async_fire, EVENT_STATUS_CHANGED, status_change
+            )
@@ -0,0 +1,168 @@
+"""Watch a serial device path to know as soon as it appears again (USB re-enumeration)."""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import sys
+
+_LOGGER = logging.getLogger(__name__)
+
+# inotify(7) constants
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_ONLYDIR = 0x01000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_CREATE
+    | _IN_MOVED_TO
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    """Load the C library providing inotify, None if not on Linux."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+_libc = _load_libc()
+
+
+class DeviceWatcher:
+    """Wait for a device path (/dev/serial/by-id/... for instance) to appear, with inotify.
+
+    The deepest existing directory of the path is watched: /dev/serial/by-id is removed by udev along with the last
+    USB serial device, the watch then moves up to /dev/serial or /dev, and back down as the directories are created.
+    No polling: the inotify file descriptor is either waited for with a timeout (thread, see wait() and interrupt())
+    or registered within the event loop (see fileno() and check()).
+    """
+
+    __slots__ = ("_path", "_fd", "_wd", "_exists", "_interrupt_r", "_interrupt_w")
+
+    def __init__(self, path: str) -> None:
+        """Init a watcher of a device path, not watching yet (see start())."""
+        self._path = os.path.abspath(path)
+        self._fd: int | None = None
+        self._wd = -1
+        self._exists = False
+        # Self-pipe waking wait() up (see interrupt())
+        self._interrupt_r: int | None = None
+        self._interrupt_w: int | None = None
+
+    @staticmethod
+    def supports(path: str | None) -> bool:
+        """Check if a serial port can be watched: a local device path (not an URL), on Linux."""
+        return _libc is not None and path is not None and path.startswith("/dev/")
+
+    def start(self) -> bool:
+        """Start watching the path. Returns False if inotify is not available."""
+        if _libc is None:
+            return False
+        fd = _libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            _LOGGER.debug(
+                "Can not watch %s: %s", self._path, os.strerror(ctypes.get_errno())
+            )
+            return False
+        self._fd = fd
+        self._interrupt_r, self._interrupt_w = os.pipe()
+        self._watch()
+        self._exists = os.path.exists(self._path)
+        return True
+
+    def close(self) -> None:
+        """Stop watching the path."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._wd = -1
+        if self._interrupt_r is not None and self._interrupt_w is not None:
+            os.close(self._interrupt_r)
+            os.close(self._interrupt_w)
+            self._interrupt_r = self._interrupt_w = None
+
+    def interrupt(self) -> None:
+        """Wake wait() up, from another thread: it returns right away, now and for every later call."""
+        if self._interrupt_w is not None:
+            os.write(self._interrupt_w, b"\0")
+
+    def fileno(self) -> int:
+        """Get the inotify file descriptor, readable when the watched directory changes (see check())."""
+        assert self._fd is not None
+        return self._fd
+
+    def check(self) -> bool:
+        """Consume the pending directory changes and follow the path down to its deepest existing directory. Returns True if the path has appeared since the last check."""
+        assert self._fd is not None
+        while True:
+            try:
+                if not os.read(self._fd, 4096):
+                    break
+            except BlockingIOError:
+                break
+        self._watch()
+        exists = os.path.exists(self._path)
+        appeared = exists and not self._exists
+        self._exists = exists
+        return appeared
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for the path to appear, or an interruption. Returns True if it has appeared."""
+        assert self._fd is not None and self._interrupt_r is not None
+        try:
+            readable, _, _ = select.select(
+                [self._fd, self._interrupt_r], [], [], timeout
+            )
+        except InterruptedError:
+            readable = []
+        return (
+            self._fd in readable and self._interrupt_r not in readable and self.check()
+        )
+
+    def _watch(self) -> None:
+        """Watch the deepest existing directory of the path, replacing the previous watch."""
+        assert _libc is not None and self._fd is not None
+        if self._wd >= 0:
+            # Fails if the directory has been removed (the watch with it): nothing to do then
+            _libc.inotify_rm_watch(self._fd, self._wd)
+            self._wd = -1
+        directory = os.path.dirname(self._path)
+        while True:
+            self._wd = _libc.inotify_add_watch(
+                self._fd, os.fsencode(directory), _WATCH_MASK
+            )
+            if self._wd >= 0:
+                return
+            parent = os.path.dirname(directory)
+            if ctypes.get_errno() not in (errno.ENOENT, errno.ENOTDIR) or (
+                parent == directory
+            ):
+                _LOGGER.debug(
+                    "Can not watch %s: %s", directory, os.strerror(ctypes.get_errno())
+                )
+                return
+            directory = parent
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+from collections.abc import Callable, Iterable
 from typing import cast
 
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     DID_CONSTRUCTOR,
@@ -16,20 +23,48 @@ from .const import (
     DID_TYPE,
     DOMAIN,
 )
+from .coordinator import LinkyTICCoordinator
 from .serial_reader import LinkyTICReader
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class LinkyTICEntity(Entity):
     """Base class for all linkytic entities."""
 
     _serial_controller: LinkyTICReader
-    _attr_should_poll = True
+    _coordinator: LinkyTICCoordinator | None = None  # set once added to hass
+    _attr_should_poll = False  # values are pushed by the coordinator at each frame
     _attr_has_entity_name = True
+    _tag: str | None = None  # tag the entity is notified for, None for refreshes only
 
     def __init__(self, reader: LinkyTICReader):
         """Init Linkytic entity."""
         self._serial_controller = reader
 
+    async def async_added_to_hass(self) -> None:
+        """Register to the coordinator updates."""
+        await super().async_added_to_hass()
+        assert self.platform.config_entry is not None
+        coordinator: LinkyTICCoordinator = self.hass.data[DOMAIN][
+            self.platform.config_entry.entry_id
+        ]
+        self._coordinator = coordinator
+        self.async_on_remove(
+            coordinator.async_add_listener(self._tag, self.async_handle_notification)
+        )
+        # Values already read are shown right away: the state is written once the entity is added
+        self.update()
+
+    @callback
+    def update(self) -> None:
+        """Update the entity from the serial reader memory cache."""
+
+    @callback
+    def async_handle_notification(self, forced_update: bool) -> None:
+        """Write the entity state after the coordinator notified new data."""
+        self.async_write_ha_state()
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return a device description for device registry."""
@@ -41,3 +76,127 @@ class LinkyTICEntity(Entity):
             model=did.get(DID_TYPE, DID_DEFAULT_MODEL),
             name=DID_DEFAULT_NAME,
         )
+
+
+@callback
+def async_add_discovered_entities(
+    coordinator: LinkyTICCoordinator,
+    entities: Iterable[LinkyTICEntity],
+    async_add_entities: AddEntitiesCallback,
+) -> CALLBACK_TYPE:
+    """Add the entities whose tag has been read since the first complete frame, and each of the others as soon as its tag is.
+
+    Entities without a tag are added right away. Tags are watched with coordinator listeners: a tag showing up later
+    (contract change) is notified as a new value, and the first complete frame refreshes every listener.
+    Returns a function to stop the discovery.
+    """
+    reader = coordinator.reader
+    pending: dict[str, list[LinkyTICEntity]] = {}
+    added: list[LinkyTICEntity] = []
+    for entity in entities:
+        if entity._tag is None:
+            added.append(entity)
+        else:
+            pending.setdefault(entity._tag, []).append(entity)
+    if added:
+        async_add_entities(added)
+
+    @callback
+    def discover(tags: Iterable[str]) -> None:
+        if not reader.has_read_full_frame:
+            return
+        discovered: list[LinkyTICEntity] = []
+        for tag in tags:
+            # Live values: short frames tags (historic three-phase bursts) are never part of a complete frame
+            if tag in pending and reader.get_values(tag, live=True)[0] is not None:
+                discovered.extend(pending.pop(tag))
+        if discovered:
+            _LOGGER.debug(
+                "%s: adding %d discovered entities", reader.name, len(discovered)
+            )
+            async_add_entities(discovered)
+
+    removers = [coordinator.async_add_listener(None, lambda _: discover(list(pending)))]
+    removers.extend(
+        coordinator.async_add_listener(tag, lambda _, tag=tag: discover((tag,)))
+        for tag in pending
+    )
+    discover(list(pending))
+
+    @callback
+    def stop_discovery() -> None:
+        for remove in removers:
+            remove()
+
+    return stop_discovery
+
+
+async def async_setup_entities(
+    coordinator: LinkyTICCoordinator,
+    config_entry: ConfigEntry,
+    build_entities: Callable[[], list[LinkyTICEntity]],
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add the entities of a platform, and rebuild them each time the serial reader is reconfigured.
+
+    On reconfiguration (TIC mode, producer or three-phase change), the entities no longer built are removed, from the
+    entity registry too unless their unique id is built again, and the new ones added, the others being kept as is.
+    Entities are added through the discovery if enabled.
+    """
+    added: dict[tuple[str | None, str | None], LinkyTICEntity] = {}
+    stop_discovery: CALLBACK_TYPE | None = None
+    lock = asyncio.Lock()
+
+    @callback
+    def add(new_entities: Iterable[Entity], update_before_add: bool = False) -> None:
+        new_entities = list(new_entities)
+        for entity in cast(list[LinkyTICEntity], new_entities):
+            added[(entity.unique_id, entity._tag)] = entity
+        async_add_entities(new_entities, update_before_add)
+
+    async def async_build() -> None:
+        nonlocal stop_discovery
+        async with lock:
+            if stop_discovery is not None:
+                stop_discovery()
+                stop_discovery = None
+            entities = {
+                (entity.unique_id, entity._tag): entity for entity in build_entities()
+            }
+            unique_ids = {unique_id for unique_id, _ in entities}
+            for key in [key for key in added if key not in entities]:
+                entity = added.pop(key)
+                await entity.async_remove()
+                # Not to be left behind as an unavailable entity in the registry
+                if entity.registry_entry is not None and key[0] not in unique_ids:
+                    er.async_get(coordinator.hass).async_remove(entity.entity_id)
+            new_entities = [
+                entity for key, entity in entities.items() if key not in added
+            ]
+            if added:
+                _LOGGER.debug(
+                    "%s: reconfigured, %d entities kept, %d new",
+                    config_entry.title,
+                    len(added),
+                    len(new_entities),
+                )
+            if coordinator.discovery:
+                stop_discovery = async_add_discovered_entities(
+                    coordinator, new_entities, add
+                )
+            else:
+                # Refreshed from the reader once added (see LinkyTICEntity.async_added_to_hass)
+                add(new_entities)
+
+    @callback
+    def rebuild() -> None:
+        config_entry.async_create_task(coordinator.hass, async_build())
+
+    @callback
+    def stop() -> None:
+        if stop_discovery is not None:
+            stop_discovery()
+
+    await async_build()
+    config_entry.async_on_unload(coordinator.async_add_reconfigure_listener(rebuild))
+    config_entry.async_on_unload(stop)
@@ -0,0 +1,374 @@
+"""Stateless Linky TIC groups and frames parser.
+
+This module only depends on protocol.py, which has no dependency either: neither Home Assistant nor pyserial. Both can
+be loaded on their own (see tests/test_parser.py) to decode captured TIC streams offline.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum
+from functools import lru_cache
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
+
+from .protocol import (
+    FRAME_INTERRUPT,
+    FRAME_START,
+    FRAME_STOP,
+    GROUP_MAX_SIZE,
+    GROUP_START,
+    GROUP_STOP,
+    MODE_HISTORIC_FIELD_SEPARATOR,
+    MODE_STANDARD_FIELD_SEPARATOR,
+    TAG_CATALOG,
+)
+
+# A group is enclosed between LF and CR (the CR being followed by ETX on the last group of a frame)
+_GROUP_PATTERN = re.compile(rb"\n([^\r\n]*)\r")
+
+# The stream is decoded between its frame and group markers
+_MARKERS_PATTERN = re.compile(
+    b"[%s]"
+    % re.escape(
+        bytes((FRAME_START, FRAME_STOP, FRAME_INTERRUPT, GROUP_START, GROUP_STOP))
+    )
+)
+
+# Season flag of the timestamps: E(té)/H(iver), lowercase when the meter clock is degraded.
+# Meters not handling the seasons (flag left blank) give the legal time of France.
+_SEASON_TIMEZONES = {
+    "E": timezone(timedelta(hours=2)),
+    "H": timezone(timedelta(hours=1)),
+}
+_LEGAL_TIMEZONE = ZoneInfo("Europe/Paris")
+
+_STANDARD_SEPARATOR = MODE_STANDARD_FIELD_SEPARATOR.decode("ascii")
+_HISTORIC_SEPARATOR = MODE_HISTORIC_FIELD_SEPARATOR.decode("ascii")
+_STANDARD_SEPARATOR_BYTE = MODE_STANDARD_FIELD_SEPARATOR[0]
+_HISTORIC_SEPARATOR_BYTE = MODE_HISTORIC_FIELD_SEPARATOR[0]
+
+
+class Group(NamedTuple):
+    """A validated TIC group (also known as "dataset" or "information")."""
+
+    tag: str
+    value: str
+    timestamp: str | None = None
+
+
+class GroupStatus(IntEnum):
+    """Outcome of the validation of a group by decode_group(), then of its value and timestamp (see convert_value() and parse_timestamp())."""
+
+    VALID = 0
+    MALFORMED = 1
+    INVALID_CHECKSUM = 2
+    NON_ASCII = 3
+    INVALID_FIELDS = 4
+    INVALID_VALUE = 5
+    INVALID_TIMESTAMP = 6
+
+
+# Looked up once rather than on the enum for each group
+_VALID = GroupStatus.VALID
+_MALFORMED = GroupStatus.MALFORMED
+_INVALID_CHECKSUM = GroupStatus.INVALID_CHECKSUM
+_NON_ASCII = GroupStatus.NON_ASCII
+_INVALID_FIELDS = GroupStatus.INVALID_FIELDS
+_new_group = tuple.__new__
+
+
+def decode_group(
+    group: bytes | bytearray | memoryview, std_mode: bool
+) -> tuple[GroupStatus, Group | None]:
+    """Validate and decode a single group, given without its LF/CR delimiters, without raising.
+
+    Returns the validation status and the group, None if it is not valid. Nothing is formatted for invalid groups:
+    see parse_group() for the detailed errors.
+    Called for every group read: the checksum is summed over bytes (faster than over a memoryview) and the group built
+    without the keyword arguments handling of its NamedTuple constructor.
+    """
+    if type(group) is not bytes:
+        group = bytes(group)
+    if std_mode:
+        if len(group) < 3 or group[-2] != _STANDARD_SEPARATOR_BYTE:
+            return _MALFORMED, None
+        # The standard mode checksum covers the last separator, the historic mode one does not
+        if (sum(group[:-1]) & 0x3F) + 0x20 != group[-1]:
+            return _INVALID_CHECKSUM, None
+        separator = _STANDARD_SEPARATOR
+    else:
+        if len(group) < 3 or group[-2] != _HISTORIC_SEPARATOR_BYTE:
+            return _MALFORMED, None
+        if (sum(group[:-2]) & 0x3F) + 0x20 != group[-1]:
+            return _INVALID_CHECKSUM, None
+        separator = _HISTORIC_SEPARATOR
+    try:
+        fields = group[:-2].decode("ascii").split(separator)
+    except UnicodeDecodeError:
+        return _NON_ASCII, None
+    if len(fields) == 2:
+        return _VALID, _new_group(Group, (fields[0], fields[1], None))
+    if std_mode and len(fields) == 3:
+        return _VALID, _new_group(Group, (fields[0], fields[2], fields[1]))
+    return _INVALID_FIELDS, None
+
+
+def parse_group(group: bytes | bytearray | memoryview, std_mode: bool) -> Group:
+    """Validate and decode a single group, given without its LF/CR delimiters.
+
+    Raises InvalidChecksum if the checksum does not match and InvalidGroup if the group is malformed.
+    """
+    status, decoded = decode_group(group, std_mode)
+    if decoded is not None:
+        return decoded
+    raise group_error(group, std_mode, status)
+
+
+def group_error(
+    group: bytes | bytearray | memoryview, std_mode: bool, status: GroupStatus
+) -> InvalidGroup:
+    """Build the detailed error of a group that decode_group() did not validate."""
+    view = memoryview(group)
+    separator = (
+        MODE_STANDARD_FIELD_SEPARATOR if std_mode else MODE_HISTORIC_FIELD_SEPARATOR
+    )
+    if status == GroupStatus.MALFORMED:
+        return InvalidGroup(f"malformed group: {bytes(view)!r}")
+    if status == GroupStatus.NON_ASCII:
+        return InvalidGroup(f"non ascii group: {bytes(view)!r}")
+    if status == GroupStatus.INVALID_VALUE:
+        return InvalidGroup(f"value not matching its tag type: {bytes(view)!r}")
+    if status == GroupStatus.INVALID_TIMESTAMP:
+        return InvalidGroup(f"invalid timestamp: {bytes(view)!r}")
+    raw_fields = bytes(view[:-2]).split(separator)
+    if status == GroupStatus.INVALID_FIELDS:
+        return InvalidGroup(
+            f"{len(raw_fields)} fields detected in {'standard' if std_mode else 'historic'} mode: {bytes(view)!r}"
+        )
+    sum1 = sum(view[:-1] if std_mode else view[:-2])
+    return InvalidChecksum(
+        raw_fields[0],
+        raw_fields[1] if std_mode and len(raw_fields) == 3 else None,
+        raw_fields[-1],
+        sum1,
+        sum1 & 0x3F,
+        (sum1 & 0x3F) + 0x20,
+        bytes(view[-1:]),
+    )
+
+
+def split_groups(buffer: bytes | bytearray | memoryview) -> list[memoryview]:
+    """Split a buffer into the payloads of its complete groups, as views on the buffer (no copy)."""
+    view = memoryview(buffer)
+    return [
+        view[match.start(1) : match.end(1)] for match in _GROUP_PATTERN.finditer(view)
+    ]
+
+
+def parse_frame(buffer: bytes | bytearray | memoryview, std_mode: bool) -> list[Group]:
+    """Parse every complete group of a buffer (a frame or any captured stream). Invalid groups are skipped."""
+    groups = []
+    for payload in split_groups(buffer):
+        _, group = decode_group(payload, std_mode)
+        if group is not None:
+            groups.append(group)
+    return groups
+
+
+class FrameDecoder:
+    """Incremental decoder of a raw TIC stream, synchronized on the frame (STX/ETX) and group (LF/CR) markers.
+
+    Bytes can be fed in chunks of any size. Each group read from its LF to its CR is given to on_group (without its
+    delimiters, not validated) and each frame end to on_frame_end, with a flag telling if the frame is complete:
+    read from its STX to its ETX without losing a group on the way. Any marker out of place drops the group being
+    read, so that two groups are never smeared together: decoding resumes with the next group.
+    """
+
+    __slots__ = (
+        "_on_group",
+        "_on_frame_end",
+        "_group",
+        "_in_frame",
+        "_truncated",
+        "_end_due",
+        "groups_lost",
+        "frames_truncated",
+    )
+
+    def __init__(
+        self,
+        on_group: Callable[[bytes], None],
+        on_frame_end: Callable[[bool], None],
+    ) -> None:
+        """Init a decoder waiting for the start of a group or frame."""
+        self._on_group = on_group
+        self._on_frame_end = on_frame_end
+        self._group: bytes | None = None  # group being read, None between groups
+        self._in_frame = False  # STX read, ETX not yet
+        self._truncated = False  # part of the frame being read was lost
+        self._end_due = (
+            False  # a frame or groups have been read since the last frame end
+        )
+        # Statistics
+        self.groups_lost = 0
+        self.frames_truncated = 0
+
+    def reset(self) -> None:
+        """Forget the group and frame being read: wait for the start of the next ones."""
+        self._group = None
+        self._in_frame = False
+        self._truncated = False
+        self._end_due = False
+
+    def feed(self, data: bytes) -> None:
+        """Decode the next bytes of the stream."""
+        pos = 0
+        for match in _MARKERS_PATTERN.finditer(data):
+            marker_pos = match.start()
+            if marker_pos > pos:
+                self._add_data(data[pos:marker_pos])
+            pos = marker_pos + 1
+            marker = data[marker_pos]
+            if marker == GROUP_STOP:
+                if self._group is not None:
+                    self._on_group(self._group)
+                    self._group = None
+                elif self._in_frame:
+                    self._truncated = True
+            elif marker == GROUP_START:
+                self._drop_group()
+                self._group = b""
+                self._end_due = True
+            elif marker == FRAME_STOP:
+                self._drop_group()
+                if self._end_due:
+                    self._end_frame(self._in_frame and not self._truncated)
+                self._in_frame = False
+            elif marker == FRAME_START:
+                self._drop_group()
+                if self._end_due:
+                    # ETX lost
+                    self._end_frame(False)
+                self._in_frame = True
+                self._end_due = True
+            else:  # FRAME_INTERRUPT
+                self._drop_group()
+                if self._end_due:
+                    self._end_frame(False)
+                self._in_frame = False
+        if pos < len(data):
+            self._add_data(data[pos:])
+
+    def _add_data(self, data: bytes) -> None:
+        """Add data to the group being read. Data out of a group means that a group start was lost."""
+        if self._group is None:
+            if self._in_frame:
+                self._truncated = True
+            return
+        self._group += data
+        if len(self._group) > GROUP_MAX_SIZE:
+            self._drop_group()
+
+    def _drop_group(self) -> None:
+        """Drop the group being read, if any: its end was lost."""
+        if self._group is not None:
+            self._group = None
+            self.groups_lost += 1
+            if self._in_frame:
+                self._truncated = True
+
+    def _end_frame(self, complete: bool) -> None:
+        """Signal the end of the frame being read."""
+        if not complete:
+            self.frames_truncated += 1
+        self._on_frame_end(complete)
+        self._truncated = False
+        self._end_due = False
+
+
+def convert_value(tag: str, value: str) -> int | str:
+    """Convert a raw value to the type given by the tags catalog (unknown tags are strings).
+
+    Raises ValueError if the value does not fit its type.
+    """
+    spec = TAG_CATALOG.get(tag)
+    if spec is None or spec.value_type is str:
+        return " ".join(value.split())
+    return int(value) * spec.scale
+
+
+@lru_cache(maxsize=64)
+def parse_timestamp(timestamp: str) -> datetime:
+    """Parse a group timestamp (SAAMMJJhhmmss, S being the season flag) into a timezone aware datetime.
+
+    Results are cached per distinct timestamp: most timestamped groups repeat the same one frame after frame.
+    Raises ValueError if the timestamp is malformed.
+    """
+    if len(timestamp) != 13 or not timestamp[1:].isdigit():
+        raise ValueError(f"invalid timestamp: {timestamp!r}")
+    return datetime.strptime(timestamp[1:], "%y%m%d%H%M%S").replace(
+        tzinfo=_SEASON_TIMEZONES.get(timestamp[0].upper(), _LEGAL_TIMEZONE)
+    )
+
+
+class InvalidGroup(Exception):
+    """Exception for a Linky TIC group that can not be decoded."""
+
+
+class InvalidChecksum(InvalidGroup):
+    """Exception for Linky TIC checksum validation error. Its message is only formatted when printed."""
+
+    def __init__(
+        self,
+        tag: bytes,
+        timestamp: bytes | None,
+        value: bytes,
+        s1: int,
+        s1_truncated: int,
+        computed: int,
+        expected: bytes,
+    ) -> None:
+        """Initialize the checksum exception."""
+        try:
+            self.tag = tag.decode("ascii")
+        except UnicodeDecodeError:
+            self.tag = "<invalid ascii sequence>"
+        try:
+            self.timestamp = timestamp.decode("ascii") if timestamp else None
+        except UnicodeDecodeError:
+            self.timestamp = "<invalid ascii sequence>"
+        try:
+            self.value = value.decode("ascii")
+        except UnicodeDecodeError:
+            self.value = "<invalid ascii sequence>"
+        self.sum1 = s1
+        self.s1_truncated = s1_truncated
+        self.computed = computed
+        self.expected = expected
+        super().__init__()
+
+    def __str__(self) -> str:
+        """Format the exception message."""
+        return self.msg()
+
+    def msg(self):
+        """Printable exception method."""
+        return "{} -> {} ({}) | s1 {} {} | truncated {} {} {} | computed {} {} {} | expected {} {} {}".format(
+            self.tag,
+            self.value,
+            self.timestamp,
+            self.sum1,
+            bin(self.sum1),
+            self.s1_truncated,
+            bin(self.s1_truncated),
+            chr(self.s1_truncated),
+            self.computed,
+            bin(self.computed),
+            chr(self.computed),
+            int.from_bytes(self.expected, byteorder="big"),
+            bin(int.from_bytes(self.expected, byteorder="big")),
+            chr(ord(self.expected)),
+        )
@@ -0,0 +1,157 @@
+"""Linky TIC protocol: stream markers, field separators and tags catalog.
+
+This module has no dependency (neither Home Assistant nor pyserial): the parser builds on it alone.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+# https://www.enedis.fr/media/2035/download
+
+MODE_STANDARD_FIELD_SEPARATOR = b"\x09"
+MODE_HISTORIC_FIELD_SEPARATOR = b"\x20"
+
+LINE_END = b"\r\n"
+FRAME_END = b"\r\x03\x02\n"
+
+# Frames are enclosed between STX and ETX (EOT interrupting them), groups between LF and CR
+FRAME_START = 0x02
+FRAME_STOP = 0x03
+FRAME_INTERRUPT = 0x04
+GROUP_START = 0x0A
+GROUP_STOP = 0x0D
+
+# A valid group is at most a few dozen bytes, anything larger without a group end is garbage
+GROUP_MAX_SIZE = 256
+
+
+class TagSpec(NamedTuple):
+    """Decoding of a tag value.
+
+    value_type is the type the raw value is converted to: strings get their spaces normalized, integers are multiplied by scale.
+    unit is the unit of the converted value and phase the phase it relates to (three-phase meters).
+    """
+
+    value_type: type = str
+    scale: int = 1
+    unit: str | None = None
+    phase: int | None = None
+
+
+# Catalog of the known tags, in the order of their fixed slot in the tags values store (unknown tags are stored aside)
+TAG_CATALOG: dict[str, TagSpec] = {
+    # Historic mode
+    "ADCO": TagSpec(),
+    "OPTARIF": TagSpec(),
+    "ISOUSC": TagSpec(int, unit="A"),
+    "BASE": TagSpec(int, unit="Wh"),
+    "HCHC": TagSpec(int, unit="Wh"),
+    "HCHP": TagSpec(int, unit="Wh"),
+    "EJPHN": TagSpec(int, unit="Wh"),
+    "EJPHPM": TagSpec(int, unit="Wh"),
+    "BBRHCJB": TagSpec(int, unit="Wh"),
+    "BBRHPJB": TagSpec(int, unit="Wh"),
+    "BBRHCJW": TagSpec(int, unit="Wh"),
+    "BBRHPJW": TagSpec(int, unit="Wh"),
+    "BBRHCJR": TagSpec(int, unit="Wh"),
+    "BBRHPJR": TagSpec(int, unit="Wh"),
+    "PEJP": TagSpec(),
+    "PTEC": TagSpec(),
+    "DEMAIN": TagSpec(),
+    "IINST": TagSpec(int, unit="A"),
+    "IINST1": TagSpec(int, unit="A", phase=1),
+    "IINST2": TagSpec(int, unit="A", phase=2),
+    "IINST3": TagSpec(int, unit="A", phase=3),
+    "ADPS": TagSpec(int, unit="A"),
+    "ADIR1": TagSpec(int, unit="A", phase=1),
+    "ADIR2": TagSpec(int, unit="A", phase=2),
+    "ADIR3": TagSpec(int, unit="A", phase=3),
+    "IMAX": TagSpec(int, unit="A"),
+    "IMAX1": TagSpec(int, unit="A", phase=1),
+    "IMAX2": TagSpec(int, unit="A", phase=2),
+    "IMAX3": TagSpec(int, unit="A", phase=3),
+    "PMAX": TagSpec(int, unit="W"),
+    "PAPP": TagSpec(int, unit="VA"),
+    "HHPHC": TagSpec(),
+    "MOTDETAT": TagSpec(),
+    "PPOT": TagSpec(),
+    # Standard mode
+    "ADSC": TagSpec(),
+    "VTIC": TagSpec(),
+    "DATE": TagSpec(),
+    "NGTF": TagSpec(),
+    "LTARF": TagSpec(),
+    "EAST": TagSpec(int, unit="Wh"),
+    "EASF01": TagSpec(int, unit="Wh"),
+    "EASF02": TagSpec(int, unit="Wh"),
+    "EASF03": TagSpec(int, unit="Wh"),
+    "EASF04": TagSpec(int, unit="Wh"),
+    "EASF05": TagSpec(int, unit="Wh"),
+    "EASF06": TagSpec(int, unit="Wh"),
+    "EASF07": TagSpec(int, unit="Wh"),
+    "EASF08": TagSpec(int, unit="Wh"),
+    "EASF09": TagSpec(int, unit="Wh"),
+    "EASF10": TagSpec(int, unit="Wh"),
+    "EASD01": TagSpec(int, unit="Wh"),
+    "EASD02": TagSpec(int, unit="Wh"),
+    "EASD03": TagSpec(int, unit="Wh"),
+    "EASD04": TagSpec(int, unit="Wh"),
+    "EAIT": TagSpec(int, unit="Wh"),
+    "ERQ1": TagSpec(int, unit="VArh"),
+    "ERQ2": TagSpec(int, unit="VArh"),
+    "ERQ3": TagSpec(int, unit="VArh"),
+    "ERQ4": TagSpec(int, unit="VArh"),
+    "IRMS1": TagSpec(int, unit="A", phase=1),
+    "IRMS2": TagSpec(int, unit="A", phase=2),
+    "IRMS3": TagSpec(int, unit="A", phase=3),
+    "URMS1": TagSpec(int, unit="V", phase=1),
+    "URMS2": TagSpec(int, unit="V", phase=2),
+    "URMS3": TagSpec(int, unit="V", phase=3),
+    "PREF": TagSpec(int, scale=1000, unit="VA"),
+    "PCOUP": TagSpec(int, scale=1000, unit="VA"),
+    "SINSTS": TagSpec(int, unit="VA"),
+    "SINSTS1": TagSpec(int, unit="VA", phase=1),
+    "SINSTS2": TagSpec(int, unit="VA", phase=2),
+    "SINSTS3": TagSpec(int, unit="VA", phase=3),
+    "SMAXSN": TagSpec(int, unit="VA"),
+    "SMAXSN1": TagSpec(int, unit="VA", phase=1),
+    "SMAXSN2": TagSpec(int, unit="VA", phase=2),
+    "SMAXSN3": TagSpec(int, unit="VA", phase=3),
+    "SMAXSN-1": TagSpec(int, unit="VA"),
+    "SMAXSN1-1": TagSpec(int, unit="VA", phase=1),
+    "SMAXSN2-1": TagSpec(int, unit="VA", phase=2),
+    "SMAXSN3-1": TagSpec(int, unit="VA", phase=3),
+    "SINSTI": TagSpec(int, unit="VA"),
+    "SMAXIN": TagSpec(int, unit="VA"),
+    "SMAXIN-1": TagSpec(int, unit="VA"),
+    "CCASN": TagSpec(int, unit="W"),
+    "CCASN-1": TagSpec(int, unit="W"),
+    "CCAIN": TagSpec(int, unit="W"),
+    "CCAIN-1": TagSpec(int, unit="W"),
+    "UMOY1": TagSpec(int, unit="V", phase=1),
+    "UMOY2": TagSpec(int, unit="V", phase=2),
+    "UMOY3": TagSpec(int, unit="V", phase=3),
+    "STGE": TagSpec(),
+    "DPM1": TagSpec(),
+    "FPM1": TagSpec(),
+    "DPM2": TagSpec(),
+    "FPM2": TagSpec(),
+    "DPM3": TagSpec(),
+    "FPM3": TagSpec(),
+    "MSG1": TagSpec(),
+    "MSG2": TagSpec(),
+    "PRM": TagSpec(),
+    "RELAIS": TagSpec(),
+    "NTARF": TagSpec(),
+    "NJOURF": TagSpec(),
+    "NJOURF+1": TagSpec(),
+    "PJOURF+1": TagSpec(),
+    "PPOINTE": TagSpec(),
+    # Standard mode, pilot meters (see EXPERIMENTAL_DEVICES)
+    "SINST1": TagSpec(int, unit="VA"),
+    "SMAXN": TagSpec(int, unit="VA"),
+    "SMAXN-1": TagSpec(int, unit="VA"),
+}
+TAGS = tuple(TAG_CATALOG)
+TAG_SLOTS = {tag: slot for slot, tag in enumerate(TAGS)}
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
-from typing import Generic, Iterable, Optional, TypeVar, cast
+import time
+from datetime import datetime
+from typing import Any, Generic, Optional, TypeVar, cast
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import RestoreSensor
 from homeassistant.components.sensor.const import SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    STATE_UNAVAILABLE,
     EntityCategory,
     UnitOfApparentPower,
     UnitOfElectricCurrent,
@@ -17,11 +19,13 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfPower,
 )
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import Entity
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
 from .const import (
+    DEADBAND_DEFAULTS,
+    DEADBAND_MAX_SILENCE,
     DID_CONSTRUCTOR,
     DID_CONSTRUCTOR_CODE,
     DID_REGNUMBER,
@@ -30,12 +34,9 @@ from .const import (
     DID_YEAR,
     DOMAIN,
     EXPERIMENTAL_DEVICES,
-    SETUP_PRODUCER,
-    SETUP_THREEPHASE,
-    SETUP_TICMODE,
-    TICMODE_STANDARD,
 )
-from .entity import LinkyTICEntity
+from .coordinator import LinkyTICCoordinator
+from .entity import LinkyTICEntity, async_setup_entities
 from .serial_reader import LinkyTICReader
 from .status_register import StatusRegister
 
@@ -52,22 +53,33 @@ async def async_setup_entry(
     _LOGGER.debug("%s: setting up sensor plateform", config_entry.title)
     # Retrieve the serial reader object
     try:
-        serial_reader: LinkyTICReader = hass.data[DOMAIN][config_entry.entry_id]
+        coordinator: LinkyTICCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     except KeyError:
         _LOGGER.error(
             "%s: can not init sensors: failed to get the serial reader object",
             config_entry.title,
         )
         return
+    await async_setup_entities(
+        coordinator,
+        config_entry,
+        lambda: build_sensors(config_entry, coordinator.reader),
+        async_add_entities,
+    )
+
 
+def build_sensors(
+    config_entry: ConfigEntry, serial_reader: LinkyTICReader
+) -> list[LinkyTICEntity]:
+    """Build the sensors of the TIC mode read, with the reader configuration (see LinkyTICReader.reconfigure)."""
     # Flag for experimental counters which have slightly different tags.
     is_pilot: bool = (
         serial_reader.device_identification[DID_TYPE_CODE] in EXPERIMENTAL_DEVICES
     )
 
     # Init sensors
-    sensors: Iterable[Entity]
-    if config_entry.data.get(SETUP_TICMODE) == TICMODE_STANDARD:
+    sensors: list[LinkyTICEntity]
+    if serial_reader.std_mode:
         # standard mode
         sensors = [
             ADSSensor(
@@ -210,7 +222,7 @@ async def async_setup_entry(
                 config_uniq_id=config_entry.entry_id,
                 serial_reader=serial_reader,
                 state_class=SensorStateClass.MEASUREMENT,
-                register_callback=True,
+                real_time=True,
             ),
             VoltageSensor(
                 tag="URMS1",
@@ -219,7 +231,7 @@ async def async_setup_entry(
                 config_uniq_id=config_entry.entry_id,
                 serial_reader=serial_reader,
                 state_class=SensorStateClass.MEASUREMENT,
-                register_callback=True,
+                real_time=True,
             ),
             ApparentPowerSensor(
                 tag="PREF",
@@ -227,9 +239,8 @@ async def async_setup_entry(
                 config_title=config_entry.title,
                 config_uniq_id=config_entry.entry_id,
                 serial_reader=serial_reader,
-                register_callback=True,
+                real_time=True,
                 category=EntityCategory.DIAGNOSTIC,
-                conversion_function=(lambda x: x * 1000),  # kVA conversion
             ),
             ApparentPowerSensor(
                 tag="PCOUP",
@@ -237,9 +248,8 @@ async def async_setup_entry(
                 config_title=config_entry.title,
                 config_uniq_id=config_entry.entry_id,
                 serial_reader=serial_reader,
-                register_callback=True,
+                real_time=True,
                 category=EntityCategory.DIAGNOSTIC,
-                conversion_function=(lambda x: x * 1000),  # kVA conversion
             ),
             ApparentPowerSensor(
                 tag="SINST1" if is_pilot else "SINSTS",
@@ -248,7 +258,7 @@ async def async_setup_entry(
                 config_uniq_id=config_entry.entry_id,
                 serial_reader=serial_reader,
                 state_class=SensorStateClass.MEASUREMENT,
-                register_callback=True,
+                real_time=True,
             ),
             ApparentPowerSensor(
                 tag="SMAXN" if is_pilot else "SMAXSN",
@@ -256,7 +266,7 @@ async def async_setup_entry(
                 config_title=config_entry.title,
                 config_uniq_id=config_entry.entry_id,
                 serial_reader=serial_reader,
-                register_callback=True,
+                real_time=True,
             ),
             ApparentPowerSensor(
                 tag="SMAXN-1" if is_pilot else "SMAXSN-1",
@@ -264,7 +274,7 @@ async def async_setup_entry(
                 config_title=config_entry.title,
                 config_uniq_id=config_entry.entry_id,
                 serial_reader=serial_reader,
-                register_callback=True,
+                real_time=True,
             ),
             PowerSensor(
                 tag="CCASN",
@@ -287,7 +297,7 @@ async def async_setup_entry(
                 config_uniq_id=config_entry.entry_id,
                 serial_reader=serial_reader,
                 state_class=SensorStateClass.MEASUREMENT,  # Should this be considered an instantaneous value?
-                register_callback=True,
+                real_time=True,
             ),
             LinkyTICStringSensor(
                 tag="DPM1",
@@ -488,7 +498,7 @@ async def async_setup_entry(
             ),
         ]
         # Add producer specific sensors
-        if bool(config_entry.data.get(SETUP_PRODUCER)):
+        if serial_reader.producer_mode:
             sensors.append(
                 EnergyIndexSensor(
                     tag="EAIT",
@@ -547,7 +557,7 @@ async def async_setup_entry(
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
                     state_class=SensorStateClass.MEASUREMENT,
-                    register_callback=True,
+                    real_time=True,
                     icon="mdi:transmission-tower-import",
                 )
             )
@@ -558,7 +568,7 @@ async def async_setup_entry(
                     config_title=config_entry.title,
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
-                    register_callback=True,
+                    real_time=True,
                     icon="mdi:transmission-tower-import",
                 )
             )
@@ -569,7 +579,7 @@ async def async_setup_entry(
                     config_title=config_entry.title,
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
-                    register_callback=True,
+                    real_time=True,
                     icon="mdi:transmission-tower-import",
                 )
             )
@@ -594,7 +604,7 @@ async def async_setup_entry(
                 )
             )
         # Add three-phase specific sensors
-        if bool(config_entry.data.get(SETUP_THREEPHASE)):
+        if serial_reader.three_phase:
             sensors.append(
                 CurrentSensor(
                     tag="IRMS2",
@@ -603,7 +613,7 @@ async def async_setup_entry(
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
                     state_class=SensorStateClass.MEASUREMENT,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -614,7 +624,7 @@ async def async_setup_entry(
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
                     state_class=SensorStateClass.MEASUREMENT,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -625,7 +635,7 @@ async def async_setup_entry(
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
                     state_class=SensorStateClass.MEASUREMENT,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -636,7 +646,7 @@ async def async_setup_entry(
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
                     state_class=SensorStateClass.MEASUREMENT,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -647,7 +657,7 @@ async def async_setup_entry(
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
                     state_class=SensorStateClass.MEASUREMENT,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -658,7 +668,7 @@ async def async_setup_entry(
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
                     state_class=SensorStateClass.MEASUREMENT,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -669,7 +679,7 @@ async def async_setup_entry(
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
                     state_class=SensorStateClass.MEASUREMENT,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -679,7 +689,7 @@ async def async_setup_entry(
                     config_title=config_entry.title,
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -689,7 +699,7 @@ async def async_setup_entry(
                     config_title=config_entry.title,
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -699,7 +709,7 @@ async def async_setup_entry(
                     config_title=config_entry.title,
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -709,7 +719,7 @@ async def async_setup_entry(
                     config_title=config_entry.title,
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -719,7 +729,7 @@ async def async_setup_entry(
                     config_title=config_entry.title,
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -729,7 +739,7 @@ async def async_setup_entry(
                     config_title=config_entry.title,
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -740,7 +750,7 @@ async def async_setup_entry(
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
                     state_class=SensorStateClass.MEASUREMENT,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -751,7 +761,7 @@ async def async_setup_entry(
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
                     state_class=SensorStateClass.MEASUREMENT,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
 
@@ -886,7 +896,7 @@ async def async_setup_entry(
                 config_uniq_id=config_entry.entry_id,
                 serial_reader=serial_reader,
                 state_class=SensorStateClass.MEASUREMENT,
-                register_callback=True,
+                real_time=True,
             ),
             LinkyTICStringSensor(
                 tag="HHPHC",
@@ -909,7 +919,7 @@ async def async_setup_entry(
             ),
         ]
         # Add specific sensors
-        if bool(config_entry.data.get(SETUP_THREEPHASE)):
+        if serial_reader.three_phase:
             # three-phase - concat specific sensors
             sensors.append(
                 CurrentSensor(
@@ -919,7 +929,7 @@ async def async_setup_entry(
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
                     state_class=SensorStateClass.MEASUREMENT,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -930,7 +940,7 @@ async def async_setup_entry(
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
                     state_class=SensorStateClass.MEASUREMENT,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -941,7 +951,7 @@ async def async_setup_entry(
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
                     state_class=SensorStateClass.MEASUREMENT,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -998,7 +1008,7 @@ async def async_setup_entry(
                     config_title=config_entry.title,
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -1008,7 +1018,7 @@ async def async_setup_entry(
                     config_title=config_entry.title,
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -1018,7 +1028,7 @@ async def async_setup_entry(
                     config_title=config_entry.title,
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             _LOGGER.info(
@@ -1034,7 +1044,7 @@ async def async_setup_entry(
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
                     state_class=SensorStateClass.MEASUREMENT,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -1045,7 +1055,7 @@ async def async_setup_entry(
                     config_uniq_id=config_entry.entry_id,
                     serial_reader=serial_reader,
                     state_class=SensorStateClass.MEASUREMENT,
-                    register_callback=True,
+                    real_time=True,
                 )
             )
             sensors.append(
@@ -1060,35 +1070,71 @@ async def async_setup_entry(
             _LOGGER.info(
                 "Adding %d sensors for the single phase historic mode", len(sensors)
             )
-    # Add the entities to HA
-    if len(sensors) > 0:
-        async_add_entities(sensors, True)
+    return sensors
 
 
 T = TypeVar("T")
 
 
-class LinkyTICSensor(LinkyTICEntity, SensorEntity, Generic[T]):
-    """Base class for all Linky TIC sensor entities."""
+class LinkyTICSensor(LinkyTICEntity, RestoreSensor, Generic[T]):
+    """Base class for all Linky TIC sensor entities.
+
+    The last value is restored on startup, marked as stale until the serial reader gives a live one.
+    """
 
-    _attr_should_poll = True
     _last_value: T | None
+    _tag: str
 
     def __init__(self, tag: str, config_title: str, reader: LinkyTICReader) -> None:
         """Init sensor entity."""
         super().__init__(reader)
         self._last_value = None
+        self._last_timestamp: datetime | None = None
+        self._version = 0  # version of the tag value last processed
+        self._live = False  # read the live values instead of the last complete frame
+        self._stale = False  # the value is the one restored, not read yet
         self._tag = tag
         self._config_title = config_title
 
+    async def async_added_to_hass(self) -> None:
+        """Register to the coordinator updates and restore the last value if none has been read yet."""
+        await super().async_added_to_hass()
+        if self._version:
+            return
+        last_state = await self.async_get_last_state()
+        last_sensor_data = await self.async_get_last_sensor_data()
+        if last_state is None or last_sensor_data is None:
+            return
+        if last_state.state == STATE_UNAVAILABLE:
+            self._attr_available = False
+        elif last_sensor_data.native_value is not None:
+            self._last_value = cast(T, last_sensor_data.native_value)
+            self._stale = True
+
     @property
     def native_value(self) -> T | None:  # type:ignore
         """Value of the sensor."""
         return self._last_value
 
-    def _update(self) -> tuple[Optional[str], Optional[str]]:
-        """Get value and/or timestamp from cached data. Responsible for updating sensor availability."""
-        value, timestamp = self._serial_controller.get_values(self._tag)
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Get HA sensor extra attributes: the timestamp of the value, for the groups carrying one, or the stale mark of a restored value."""
+        if self._stale:
+            return {"valeur restaurée": True}
+        if self._last_timestamp is None:
+            return None
+        return {"horodatage": self._last_timestamp}
+
+    def _update(self) -> tuple[Any, Optional[datetime]]:
+        """Get typed value (see TAG_CATALOG) and/or timestamp (aware datetime) from cached data. Responsible for updating sensor availability. Returns (None, None) if there is no data or if it has not changed since last call."""
+        # Entities updated in real time read the live values, others the last complete frame
+        value, timestamp, version = self._serial_controller.get_typed_values(
+            self._tag, live=self._live
+        )
+        if version and version == self._version:
+            # Nothing changed since last update
+            return None, None
+        self._version = version
         _LOGGER.debug(
             "%s: retrieved %s value from serial controller: (%s, %s)",
             self._config_title,
@@ -1097,7 +1143,7 @@ class LinkyTICSensor(LinkyTICEntity, SensorEntity, Generic[T]):
             timestamp,
         )
 
-        if not value and not timestamp:  # No data returned.
+        if value in (None, "") and not timestamp:  # No data returned.
             if not self.available:
                 # Sensor is already unavailable, no need to check why.
                 return None, None
@@ -1130,9 +1176,17 @@ class LinkyTICSensor(LinkyTICEntity, SensorEntity, Generic[T]):
                 self._config_title,
                 self._tag,
             )
+        # The live value supersedes the restored one
+        self._stale = False
 
         return value, timestamp
 
+    @callback
+    def async_handle_notification(self, forced_update: bool) -> None:
+        """Update the value from the serial reader memory cache and write the entity state."""
+        self.update()
+        super().async_handle_notification(forced_update)
+
 
 class ADSSensor(LinkyTICSensor[str]):
     """Adresse du compteur entity."""  # codespell:ignore
@@ -1219,15 +1273,22 @@ class LinkyTICStringSensor(LinkyTICSensor[str]):
     def update(self):
         """Update the value of the sensor from the thread object memory cache."""
         # Get last seen value from controller
-        value, _ = self._update()
+        value, timestamp = self._update()
         if not value:
             return
-        self._last_value = " ".join(value.split())
+        self._last_value = value
+        self._last_timestamp = timestamp
 
 
 class RegularIntSensor(LinkyTICSensor[int]):
     """Common class for int sensors."""
 
+    # Deadband of the measurement sensors: a new value is only published if it moves from the published one by at least
+    # the absolute deadband (sensor unit) or the relative one (% of the published value), whichever is larger.
+    # A value held back by the deadband is published anyway once nothing has been published for max silence seconds.
+    # Set per class in the options (see DEADBAND_DEFAULTS), None for no deadband.
+    _deadband_class: str | None = None
+
     def __init__(
         self,
         tag: str,
@@ -1240,18 +1301,13 @@ class RegularIntSensor(LinkyTICSensor[int]):
         device_class: SensorDeviceClass | None = None,
         native_unit_of_measurement: str | None = None,
         state_class: SensorStateClass | None = None,
-        register_callback: bool = False,
-        conversion_function: Callable[[int], int] | None = None,
+        real_time: bool = False,
     ) -> None:
         """Initialize a Regular Int Sensor."""
         _LOGGER.debug("%s: initializing %s sensor", config_title, tag.upper())
         super().__init__(tag, config_title, serial_reader)
         self._attr_name = name
-
-        if register_callback:
-            self._serial_controller.register_push_notif(
-                self._tag, self.update_notification
-            )
+        self._real_time = real_time  # can follow the live values
         # Generic Entity properties
         if category:
             self._attr_entity_category = category
@@ -1266,45 +1322,103 @@ class RegularIntSensor(LinkyTICSensor[int]):
         if state_class:
             self._attr_state_class = state_class
 
-        self._conversion_function = conversion_function
+        # Publishing
+        self._published_at = 0.0  # monotonic time of the last state written
+        # value and timestamp held back by the deadband
+        self._held: tuple[int, datetime | None] | None = None
+        self._cancel_heartbeat: CALLBACK_TYPE | None = None
 
     @callback
     def update(self):
         """Update the value of the sensor from the thread object memory cache."""
-        value, _ = self._update()
-        if not value:
+        value, timestamp = self._update()
+        if not isinstance(value, int):
             return
-        try:
-            value_int = int(value)
-        except ValueError:
-            return
-        self._last_value = (
-            self._conversion_function(value_int)
-            if self._conversion_function
-            else value_int
+        self._last_value = value
+        self._last_timestamp = timestamp
+
+    @callback
+    def async_handle_notification(self, forced_update: bool) -> None:
+        """Update the value from the serial reader memory cache and write the entity state."""
+        # Real time (user option or forced update of a short frame/ADPS tag): follow the live values
+        self._live = self._real_time and (
+            forced_update or self._serial_controller.real_time
         )
+        published = self._last_value
+        published_timestamp = self._last_timestamp
+        was_available = self.available
+        was_stale = self._stale
+        self.update()
+        if (
+            not forced_update
+            and not was_stale
+            and self.available == was_available
+            and self._within_deadband(published, self._last_value)
+        ):
+            self._async_hold(published, published_timestamp)
+            return
+        self._async_publish()
+
+    def _within_deadband(self, published: int | None, value: int | None) -> bool:
+        """Check if a new value is too close to the published one to be worth publishing."""
+        if (
+            published is None
+            or value is None
+            or self.state_class != SensorStateClass.MEASUREMENT
+        ):
+            return False
+        absolute, relative, _ = self._deadband()
+        return abs(value - published) < max(absolute, relative / 100 * abs(published))
+
+    def _deadband(self) -> tuple[float, float, float]:
+        """Get the deadband settings of the sensor class: absolute, relative (%) and max silence."""
+        if self._deadband_class is None:
+            return 0, 0, DEADBAND_MAX_SILENCE
+        default = DEADBAND_DEFAULTS[self._deadband_class]
+        if self._coordinator is None:
+            return default
+        return self._coordinator.deadbands.get(self._deadband_class, default)
 
-    def update_notification(self, realtime_option: bool) -> None:
-        """Receive a notification from the serial reader when our tag has been read on the wire."""
-        # Realtime off
-        if not realtime_option:
-            _LOGGER.debug(
-                "received a push notification for new %s data but user has not activated real time: skipping",
-                self._tag,
+    @callback
+    def _async_hold(
+        self, published: int | None, published_timestamp: datetime | None
+    ) -> None:
+        """Hold back the new value: keep the published one until the max silence elapses."""
+        if self._last_value is not None:
+            self._held = (self._last_value, self._last_timestamp)
+        self._last_value = published
+        self._last_timestamp = published_timestamp
+        if self._cancel_heartbeat is None:
+            self._cancel_heartbeat = async_call_later(
+                self.hass,
+                max(0.0, self._published_at + self._deadband()[2] - time.monotonic()),
+                self._async_heartbeat,
             )
-            if not self._attr_should_poll:
-                self._attr_should_poll = (
-                    True  # realtime option disable, HA should poll us
-                )
-            return
-        # Realtime on
-        _LOGGER.debug(
-            "received a push notification for new %s data and user has activated real time: scheduling ha update",
-            self._tag,
-        )
-        if self._attr_should_poll:
-            self._attr_should_poll = False  # now that user has activated realtime, we will push data, no need for HA to poll us
-        self.schedule_update_ha_state(force_refresh=True)
+
+    @callback
+    def _async_heartbeat(self, _now: datetime) -> None:
+        """Publish the value held back by the deadband."""
+        self._cancel_heartbeat = None
+        if self._held is not None:
+            self._last_value, self._last_timestamp = self._held
+        self._async_publish()
+
+    @callback
+    def _async_publish(self) -> None:
+        """Write the entity state."""
+        self._held = None
+        if self._cancel_heartbeat is not None:
+            self._cancel_heartbeat()
+            self._cancel_heartbeat = None
+        self._published_at = time.monotonic()
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the pending heartbeat."""
+        await super().async_will_remove_from_hass()
+        if self._cancel_heartbeat is not None:
+            self._cancel_heartbeat()
+            self._cancel_heartbeat = None
 
 
 class EnergyIndexSensor(RegularIntSensor):
@@ -1320,6 +1434,7 @@ class VoltageSensor(RegularIntSensor):
 
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
+    _deadband_class = "voltage"
 
 
 class CurrentSensor(RegularIntSensor):
@@ -1327,6 +1442,7 @@ class CurrentSensor(RegularIntSensor):
 
     _attr_device_class = SensorDeviceClass.CURRENT
     _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
+    _deadband_class = "current"
 
 
 class PowerSensor(RegularIntSensor):
@@ -1334,6 +1450,7 @@ class PowerSensor(RegularIntSensor):
 
     _attr_device_class = SensorDeviceClass.POWER
     _attr_native_unit_of_measurement = UnitOfPower.WATT
+    _deadband_class = "power"
 
 
 class ApparentPowerSensor(RegularIntSensor):
@@ -1341,6 +1458,7 @@ class ApparentPowerSensor(RegularIntSensor):
 
     _attr_device_class = SensorDeviceClass.APPARENT_POWER
     _attr_native_unit_of_measurement = UnitOfApparentPower.VOLT_AMPERE
+    _deadband_class = "apparent_power"
 
 
 class PEJPSensor(LinkyTICStringSensor):
@@ -1368,9 +1486,10 @@ class PEJPSensor(LinkyTICStringSensor):
         self._attr_unique_id = f"{DOMAIN}_{config_uniq_id}_{self._tag.lower()}"
 
 
-class DateEtHeureSensor(LinkyTICStringSensor):
+class DateEtHeureSensor(LinkyTICSensor[datetime]):
     """Date et heure courante sensor."""
 
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_icon = "mdi:clock-outline"
 
     def __init__(
@@ -1381,43 +1500,18 @@ class DateEtHeureSensor(LinkyTICStringSensor):
     ) -> None:
         """Initialize a Date et heure sensor."""
         _LOGGER.debug("%s: initializing Date et heure courante sensor", config_title)
-        super().__init__(
-            tag="DATE",
-            name="Date et heure courante",
-            config_title=config_title,
-            config_uniq_id=config_uniq_id,
-            serial_reader=serial_reader,
-        )
+        super().__init__("DATE", config_title, serial_reader)
+        self._attr_name = "Date et heure courante"
+        self._attr_unique_id = f"{DOMAIN}_{config_uniq_id}_date"
 
     @callback
     def update(self):
         """Update the value of the sensor from the thread object memory cache."""
-        # Get last seen value from controller
+        # Get last seen value from controller: the meter clock is the group timestamp
         _, timestamp = self._update()
-
-        if not timestamp:
-            return
-        # Save value
-        saison = ""
-        try:
-            if timestamp[0:1] == "E":
-                saison = " (Eté)"
-            elif timestamp[0:1] == "H":
-                saison = " (Hiver)"
-            self._last_value = (
-                timestamp[5:7]
-                + "/"
-                + timestamp[3:5]
-                + "/"
-                + timestamp[1:3]
-                + " "
-                + timestamp[7:9]
-                + ":"
-                + timestamp[9:11]
-                + saison
-            )
-        except IndexError:
+        if timestamp is None:
             return
+        self._last_value = timestamp
 
 
 class ProfilDuProchainJourCalendrierFournisseurSensor(LinkyTICStringSensor):
@@ -1456,7 +1550,6 @@ class LinkyTICStatusRegisterSensor(LinkyTICStringSensor):
     """Data from status register."""
 
     _attr_has_entity_name = True
-    _attr_should_poll = True
     _attr_device_class = SensorDeviceClass.ENUM
 
     def __init__(
@@ -1496,7 +1589,7 @@ class LinkyTICStatusRegisterSensor(LinkyTICStringSensor):
         if not value:
             return
 
-        try:
-            self._last_value = cast(str, self._field.value.get_status(value))
-        except IndexError:
-            pass  # Failsafe, value is unchanged.
+        decoded = self._serial_controller.get_decoded_status(self._live)
+        if decoded is None or self._field not in decoded.fields:
+            return  # Failsafe, value is unchanged.
+        self._last_value = cast(str, decoded.fields[self._field])
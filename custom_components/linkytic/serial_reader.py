@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import random
 import threading
 import time
 from collections.abc import Callable
+from datetime import datetime
+from typing import Any, cast
 
 import serial
 import serial.serialutil
@@ -21,18 +26,39 @@ from .const import (
     DID_TYPE,
     DID_TYPE_CODE,
     DID_YEAR,
-    FRAME_END,
-    LINE_END,
+    HOLDOVER_DEFAULT,
+    INVALID_GROUPS_LOG_INTERVAL,
+    LANES_DEFAULT_INTERVALS,
+    LANES_TAGS,
     LINKY_IO_ERRORS,
     MODE_HISTORIC_BAUD_RATE,
-    MODE_HISTORIC_FIELD_SEPARATOR,
+    MODE_HISTORIC_FRAME_SIZE,
     MODE_STANDARD_BAUD_RATE,
-    MODE_STANDARD_FIELD_SEPARATOR,
+    MODE_STANDARD_FRAME_SIZE,
+    OPTIONS_LANE_CHANGE,
     PARITY,
+    POLLING_INTERVAL,
+    READER_STOP_TIMEOUT,
+    RECONNECT_DELAY_MAX,
+    RECONNECT_DELAY_MIN,
+    RECONNECT_FAILURE_ATTEMPTS,
     SHORT_FRAME_DETECTION_TAGS,
     SHORT_FRAME_FORCED_UPDATE_TAGS,
+    STALL_FRAME_PERIODS,
     STOPBITS,
 )
+from .device_watcher import DeviceWatcher
+from .parser import (
+    FrameDecoder,
+    Group,
+    GroupStatus,
+    convert_value,
+    decode_group,
+    group_error,
+    parse_timestamp,
+)
+from .status_register import DecodedStatus, decode_status_register, status_changes
+from .tag_store import TagStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,50 +74,157 @@ class LinkyTICReader(threading.Thread):
         producer_mode,
         three_phase,
         real_time: bool | None = False,
+        buffered: bool = True,
+        coalesce_notifications: bool = True,
+        lane_intervals: dict[str, float] | None = None,
+        holdover: float | None = HOLDOVER_DEFAULT,
+        serial_number: str | None = None,
     ) -> None:
-        """Init the LinkyTIC thread serial reader."""  # Thread
+        """Init the LinkyTIC thread serial reader.
+
+        The serial number saved from a previous run, if any, gives the device identification until it is read again.
+        """  # Thread
         self._setup_error: BaseException | None = None
         self._stopsignal = False
+        # Wakes the reader thread up when stopping (see signalstop)
+        self._stop_event = threading.Event()
         self._title = title
         # Options
         if real_time is None:
             real_time = False
         self._realtime = real_time
+        self._set_lane_intervals(lane_intervals)
+        self._holdover = HOLDOVER_DEFAULT if holdover is None else holdover
         # Build
         self._port = port
-        self._baudrate = (
-            MODE_STANDARD_BAUD_RATE if std_mode else MODE_HISTORIC_BAUD_RATE
-        )
-        self._std_mode = std_mode
+        self._set_mode(std_mode)
+        self._producer_setting = bool(producer_mode)
         self._producer_mode = producer_mode if std_mode else False
         self._three_phase = three_phase
+        # TIC mode change (see reconfigure): mode requested, handed over at the next frame boundary (or within a frame
+        # period), and previous mode until the new one is validated by a complete frame
+        self._requested_std_mode: bool | None = None
+        self._requested_at = 0.0
+        self._fallback_std_mode: bool | None = None
+        self._reconfigure_callbacks: list[Callable[[], None]] = []
+        self._buffered = buffered
+        self._coalesce_notifications = coalesce_notifications
         # Run
         self._reader: serial.Serial | None = None
-        self._values: dict[str, dict[str, str | None]] = {}
-        self._first_line = True
-        self._frames_read = -1  # we consider that the first frame will be incomplete
+        self._decoder = FrameDecoder(self._process_group, self._process_frame_end)
+        # Event loop transport (see async_start)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_transport = False
+        self._fd: int | None = None
+        # Read timeout (seconds): reads block in the reader thread, they must not within the event loop
+        self._read_timeout = 1
+        self._reopen_task: asyncio.Task | None = None
+        # Monotonic time of the serial error whose hold-over window is running (see _connection_lost)
+        self._disconnected_at: float | None = None
+        # Failed reconnection attempts since the connection was lost, the ones since the backoff was last restarted
+        # (see _device_back), and watcher of the device path meanwhile
+        self._reconnect_attempts = 0
+        self._backoff_attempts = 0
+        self._watcher: DeviceWatcher | None = None
+        # Guards the watcher closing (reader thread) against its interruption (signalstop)
+        self._watcher_lock = threading.Lock()
+        # Stall watchdog (see _check_stall): monotonic times of the last valid group and frame end, stalls count
+        self._last_group_at = 0.0
+        self._last_frame_at = 0.0
+        self._stalled = False
+        self._stalls = 0
+        self._watchdog_handle: asyncio.TimerHandle | None = None
+        self._identified: asyncio.Future[str] | None = (
+            None  # see async_wait_serial_number
+        )
+        # Values are double buffered: the frame being read is built aside and published as a whole at its end. The
+        # previous snapshot is kept one more frame for the consumers still reading it, then recycled (no allocation).
+        self._values = TagStore()  # last complete frame
+        self._frame_values = TagStore()  # frame being read
+        self._retired_values = TagStore()  # previous complete frame
+        self._live_values = TagStore()  # last value of each tag, as soon as read
+        self._version = 0  # incremented each time a tag value changes, never reset
+        # STGE decoded once per value (STGE version, decoded STGE) and last STGE read to detect its changes
+        self._decoded_status: tuple[int, DecodedStatus | None] = (0, None)
+        self._last_status: DecodedStatus | None = None
+        # Complete frames (read from their STX to their ETX) since the connection opened
+        self._frames_read = 0
         self._within_short_frame = False
-        self._tags_seen: list[str] = []
-        self.device_identification: dict[str, str | None] = {
-            DID_CONSTRUCTOR: None,
-            DID_REGNUMBER: None,
-            DID_TYPE: None,
-            DID_YEAR: None,
-        }  # will be set by the ADCO/ADSC tag
-        self._notif_callbacks: dict[str, Callable[[bool], None]] = {}
+        # A group of the frame being read has been rejected
+        self._frame_truncated = False
+        self._tags_seen: set[str] = set()
+        self._known_serial_number = serial_number
+        # will be set by the ADCO/ADSC tag
+        self.device_identification = self._known_identification()
+        self._notif_callbacks: list[Callable[[dict[str, bool] | None], None]] = []
+        # tag -> forced update, None when every consumer must refresh (connection state change, first full frame)
+        self._pending_notifications: dict[str, bool] | None = {}
+        # Rate lanes: tag -> monotonic time of its last notification, and tags waiting for their lane interval
+        self._notified_at: dict[str, float] = {}
+        self._deferred_notifications: set[str] = set()
+        # Status register changes
+        self._status_callbacks: list[Callable[[dict[str, Any]], None]] = []
+        self._pending_status_changes: list[dict[str, Any]] = []
+        # Invalid groups dropped since the last report, by validation status, and monotonic time of that report
+        self._invalid_groups: dict[GroupStatus, int] = {}
+        self._invalid_groups_reported_at = 0.0
+        self._last_invalid_group = b""
         # Init parent thread class
         self._serial_number = None
         super().__init__(name=f"LinkyTIC for {title}")
 
-    def get_values(self, tag) -> tuple[str | None, str | None]:
-        """Get tag value and timestamp from the thread memory cache."""
-        if not self.is_connected:
-            return None, None
-        try:
-            payload = self._values[tag]
-            return payload["value"], payload["timestamp"]
-        except KeyError:
+    def get_values(self, tag, live: bool = False) -> tuple[str | None, str | None]:
+        """Get tag value and timestamp from the thread memory cache.
+
+        By default values come from the last complete frame, so that values read together are consistent (three-phase readings for example).
+        Real time consumers can ask for the live value instead, updated as soon as the tag is read.
+        """
+        if not self._values_valid:
             return None, None
+        return self._store(live).get(tag)
+
+    def get_versioned_values(
+        self, tag, live: bool = False
+    ) -> tuple[str | None, str | None, int]:
+        """Get tag value, timestamp and version from the thread memory cache.
+
+        The version of a tag only changes when its value or timestamp changes: consumers can skip any processing while it stays the same.
+        Version is 0 when there is no value.
+        """
+        if not self._values_valid:
+            return None, None, 0
+        return self._store(live).get_versioned(tag)
+
+    def get_decoded_status(self, live: bool = False) -> DecodedStatus | None:
+        """Get the status register (STGE) decoded, None if there is no valid value.
+
+        The register is decoded once per value and shared by every consumer.
+        """
+        value, _, version = self.get_versioned_values("STGE", live)
+        if not version:
+            return None
+        cached_version, decoded = self._decoded_status
+        if version != cached_version:
+            decoded = decode_status_register(cast(str, value))
+            self._decoded_status = (version, decoded)
+        return decoded
+
+    def get_typed_values(
+        self, tag, live: bool = False
+    ) -> tuple[Any, datetime | None, int]:
+        """Get tag typed value (see TAG_CATALOG), timestamp as an aware datetime and version from the thread memory cache.
+
+        Values and timestamps are converted once, when read from the serial line: (None, None, 0) when there is no value.
+        """
+        if not self._values_valid:
+            return None, None, 0
+        typed_value, timestamp, version = self._store(live).get_typed(tag)
+        # Validated when read, the parsed timestamp comes from the parser cache
+        return typed_value, parse_timestamp(timestamp) if timestamp else None, version
+
+    def _store(self, live: bool) -> TagStore:
+        """Get the values to read: the live ones if asked, or while no complete frame has been published yet."""
+        return self._live_values if live or not self._frames_read else self._values
 
     @property
     def has_read_full_frame(self) -> bool:
@@ -100,10 +233,30 @@ class LinkyTICReader(threading.Thread):
 
     @property
     def is_connected(self) -> bool:
-        """Use to know if the reader is actually connected to a serial connection."""
+        """Use to know if the reader is actually connected to a serial connection, and reads groups from it."""
         if self._reader is None:
             return False
-        return self._reader.is_open
+        return self._reader.is_open and not self._stalled
+
+    @property
+    def _values_valid(self) -> bool:
+        """Values read are valid while connected, and during the hold-over window of a serial error or a stall."""
+        return self.is_connected or self._disconnected_at is not None
+
+    @property
+    def stalled(self) -> bool:
+        """Use to know if the link is stalled: the serial connection is open but nothing valid is read (see _check_stall)."""
+        return self._stalled
+
+    @property
+    def stalls(self) -> int:
+        """Get the number of stalls detected since the reader started."""
+        return self._stalls
+
+    @property
+    def connection_failed(self) -> bool:
+        """Use to know if reconnecting to the serial connection keeps failing (see RECONNECT_FAILURE_ATTEMPTS)."""
+        return self._reconnect_attempts >= RECONNECT_FAILURE_ATTEMPTS
 
     @property
     def serial_number(self) -> str | None:
@@ -115,15 +268,190 @@ class LinkyTICReader(threading.Thread):
         """Returns serial port."""
         return self._port
 
+    @property
+    def std_mode(self) -> bool:
+        """Use to know if the TIC is read in standard mode (historic mode otherwise)."""
+        return self._std_mode
+
+    @property
+    def mode_validated(self) -> bool:
+        """Use to know if the TIC mode read is settled: no mode change waits for its handover or validation (see reconfigure)."""
+        return self._requested_std_mode is None and self._fallback_std_mode is None
+
+    @property
+    def producer_mode(self) -> bool:
+        """Use to know if the producer tags are read (standard mode only)."""
+        return self._producer_mode
+
+    @property
+    def three_phase(self) -> bool:
+        """Use to know if the meter is a three-phase one."""
+        return self._three_phase
+
+    @property
+    def real_time(self) -> bool:
+        """Use to know if the user has activated the real time option."""
+        return self._realtime
+
+    @property
+    def notifies_in_event_loop(self) -> bool:
+        """Use to know if push notification callbacks are called from within the event loop."""
+        return self._loop_transport or (
+            self._coalesce_notifications and self._loop is not None
+        )
+
     @property
     def setup_error(self) -> BaseException | None:
         """If the reader thread terminates due to a serial exception, this property will contain the raised exception."""
         return self._setup_error
 
+    async def async_start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Open the serial connection and read it from the event loop, without any thread.
+
+        Serial connections without a pollable file descriptor (rfc2217:// for example) fall back to the reader thread.
+        """
+        self._loop = loop
+        self._identified = loop.create_future()
+        self._read_timeout = 0
+        if not await loop.run_in_executor(None, self._open_serial):
+            # Serial error, see setup_error
+            return
+        if not self._add_loop_reader():
+            _LOGGER.info(
+                "%s: %s can not be watched by the event loop: starting a reader thread",
+                self._title,
+                self._port,
+            )
+            # Blocking reads in the thread
+            self._read_timeout = 1
+            await loop.run_in_executor(
+                None, setattr, self._reader, "timeout", self._read_timeout
+            )
+            self.start()
+            return
+        self._schedule_watchdog()
+
+    async def async_wait_serial_number(self) -> str:
+        """Wait for the meter serial number (ADSC or ADCO tag) to be read, once started by async_start.
+
+        Raises the setup error if the serial connection could not be opened.
+        """
+        if self._setup_error:
+            raise self._setup_error
+        if self._serial_number:
+            return self._serial_number
+        assert self._identified is not None
+        # Shielded: the future is shared by every waiter, a waiter timing out must not cancel it
+        return await asyncio.shield(self._identified)
+
+    @callback
+    def _set_identified(self) -> None:
+        """Resolve the serial number future, within the event loop."""
+        if self._identified is not None and not self._identified.done():
+            self._identified.set_result(cast(str, self._serial_number))
+
+    def _add_loop_reader(self) -> bool:
+        """Register the serial connection file descriptor within the event loop."""
+        assert self._loop is not None and self._reader is not None
+        try:
+            fd = self._reader.fileno()
+            self._loop.add_reader(fd, self._on_readable)
+        except (AttributeError, OSError, NotImplementedError):
+            # io.UnsupportedOperation is an OSError
+            return False
+        self._fd = fd
+        self._loop_transport = True
+        return True
+
+    def _on_readable(self) -> None:
+        """Read and parse the bytes available on the serial connection (event loop transport)."""
+        assert self._loop is not None and self._reader is not None
+        assert self._fd is not None
+        try:
+            data = self._read_chunk()
+        except LINKY_IO_ERRORS as exc:
+            _LOGGER.error(
+                "Error while reading serial device %s: %s. Reconnecting",
+                self._port,
+                exc,
+            )
+            self._drop_connection()
+            return
+        self._decoder.feed(data)
+
+    def _schedule_watchdog(self) -> None:
+        """Check the link for stalls once per frame period (event loop transport, see _watchdog)."""
+        assert self._loop is not None
+        self._watchdog_handle = self._loop.call_later(
+            self._frame_period, self._watchdog
+        )
+
+    def _watchdog(self) -> None:
+        """Check the link for stalls while connected, then schedule the next check (event loop transport)."""
+        if self._stopsignal:
+            return
+        if self._fd is not None:
+            self._check_stall()
+        self._schedule_watchdog()
+
+    async def _async_reopen(self) -> None:
+        """Reopen the serial connection and register it again within the event loop (event loop transport).
+
+        Attempts are spaced by the reconnection delay, or made as soon as the device path appears again.
+        """
+        assert self._loop is not None and self._reader is not None
+        appeared = asyncio.Event()
+        watcher = self._watcher
+        if watcher is not None:
+            watcher_fd = watcher.fileno()
+
+            def on_change() -> None:
+                if watcher.check():
+                    appeared.set()
+
+            self._loop.add_reader(watcher_fd, on_change)
+        try:
+            while not self._stopsignal:
+                try:
+                    await asyncio.wait_for(appeared.wait(), self._reconnect_delay())
+                except TimeoutError:
+                    pass
+                else:
+                    appeared.clear()
+                    self._device_back()
+                open_job = self._loop.run_in_executor(None, self._reader.open)
+                try:
+                    await asyncio.shield(open_job)
+                except LINKY_IO_ERRORS:
+                    self._reconnect_failed()
+                    continue
+                except asyncio.CancelledError:
+                    # Stopping while opening: the port must be closed once open, before the task ends (see async_stop)
+                    await asyncio.wait([open_job])
+                    self._reader.close()
+                    raise
+                if self._stopsignal:
+                    self._reader.close()
+                elif self._add_loop_reader():
+                    self._reconnected()
+                else:
+                    # Should not happen: this port was pollable before
+                    _LOGGER.error(
+                        "%s: %s can not be watched by the event loop anymore",
+                        self._title,
+                        self._port,
+                    )
+                    self._reader.close()
+                return
+        finally:
+            if watcher is not None:
+                self._loop.remove_reader(watcher_fd)
+                self._stop_watching()
+
     def run(self):
         """Continuously read the the serial connection and extract TIC values."""
 
-        if not self._open_serial():
+        if self._reader is None and not self._open_serial():
             # Serial error, do not start reader thread
             return
 
@@ -131,116 +459,467 @@ class LinkyTICReader(threading.Thread):
             # Reader should have been opened.
             assert self._reader is not None
             if not self._reader.is_open:
-                # NOTE: implement a maximum retry, and go in failure mode if the connection can't be renewed?
+                self._wait_before_reconnect()
+                if self._stopsignal:
+                    break
                 try:
                     self._reader.open()
                 except LINKY_IO_ERRORS:
-                    time.sleep(5)  # Cooldown to prevent spamming logs.
-                    _LOGGER.warning("Could not open port")
+                    self._reconnect_failed()
+                else:
+                    self._stop_watching()
+                    self._reconnected()
                 finally:
                     continue
             try:
-                line = self._reader.readline()
+                data = self._read_data()
             except LINKY_IO_ERRORS as exc:
                 _LOGGER.error(
-                    "Error while reading serial device %s: %s. Will retry in 5s",
+                    "Error while reading serial device %s: %s. Reconnecting",
                     self._port,
                     exc,
                 )
-                self._reset_state()
-                self._reader.close()
-                continue
-
-            # Parse the line if non empty (prevent errors from read timeout that returns empty byte string)
-            if not line:
+                self._drop_connection()
                 continue
-            tag = self._parse_line(line)
-            if tag is not None:
-                # Mark this tag as seen for end of frame cache cleanup
-                self._tags_seen.append(tag)
-                # Handle short burst for tri-phase historic mode
-                if (
-                    not self._std_mode
-                    and self._three_phase
-                    and not self._within_short_frame
-                    and tag in SHORT_FRAME_DETECTION_TAGS
-                ):
-                    _LOGGER.warning(
-                        "Short trame burst detected (%s): switching to forced update mode",
-                        tag,
-                    )
-                    self._within_short_frame = True
-                # If we have a notification callback for this tag, call it
-                try:
-                    notif_callback = self._notif_callbacks[tag]
-                    _LOGGER.debug(
-                        "We have a notification callback for %s: executing", tag
-                    )
-                    forced_update = self._realtime
-                    # Special case for forced_update: historic tree-phase short frame
-                    if (
-                        self._within_short_frame
-                        and tag in SHORT_FRAME_FORCED_UPDATE_TAGS
-                    ):
-                        forced_update = True
-                    # Special case for forced_update: historic single-phase ADPS
-                    if tag == "ADPS":
-                        forced_update = True
-                    notif_callback(forced_update)
-                except KeyError:
-                    pass
-            # Handle frame end
-            if FRAME_END in line:
-                if self._within_short_frame:
-                    # burst / short frame (exceptional)
-                    self._within_short_frame = False
-                else:
-                    # regular long frame
-                    self._frames_read += 1
-                    self._cleanup_cache()
-                if tag is not None:
-                    _LOGGER.debug("End of frame, last tag read: %s", tag)
+            # Decode the bytes read (none on read timeout)
+            self._decoder.feed(data)
+            self._check_stall()
         # Stop flag as been activated
         _LOGGER.info("Thread stop: closing the serial connection")
+        self._stop_watching()
         if self._reader:
             self._reader.close()
 
-    def register_push_notif(self, tag: str, notif_callback: Callable[[bool], None]):
-        """Call to register a callback notification when a certain tag is parsed."""
-        _LOGGER.debug("Registering a callback for %s tag", tag)
-        self._notif_callbacks[tag] = notif_callback
+    def _read_data(self) -> bytes:
+        """Read the next bytes from the serial connection, either line by line or by bulk chunks."""
+        assert self._reader is not None
+        if not self._buffered:
+            return self._reader.readline()
+        return self._read_chunk()
+
+    def _read_chunk(self) -> bytes:
+        """Read a chunk from the serial connection."""
+        assert self._reader is not None
+        # Wait (up to the read timeout, not at all within the event loop) for at least one byte, then drain everything
+        # the driver has already buffered. A wakeup without any byte returns nothing, a device gone raises.
+        return self._reader.read(self._reader.in_waiting or 1)
+
+    def _process_group(self, payload: bytes) -> None:
+        """Parse a group read from the serial connection (see FrameDecoder) and store its value."""
+        last_version = self._version
+        group = self._parse_group(payload)
+        # Rejected groups (or values) have been counted by _parse_group
+        if group is not None:
+            tag = group.tag
+            self._last_group_at = time.monotonic()
+            if self._disconnected_at is not None or self._stalled:
+                self._link_back()
+            # Mark this tag as seen for end of frame cache cleanup
+            self._tags_seen.add(tag)
+            # Handle short burst for tri-phase historic mode
+            if (
+                not self._std_mode
+                and self._three_phase
+                and not self._within_short_frame
+                and tag in SHORT_FRAME_DETECTION_TAGS
+            ):
+                _LOGGER.warning(
+                    "Short trame burst detected (%s): switching to forced update mode",
+                    tag,
+                )
+                self._within_short_frame = True
+            # Short frames only update the live values: the next snapshot is made of the regular frame tags
+            if not self._within_short_frame:
+                typed_value, _, version = self._live_values.get_typed(tag)
+                self._frame_values.put(
+                    tag, group.value, group.timestamp, version, typed_value
+                )
+            # If someone listens to the notifications, tell them about this tag
+            if self._notif_callbacks:
+                # Special cases for forced_update: historic tree-phase short frame and historic single-phase ADPS
+                forced_update = (
+                    self._within_short_frame and tag in SHORT_FRAME_FORCED_UPDATE_TAGS
+                ) or tag == "ADPS"
+                # The version counter only moves when the value has just changed
+                if forced_update:
+                    self._notify(tag, True)
+                elif self._version != last_version:
+                    self._notify_rate_limited(tag)
+                if not self._frames_read:
+                    # Until the first complete frame, consumers read the live values: no need to wait for its end
+                    self._flush_notifications()
+
+    def _process_frame_end(self, complete: bool) -> None:
+        """Handle the end of a frame (see FrameDecoder): publish it, merged into the previous snapshot if it is truncated."""
+        # Complete or not: a noisy line still has a live link
+        self._last_frame_at = time.monotonic()
+        if self._within_short_frame:
+            # burst / short frame (exceptional)
+            self._within_short_frame = False
+        elif complete and not self._frame_truncated:
+            # regular long frame
+            self._frames_read += 1
+            self._publish_frame()
+            if self._frames_read == 1:
+                # Tags absent from the first full frame can now be marked as unavailable
+                self._notify_refresh()
+            if self._fallback_std_mode is not None:
+                self._mode_validated()
+        else:
+            # A frame losing some groups still publishes the valid ones, over the previous snapshot: a noisy line must
+            # not freeze the values, nor make the tags lost from it unavailable
+            _LOGGER.debug("%s: merging an incomplete frame", self._title)
+            self._frame_values.fill(self._values)
+            self._publish_frame(complete=False)
+        self._frame_truncated = False
+        if self._deferred_notifications:
+            self._notify_deferred()
+        self._flush_notifications()
+        self._flush_status_changes()
+        if (
+            self._invalid_groups
+            and time.monotonic() - self._invalid_groups_reported_at
+            >= INVALID_GROUPS_LOG_INTERVAL
+        ):
+            self._report_invalid_groups()
+        if self._requested_std_mode is not None:
+            self._hand_mode_over()
+
+    def _notify(self, tag: str, forced_update: bool) -> None:
+        """Notify the callbacks of a tag update, or queue it until the end of the frame when coalescing notifications."""
+        if not self._notif_callbacks:
+            return
+        if self._coalesce_notifications and self._loop is not None:
+            if self._pending_notifications is not None:
+                self._pending_notifications[tag] = (
+                    self._pending_notifications.get(tag, False) or forced_update
+                )
+            return
+        _LOGGER.debug("Executing the notification callbacks for %s", tag)
+        for notif_callback in self._notif_callbacks:
+            notif_callback({tag: forced_update})
+
+    def _notify_rate_limited(self, tag: str) -> None:
+        """Notify a tag update, or defer it until the interval of its lane has elapsed since its last notification."""
+        interval = self._tag_interval(tag)
+        if interval:
+            now = time.monotonic()
+            notified_at = self._notified_at.get(tag)
+            if notified_at is not None and now - notified_at < interval:
+                self._deferred_notifications.add(tag)
+                return
+            self._notified_at[tag] = now
+        self._notify(tag, False)
+
+    def _tag_interval(self, tag: str) -> float:
+        """Get the notification interval of a tag: the interval of its lane, and the polling interval at least without real time."""
+        interval = self._tag_intervals.get(tag, self._default_interval)
+        if self._realtime:
+            return interval
+        return max(interval, POLLING_INTERVAL)
+
+    def _notify_deferred(self) -> None:
+        """Notify the deferred tag updates whose lane interval has elapsed."""
+        now = time.monotonic()
+        for tag in list(self._deferred_notifications):
+            if now - self._notified_at[tag] >= self._tag_interval(tag):
+                self._deferred_notifications.discard(tag)
+                self._notified_at[tag] = now
+                self._notify(tag, False)
+
+    def _notify_refresh(self) -> None:
+        """Notify the callbacks that every value may have changed, or queue it until the end of the frame when coalescing notifications."""
+        if self._coalesce_notifications and self._loop is not None:
+            self._pending_notifications = None
+            return
+        for notif_callback in self._notif_callbacks:
+            notif_callback(None)
+
+    def _flush_notifications(self) -> None:
+        """Send the notifications queued during the frame to the event loop, all at once."""
+        if self._pending_notifications == {}:
+            return
+        notifications = self._pending_notifications
+        self._pending_notifications = {}
+        if not self._notif_callbacks:
+            return
+        assert self._loop is not None
+        if self._loop_transport:
+            self._dispatch_notifications(notifications)
+        else:
+            self._loop.call_soon_threadsafe(self._dispatch_notifications, notifications)
+
+    @callback
+    def _dispatch_notifications(self, notifications: dict[str, bool] | None) -> None:
+        """Call the notification callbacks with the updates of a frame, within the event loop."""
+        _LOGGER.debug(
+            "%s: notifying %s of new data",
+            self._title,
+            "every tag" if notifications is None else f"{len(notifications)} tags",
+        )
+        for notif_callback in self._notif_callbacks:
+            notif_callback(notifications)
+
+    def _status_changed(self, register: str, version: int) -> None:
+        """Decode a new status register value and notify the changes of its fields, or queue them until the end of the frame when coalescing notifications."""
+        decoded = decode_status_register(register)
+        self._decoded_status = (version, decoded)
+        previous, self._last_status = self._last_status, decoded
+        if previous is None or decoded is None or not self._status_callbacks:
+            return
+        changes = status_changes(previous, decoded)
+        if not changes:
+            return  # reserved bits only
+        status_change = {
+            "serial_number": self._serial_number,
+            "before": f"{previous.register:08X}",
+            "after": register,
+            "changes": changes,
+        }
+        if self._coalesce_notifications and self._loop is not None:
+            self._pending_status_changes.append(status_change)
+            return
+        for status_callback in self._status_callbacks:
+            status_callback(status_change)
+
+    def _flush_status_changes(self) -> None:
+        """Send the status register changes queued during the frame to the event loop."""
+        if not self._pending_status_changes:
+            return
+        pending_status_changes = self._pending_status_changes
+        self._pending_status_changes = []
+        assert self._loop is not None
+        if self._loop_transport:
+            self._dispatch_status_changes(pending_status_changes)
+        else:
+            self._loop.call_soon_threadsafe(
+                self._dispatch_status_changes, pending_status_changes
+            )
+
+    @callback
+    def _dispatch_status_changes(
+        self, pending_status_changes: list[dict[str, Any]]
+    ) -> None:
+        """Call the status callbacks with the status register changes of a frame, within the event loop."""
+        for status_change in pending_status_changes:
+            for status_callback in self._status_callbacks:
+                status_callback(status_change)
+
+    def register_status_notif(
+        self, status_callback: Callable[[dict[str, Any]], None]
+    ) -> Callable[[], None]:
+        """Call to register a callback notified of the status register changes: before and after register values and the before/after values of each field changed. Returns a function to unregister it."""
+        self._status_callbacks.append(status_callback)
+        return lambda: self._status_callbacks.remove(status_callback)
+
+    def register_reconfigure_notif(
+        self, reconfigure_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Call to register a callback notified, within the event loop, once a new configuration applies (see reconfigure): the tags read may have changed. Returns a function to unregister it."""
+        self._reconfigure_callbacks.append(reconfigure_callback)
+        return lambda: self._reconfigure_callbacks.remove(reconfigure_callback)
+
+    def register_push_notif(
+        self, notif_callback: Callable[[dict[str, bool] | None], None]
+    ) -> Callable[[], None]:
+        """Call to register a callback notified of the tags updated (tag -> forced update), None meaning that every tag must be refreshed. Returns a function to unregister it."""
+        _LOGGER.debug("%s: registering a notification callback", self._title)
+        self._notif_callbacks.append(notif_callback)
+        return lambda: self._notif_callbacks.remove(notif_callback)
 
     @callback
     def signalstop(self, event):
         """Activate the stop flag in order to stop the thread from within."""
-        if self.is_alive():
+        if self._loop_transport:
+            assert self._loop is not None
+            _LOGGER.info(
+                "Stopping %s serial event loop reader (received %s)", self._title, event
+            )
+            self._stopsignal = True
+            if self._watchdog_handle is not None:
+                self._watchdog_handle.cancel()
+            if self._reopen_task is not None:
+                self._reopen_task.cancel()
+            if self._fd is not None:
+                self._loop.remove_reader(self._fd)
+                self._fd = None
+            if self._reader:
+                self._reader.close()
+        elif self.is_alive():
             _LOGGER.info(
                 "Stopping %s serial thread reader (received %s)", self._title, event
             )
             self._stopsignal = True
+            # Wake the thread up right away: out of its reconnection wait, or of its pending read
+            self._stop_event.set()
+            with self._watcher_lock:
+                if self._watcher is not None:
+                    self._watcher.interrupt()
+            cancel_read = getattr(self._reader, "cancel_read", None)
+            if cancel_read is not None:
+                # Not available on URL handlers (rfc2217://...): their read times out within a second
+                with contextlib.suppress(OSError):
+                    cancel_read()
 
-    def update_options(self, real_time: bool):
+    async def async_stop(self, event) -> None:
+        """Stop reading, and wait (READER_STOP_TIMEOUT at most) for the serial connection to be closed: the port is free for another reader once done."""
+        self.signalstop(event)
+        if self._reopen_task is not None and not self._reopen_task.done():
+            await asyncio.wait([self._reopen_task], timeout=READER_STOP_TIMEOUT)
+        if self.is_alive():
+            assert self._loop is not None
+            await self._loop.run_in_executor(None, self.join, READER_STOP_TIMEOUT)
+            if self.is_alive():
+                _LOGGER.warning(
+                    "%s: the serial reader thread did not stop within %ss",
+                    self._title,
+                    READER_STOP_TIMEOUT,
+                )
+
+    def update_options(
+        self,
+        real_time: bool,
+        lane_intervals: dict[str, float] | None = None,
+        holdover: float | None = None,
+    ):
         """Setter to update serial reader options."""
         _LOGGER.debug("%s: new real time option value: %s", self._title, real_time)
         self._realtime = real_time
+        self._set_lane_intervals(lane_intervals)
+        self._holdover = HOLDOVER_DEFAULT if holdover is None else holdover
+
+    def reconfigure(
+        self, std_mode: bool, producer_mode: bool, three_phase: bool
+    ) -> None:
+        """Apply a new configuration to the running reader, without reopening the serial connection.
+
+        The producer and three-phase flags apply right away. A TIC mode change (and its baud rate) is handed over at the
+        next frame boundary, then validated by the first complete frame read in the new mode: the previous mode is
+        restored if the link stalls before (see _check_stall). Consumers are notified once the configuration read
+        changes, the previous mode being restored included.
+        """
+        self._producer_setting = bool(producer_mode)
+        flags_changed = (
+            self._producer_mode != (self._producer_setting and self._std_mode)
+            or self._three_phase != three_phase
+        )
+        self._producer_mode = self._producer_setting and self._std_mode
+        self._three_phase = three_phase
+        if std_mode != (
+            self._std_mode
+            if self._requested_std_mode is None
+            else self._requested_std_mode
+        ):
+            _LOGGER.info(
+                "%s: switching to %s mode at the next frame boundary",
+                self._title,
+                "standard" if std_mode else "historic",
+            )
+            self._requested_at = time.monotonic()
+            self._requested_std_mode = std_mode
+        if flags_changed:
+            self._notify_reconfigured()
+
+    def _hand_mode_over(self) -> None:
+        """Switch to the TIC mode requested (see reconfigure), at a frame boundary: to be validated by a complete frame."""
+        std_mode = self._requested_std_mode
+        self._requested_std_mode = None
+        if std_mode is None or std_mode == self._std_mode:
+            return
+        if self._fallback_std_mode is None:
+            self._fallback_std_mode = self._std_mode
+        elif self._fallback_std_mode == std_mode:
+            # Back to the validated mode before the new one was
+            self._fallback_std_mode = None
+        self._switch_mode(std_mode)
+
+    def _switch_mode(self, std_mode: bool) -> None:
+        """Switch the TIC mode and baud rate of the open serial connection, dropping the frame being read."""
+        _LOGGER.debug(
+            "%s: reading in %s mode at %d bauds",
+            self._title,
+            "standard" if std_mode else "historic",
+            MODE_STANDARD_BAUD_RATE if std_mode else MODE_HISTORIC_BAUD_RATE,
+        )
+        self._set_mode(std_mode)
+        self._producer_mode = self._producer_setting and std_mode
+        if self._reader is not None:
+            # Applied right away to an open port by pyserial, or at its next opening
+            self._reader.baudrate = self._baudrate
+        self._decoder.reset()
+        self._frame_values.clear()
+        self._tags_seen = set()
+        self._within_short_frame = False
+        self._frame_truncated = False
+        self._last_group_at = self._last_frame_at = time.monotonic()
+
+    def _mode_validated(self) -> None:
+        """Complete a TIC mode handover once a complete frame has been read in the new mode."""
+        _LOGGER.info(
+            "%s: now reading in %s mode",
+            self._title,
+            "standard" if self._std_mode else "historic",
+        )
+        self._fallback_std_mode = None
+        self._notify_reconfigured()
+
+    def _notify_reconfigured(self) -> None:
+        """Call the reconfiguration callbacks, within the event loop."""
+        for reconfigure_callback in self._reconfigure_callbacks:
+            if self._loop is None or self._loop_transport:
+                reconfigure_callback()
+            else:
+                self._loop.call_soon_threadsafe(reconfigure_callback)
+
+    def _set_mode(self, std_mode: bool) -> None:
+        """Set the TIC mode, its baud rate and frame period."""
+        self._std_mode = std_mode
+        self._baudrate = (
+            MODE_STANDARD_BAUD_RATE if std_mode else MODE_HISTORIC_BAUD_RATE
+        )
+        # 7E1: 10 bits per byte on the wire
+        self._frame_period = (
+            (MODE_STANDARD_FRAME_SIZE if std_mode else MODE_HISTORIC_FRAME_SIZE)
+            * 10
+            / self._baudrate
+        )
+
+    def _set_lane_intervals(self, lane_intervals: dict[str, float] | None) -> None:
+        """Assign each tag the publish interval of its rate lane."""
+        intervals = {**LANES_DEFAULT_INTERVALS, **(lane_intervals or {})}
+        _LOGGER.debug("%s: rate lanes intervals: %s", self._title, intervals)
+        self._default_interval = intervals[OPTIONS_LANE_CHANGE]
+        self._tag_intervals = {
+            tag: intervals[lane] for lane, tags in LANES_TAGS.items() for tag in tags
+        }
 
-    def _cleanup_cache(self):
-        """Call to cleanup the data cache to allow some sensors to get back to undefined/unavailable if they are not present in the last frame."""
-        for cached_tag in list(self._values.keys()):  # pylint: disable=consider-using-dict-items,consider-iterating-dictionary
-            if cached_tag not in self._tags_seen:
+    def _publish_frame(self, complete: bool = True):
+        """Publish the frame just read as the new values snapshot and, if it is complete, cleanup the live values of the tags not seen since the previous frame, allowing some sensors to get back to undefined/unavailable."""
+        previous_values = self._values
+        # Swap the whole snapshot at once: readers see either the previous frame or this one, never a mix of both
+        self._values = self._frame_values
+        # Recycle the snapshot retired a frame ago: consumers still reading the one just retired keep a consistent view
+        self._frame_values = self._retired_values
+        self._frame_values.clear()
+        self._retired_values = previous_values
+        tags_seen = self._tags_seen
+        self._tags_seen = set()
+        if not complete:
+            # Tags missing from a truncated frame may just have been lost
+            return
+        removed_tags = previous_values.tags() - self._values.tags()
+        for cached_tag in self._live_values.tags():
+            if cached_tag not in tags_seen:
                 _LOGGER.debug(
                     "tag %s was present in cache but has not been seen in previous frame: removing from cache",
                     cached_tag,
                 )
-                # Clean serial controller data cache for this tag
-                del self._values[cached_tag]
-                # Inform entity of a new value available (None) if in push mode
-                try:
-                    notif_callback = self._notif_callbacks[cached_tag]
-                    notif_callback(self._realtime)
-                except KeyError:
-                    pass
-        self._tags_seen = []
+                self._live_values.discard(cached_tag)
+                removed_tags.add(cached_tag)
+        self._deferred_notifications -= removed_tags
+        # Inform entities of a new value available (None) if in push mode
+        for removed_tag in removed_tags:
+            self._notify(removed_tag, False)
 
     def _open_serial(self) -> bool:
         """Create (and open) the serial connection."""
@@ -254,7 +933,7 @@ class LinkyTICReader(threading.Thread):
                 bytesize=BYTESIZE,
                 parity=PARITY,
                 stopbits=STOPBITS,
-                timeout=1,
+                timeout=self._read_timeout,
             )
         except BaseException as e:
             self._setup_error = e
@@ -262,145 +941,297 @@ class LinkyTICReader(threading.Thread):
             return False
         else:
             _LOGGER.info("Serial connection is now open at %s", self._port)
+            self._last_group_at = self._last_frame_at = time.monotonic()
             return True
 
     def _reset_state(self):
         """Reinitialize the controller (by nullifying it) and wait 5s for other methods to re start init after a pause."""
         _LOGGER.debug("Resetting serial reader state and wait 10s")
-        self._values = {}
+        self._values = TagStore()
+        self._frame_values = TagStore()
+        self._retired_values = TagStore()
+        self._live_values = TagStore()
         self._serial_number = None
-        # Inform sensor in push mode to come fetch data (will get None and switch to unavailable)
-        for notif_callback in self._notif_callbacks.values():
-            notif_callback(self._realtime)
-        self._first_line = True
-        self._frames_read = -1
+        # Inform entities to come fetch data (will get None and switch to unavailable)
+        self._pending_notifications = {}
+        self._notified_at = {}
+        self._deferred_notifications = set()
+        self._last_status = None
+        self._pending_status_changes = []
+        self._notify_refresh()
+        self._flush_notifications()
+        self._decoder.reset()
+        self._frames_read = 0
         self._within_short_frame = False
-        self.device_identification = {
-            DID_CONSTRUCTOR: None,
-            DID_CONSTRUCTOR_CODE: None,
-            DID_REGNUMBER: None,
-            DID_TYPE: None,
-            DID_TYPE_CODE: None,
-            DID_YEAR: None,
-        }
+        self._frame_truncated = False
+        self.device_identification = self._known_identification()
 
-    def _parse_line(self, line) -> str | None:
-        """Parse a line when a full line has been read from serial. It parses it as Linky TIC infos, validate its checksum and save internally the line infos."""
-        # there is a great chance that the first line is a partial line: skip it
-        if self._first_line:
-            _LOGGER.debug("skipping first line: %s", repr(line))
-            self._first_line = False
-            return None
-        # if not, it should be complete: parse it !
-        _LOGGER.debug("line to parse: %s", repr(line))
-        # cleanup the line
-        line = line.rstrip(LINE_END).rstrip(FRAME_END)
-        if not line:
-            return None
-        # extract the fields by parsing the line given the mode
-        timestamp = None
-        if self._std_mode:
-            fields = line.split(MODE_STANDARD_FIELD_SEPARATOR)
-            if len(fields) == 4:
-                tag = fields[0]
-                timestamp = fields[1]
-                field_value = fields[2]
-                checksum = fields[3]
-            elif len(fields) == 3:
-                tag = fields[0]
-                field_value = fields[1]
-                checksum = fields[2]
-            else:
-                _LOGGER.error(
-                    "Failed to parse the following line (%d fields detected) in standard mode: %s",
-                    len(fields),
-                    repr(line),
-                )
-                return None
+    def _drop_connection(self) -> None:
+        """Close the serial connection after an error or a stall, and reconnect."""
+        assert self._reader is not None
+        if self._loop_transport:
+            assert self._loop is not None
+            if self._fd is not None:
+                self._loop.remove_reader(self._fd)
+                self._fd = None
+            self._connection_lost()
+            self._reader.close()
+            self._reopen_task = self._loop.create_task(self._async_reopen())
         else:
-            fields = line.split(MODE_HISTORIC_FIELD_SEPARATOR)
-            if len(fields) == 3:
-                tag = fields[0]
-                field_value = fields[1]
-                checksum = fields[2]
-            elif len(fields) == 4:
-                # checksum has the same value as field separator, leading to 4 fields with the last 2 empty
-                tag = fields[0]
-                field_value = fields[1]
-                checksum = MODE_HISTORIC_FIELD_SEPARATOR
-            else:
-                _LOGGER.error(
-                    "Failed to parse the following line (%d fields detected) in historic mode: %s",
-                    len(fields),
-                    repr(line),
-                )
-                return None
-        # validate the checksum
-        if not checksum:
-            _LOGGER.error("Empty checksum on line '%s'", repr(line))
-            return None
-        try:
-            self._validate_checksum(tag, timestamp, field_value, checksum)
-        except InvalidChecksum as invalid_checksum:
+            # The reader thread reconnects as soon as it sees the connection closed
+            self._connection_lost()
+            self._reader.close()
+
+    def _check_stall(self) -> None:
+        """Watchdog: declare the link stalled, and reopen the serial connection, when no valid group has been read for STALL_FRAME_PERIODS frame periods or no frame end (complete or not) for twice as long.
+
+        A silent line (TIC disabled, cable half unplugged) does not raise any serial error: reads just time out.
+        """
+        now = time.monotonic()
+        if (
+            self._requested_std_mode is not None
+            and now - self._requested_at >= self._frame_period
+        ):
+            # No frame boundary within a frame period: the meter may already send the new mode
+            self._hand_mode_over()
+        stall_delay = STALL_FRAME_PERIODS * self._frame_period
+        if (
+            now - self._last_group_at < stall_delay
+            and now - self._last_frame_at < 2 * stall_delay
+        ):
+            return
+        if self._fallback_std_mode is not None:
+            _LOGGER.warning(
+                "%s: no valid frame read in %s mode: back to %s mode",
+                self._title,
+                "standard" if self._std_mode else "historic",
+                "standard" if self._fallback_std_mode else "historic",
+            )
+            self._switch_mode(self._fallback_std_mode)
+            self._fallback_std_mode = None
+            # Let consumers know the mode set has not been kept
+            self._notify_reconfigured()
+            return
+        self._stalls += 1
+        if self._stalled:
+            _LOGGER.debug(
+                "%s: link still stalled: reopening %s", self._title, self._port
+            )
+            self._drop_connection()
+            return
+        _LOGGER.warning(
+            "%s: no valid group for %.0fs and no frame end for %.0fs: link stalled, reopening %s",
+            self._title,
+            now - self._last_group_at,
+            now - self._last_frame_at,
+            self._port,
+        )
+        self._stalled = True
+        self._drop_connection()
+        # Let consumers show the stall
+        self._notify_refresh()
+        self._flush_notifications()
+
+    def _link_back(self) -> None:
+        """Handle the first valid group read after a serial error or a stall: values read within the hold-over window are kept."""
+        if self._disconnected_at is not None:
+            _LOGGER.info(
+                "%s: link back after %.1fs: values read kept",
+                self._title,
+                time.monotonic() - self._disconnected_at,
+            )
+            self._disconnected_at = None
+        if self._stalled:
+            self._stalled = False
+            self._notify_refresh()
+
+    def _connection_lost(self) -> None:
+        """Handle a serial error: drop the frame being read, but keep the values read valid during the hold-over window.
+
+        Consumers are not notified: their entities stay available with the last values until the window expires (see
+        _check_holdover), or the connection is back.
+        """
+        self._decoder.reset()
+        self._frame_values.clear()
+        self._tags_seen = set()
+        self._within_short_frame = False
+        self._frame_truncated = False
+        if self._disconnected_at is None:
+            self._disconnected_at = time.monotonic()
+        if self._watcher is None and DeviceWatcher.supports(self._port):
+            watcher = DeviceWatcher(self._port)
+            if watcher.start():
+                with self._watcher_lock:
+                    self._watcher = watcher
+        self._check_holdover()
+
+    def _check_holdover(self) -> None:
+        """Clear the values read and notify every consumer once the hold-over window of a serial error has expired."""
+        if (
+            self._disconnected_at is None
+            or time.monotonic() - self._disconnected_at < self._holdover
+        ):
+            return
+        if self._holdover:
+            _LOGGER.warning(
+                "%s: serial connection lost for more than %ss: clearing the values read",
+                self._title,
+                self._holdover,
+            )
+        self._disconnected_at = None
+        self._reset_state()
+
+    def _reconnect_delay(self) -> float:
+        """Get the delay before the next reconnection attempt: exponential backoff with jitter, cut at the end of the hold-over window."""
+        delay = min(
+            RECONNECT_DELAY_MAX,
+            RECONNECT_DELAY_MIN * 2 ** min(self._backoff_attempts, 16),
+        )
+        # Jitter: readers of a same host losing their connection together do not retry in lockstep
+        delay *= random.uniform(0.5, 1)
+        if self._disconnected_at is not None:
+            holdover_left = self._disconnected_at + self._holdover - time.monotonic()
+            delay = min(delay, max(holdover_left, 0))
+        return delay
+
+    def _wait_before_reconnect(self) -> None:
+        """Wait for the reconnection delay, or until the device path appears again or the reader is stopped (reader thread)."""
+        delay = self._reconnect_delay()
+        if self._watcher is None:
+            self._stop_event.wait(delay)
+        elif self._watcher.wait(delay):
+            self._device_back()
+
+    def _device_back(self) -> None:
+        """Restart the reconnection backoff once the device path appears again: the device may take a moment to be ready (permissions set by udev for instance), the next attempts must not wait for the long delay reached meanwhile."""
+        _LOGGER.debug("%s: %s is back", self._title, self._port)
+        self._backoff_attempts = 0
+
+    def _stop_watching(self) -> None:
+        """Stop watching the device path."""
+        with self._watcher_lock:
+            if self._watcher is not None:
+                self._watcher.close()
+                self._watcher = None
+
+    def _reconnect_failed(self) -> None:
+        """Count a failed reconnection attempt, logged only at the first one and once the connection is considered failed."""
+        self._reconnect_attempts += 1
+        self._backoff_attempts += 1
+        if self._reconnect_attempts == 1:
+            _LOGGER.warning(
+                "%s: could not open %s, retrying with an increasing delay",
+                self._title,
+                self._port,
+            )
+        elif self._reconnect_attempts == RECONNECT_FAILURE_ATTEMPTS:
             _LOGGER.error(
-                "Failed to validate the checksum of line '%s': %s",
-                repr(line),
-                invalid_checksum,
+                "%s: could not open %s after %d attempts, retrying at most every %ss",
+                self._title,
+                self._port,
+                self._reconnect_attempts,
+                RECONNECT_DELAY_MAX,
+            )
+            # Let consumers show the failure
+            self._notify_refresh()
+            self._flush_notifications()
+        else:
+            _LOGGER.debug(
+                "%s: could not open %s (attempt %d)",
+                self._title,
+                self._port,
+                self._reconnect_attempts,
+            )
+        self._check_holdover()
+
+    def _reconnected(self) -> None:
+        """Handle the serial connection being open again. The hold-over window runs until a valid group is read (see _link_back)."""
+        failed = self.connection_failed
+        self._reconnect_attempts = self._backoff_attempts = 0
+        _LOGGER.debug("%s: %s reopened", self._title, self._port)
+        self._last_group_at = self._last_frame_at = time.monotonic()
+        if failed:
+            self._notify_refresh()
+            self._flush_notifications()
+
+    def _invalid_group(self, payload: bytes, status: GroupStatus) -> None:
+        """Count an invalid group: detailed at debug level only, reported in aggregate at most once per INVALID_GROUPS_LOG_INTERVAL."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Failed to parse the following group in %s mode: %s",
+                "standard" if self._std_mode else "historic",
+                group_error(payload, self._std_mode, status),
             )
+        self._invalid_groups[status] = self._invalid_groups.get(status, 0) + 1
+        self._last_invalid_group = payload
+        if (
+            time.monotonic() - self._invalid_groups_reported_at
+            >= INVALID_GROUPS_LOG_INTERVAL
+        ):
+            self._report_invalid_groups()
+
+    def _report_invalid_groups(self) -> None:
+        """Log the invalid groups dropped since the last report."""
+        _LOGGER.warning(
+            "%s: %d invalid group(s) dropped since the last report (%s), last one: %r",
+            self._title,
+            sum(self._invalid_groups.values()),
+            ", ".join(
+                f"{status.name.lower()}: {count}"
+                for status, count in self._invalid_groups.items()
+            ),
+            self._last_invalid_group,
+        )
+        self._invalid_groups.clear()
+        self._invalid_groups_reported_at = time.monotonic()
+
+    def _parse_group(self, payload: bytes) -> Group | None:
+        """Parse a group read from serial (without its delimiters) as Linky TIC infos, validate its checksum and save internally the group infos.
+
+        Returns None if the group is rejected: an invalid group truncates its frame, a value or timestamp not matching
+        its type only drops its tag. Both are counted as invalid groups.
+        """
+        _LOGGER.debug("group to parse: %r", payload)
+        if not payload:
+            self._frame_truncated = True
+            return None
+        # validate the checksum and extract the fields given the mode
+        status, group = decode_group(payload, self._std_mode)
+        if group is None:
+            self._invalid_group(payload, status)
+            self._frame_truncated = True
             return None
-        _LOGGER.debug("line checksum is valid")
-        # transform and store the values
-        payload: dict[str, str | None] = {"value": field_value.decode("ascii")}
-        payload["timestamp"] = timestamp.decode("ascii") if timestamp else None
-        tag = tag.decode("ascii")
-        self._values[tag] = payload
-        _LOGGER.debug("read the following values: %s -> %s", tag, repr(payload))
+        _LOGGER.debug("group checksum is valid")
+        # store the values, converted once per distinct value: a value or timestamp not matching its type only drops
+        # its tag, checked before versioning
+        tag = group.tag
+        value, timestamp, version = self._live_values.get_versioned(tag)
+        value_changed = version == 0 or value != group.value
+        if value_changed:
+            try:
+                typed_value = convert_value(tag, group.value)
+            except ValueError:
+                self._invalid_group(payload, GroupStatus.INVALID_VALUE)
+                return None
+        else:
+            typed_value = self._live_values.get_typed(tag)[0]
+        if value_changed or timestamp != group.timestamp:
+            if group.timestamp:
+                try:
+                    parse_timestamp(group.timestamp)
+                except ValueError:
+                    self._invalid_group(payload, GroupStatus.INVALID_TIMESTAMP)
+                    return None
+            self._version += 1
+            version = self._version
+        self._live_values.put(tag, group.value, group.timestamp, version, typed_value)
+        if tag == "STGE" and version == self._version:
+            self._status_changed(group.value, version)
+        _LOGGER.debug("read the following values: %s -> %r", tag, group)
         # Parse ADS for device identification if necessary
         if (self._std_mode and tag == "ADSC") or (not self._std_mode and tag == "ADCO"):
-            self.parse_ads(payload["value"])
-        return tag
-
-    def _validate_checksum(
-        self, tag: bytes, timestamp: bytes | None, value: bytes, checksum: bytes
-    ):
-        # rebuild the frame
-        if self._std_mode:
-            sep = MODE_STANDARD_FIELD_SEPARATOR
-            if timestamp is None:
-                frame = tag + sep + value + sep
-            else:
-                frame = tag + sep + timestamp + sep + value + sep
-        else:
-            frame = tag + MODE_HISTORIC_FIELD_SEPARATOR + value
-        # compute the sum of the frame
-        sum1 = 0
-        for byte in frame:
-            sum1 += byte
-        # compute checksum for s1
-        truncated = sum1 & 0x3F
-        computed_checksum = truncated + 0x20
-        # validate
-        try:
-            if computed_checksum != ord(checksum):
-                raise InvalidChecksum(
-                    tag, timestamp, value, sum1, truncated, computed_checksum, checksum
-                )
-        except TypeError as exc:
-            # see https://github.com/hekmon/linkytic/issues/9
-            _LOGGER.exception(
-                "Encountered an unexpected checksum (%s): %s", exc, checksum
-            )
-            raise InvalidChecksum(
-                tag,
-                timestamp,
-                value,
-                sum1,
-                truncated,
-                computed_checksum,
-                bytes(
-                    "0", encoding="ascii"
-                ),  # fake expected checksum to avoid type error on ord()
-            ) from exc
+            self.parse_ads(group.value)
+        return group
 
     def parse_ads(self, ads):
         """Extract information contained in the ADS as EURIDIS."""
@@ -424,93 +1255,72 @@ class LinkyTICReader(threading.Thread):
 
         # Save serial number
         self._serial_number = ads
+        if self._loop is not None:
+            if self._loop_transport:
+                self._set_identified()
+            else:
+                self._loop.call_soon_threadsafe(self._set_identified)
+        if ads == self._known_serial_number:
+            # Already identified
+            return
+        if self._known_serial_number is not None:
+            _LOGGER.warning(
+                "%s: the serial number read (%s) is not the one saved (%s): the meter has been replaced",
+                self._title,
+                ads,
+                self._known_serial_number,
+            )
+        self.device_identification = self._identify(ads)
+
+    def _known_identification(self) -> dict[str, str | None]:
+        """Get the device identification given by the serial number saved, if any."""
+        if self._known_serial_number is None:
+            return {
+                DID_CONSTRUCTOR: None,
+                DID_CONSTRUCTOR_CODE: None,
+                DID_REGNUMBER: None,
+                DID_TYPE: None,
+                DID_TYPE_CODE: None,
+                DID_YEAR: None,
+            }
+        return self._identify(self._known_serial_number)
 
+    def _identify(self, ads: str) -> dict[str, str | None]:
+        """Get the device identification contained in an ADS."""
         # let's parse ADS as EURIDIS
-        device_identification = {DID_YEAR: ads[2:4], DID_REGNUMBER: ads[6:]}
+        device_identification: dict[str, str | None] = {
+            DID_YEAR: ads[2:4],
+            DID_REGNUMBER: ads[6:],
+        }
         # # Parse constructor code
-        device_identification[DID_CONSTRUCTOR_CODE] = ads[0:2]
+        constructor_code = ads[0:2]
+        device_identification[DID_CONSTRUCTOR_CODE] = constructor_code
         try:
             device_identification[DID_CONSTRUCTOR] = CONSTRUCTORS_CODES[
-                device_identification[DID_CONSTRUCTOR_CODE]
+                constructor_code
             ]
         except KeyError:
             _LOGGER.warning(
                 "%s: constructor code is unknown: %s",
                 self._title,
-                device_identification[DID_CONSTRUCTOR_CODE],
+                constructor_code,
             )
             device_identification[DID_CONSTRUCTOR] = None
         # # Parse device type code
-        device_identification[DID_TYPE_CODE] = ads[4:6]
+        type_code = ads[4:6]
+        device_identification[DID_TYPE_CODE] = type_code
         try:
-            device_identification[DID_TYPE] = (
-                f"{DEVICE_TYPES[device_identification[DID_TYPE_CODE]]}"
-            )
+            device_identification[DID_TYPE] = f"{DEVICE_TYPES[type_code]}"
         except KeyError:
             _LOGGER.warning(
                 "%s: ADS device type is unknown: %s",
                 self._title,
-                device_identification[DID_TYPE_CODE],
+                type_code,
             )
             device_identification[DID_TYPE] = None
-        # # Update device infos
-        self.device_identification = device_identification
         # Parsing done
-        _LOGGER.debug(
-            "%s: parsed ADS: %s", self._title, repr(self.device_identification)
-        )
-
-
-class InvalidChecksum(Exception):
-    """Exception for Linky TIC checksum validation error."""
-
-    def __init__(
-        self,
-        tag: bytes,
-        timestamp: bytes | None,
-        value: bytes,
-        s1: int,
-        s1_truncated: int,
-        computed: int,
-        expected: bytes,
-    ) -> None:
-        """Initialize the checksum exception."""
-        try:
-            self.tag = tag.decode("ascii")
-        except UnicodeDecodeError:
-            self.tag = "<invalid ascii sequence>"
-        try:
-            self.timestamp = timestamp.decode("ascii") if timestamp else None
-        except UnicodeDecodeError:
-            self.timestamp = "<invalid ascii sequence>"
-        try:
-            self.value = value.decode("ascii")
-        except UnicodeDecodeError:
-            self.value = "<invalid ascii sequence>"
-        self.sum1 = s1
-        self.s1_truncated = s1_truncated
-        self.computed = computed
-        self.expected = expected
-        super().__init__(self.msg())
-
-    def msg(self):
-        """Printable exception method."""
-        return "{} -> {} ({}) | s1 {} {} | truncated {} {} {} | computed {} {} {} | expected {} {} {}".format(
-            self.tag,
-            self.value,
-            self.timestamp,
-            self.sum1,
-            bin(self.sum1),
-            self.s1_truncated,
-            bin(self.s1_truncated),
-            chr(self.s1_truncated),
-            self.computed,
-            bin(self.computed),
-            chr(self.computed),
-            int.from_bytes(self.expected, byteorder="big"),
-            bin(int.from_bytes(self.expected, byteorder="big")),
-            chr(ord(self.expected)),
-        )
+        _LOGGER.debug("%s: parsed ADS: %r", self._title, device_identification)
+        return device_identification
 
 
 def linky_tic_tester(device: str, std_mode: bool) -> None:
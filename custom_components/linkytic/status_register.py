@@ -15,17 +15,26 @@ class StatusRegisterEnumValueType(NamedTuple):
     len: int = 1
     options: dict[int, str] | None = None
 
+    @property
+    def mask(self) -> int:
+        """Bits of the field in the status register."""
+        return ((1 << self.len) - 1) << self.lsb
+
     def get_status(self, register: str) -> str | bool:
         try:
             int_register = int(register, base=16)
         except TypeError:
             return False
+        return self.decode(int_register)
+
+    def decode(self, int_register: int) -> str | bool:
+        """Extract the field value from the integer value of the register."""
         val = (int_register >> self.lsb) & ((1 << self.len) - 1)
 
         if self.options is None:
             return bool(val)
 
-        return self.options[val]  # Let IndexError propagate if val is unknown.
+        return self.options[val]  # Let KeyError propagate if val is unknown.
 
 
 organe_coupure = {
@@ -101,3 +110,43 @@ class StatusRegister(Enum):
     COULEUR_LENDEMAIN_CONTRAT_TEMPO = StatusRegisterEnumValueType(26, 2, tempo_color)
     PREAVIS_POINTES_MOBILES = StatusRegisterEnumValueType(28, 2, preavis_pm)
     POINTE_MOBILE = StatusRegisterEnumValueType(30, 2, pointe_mobile)
+
+
+class DecodedStatus(NamedTuple):
+    """Status register decoded once for all its fields.
+    register is the integer value of the register.
+    fields maps each field to its value (fields with an unknown value are left out).
+    """
+
+    register: int
+    fields: dict[StatusRegister, str | bool]
+
+
+def decode_status_register(register: str) -> DecodedStatus | None:
+    """Decode every field of a status register given as an hexadecimal string. Returns None if it is not valid."""
+    try:
+        int_register = int(register, base=16)
+    except (TypeError, ValueError):
+        return None
+    fields: dict[StatusRegister, str | bool] = {}
+    for field in StatusRegister:
+        try:
+            fields[field] = field.value.decode(int_register)
+        except KeyError:
+            continue
+    return DecodedStatus(int_register, fields)
+
+
+def status_changes(
+    before: DecodedStatus, after: DecodedStatus
+) -> dict[str, dict[str, str | bool | None]]:
+    """Get the before and after values of the fields that differ between two status registers, by field name."""
+    changed_bits = before.register ^ after.register
+    return {
+        field.name.lower(): {
+            "before": before.fields.get(field),
+            "after": after.fields.get(field),
+        }
+        for field in StatusRegister
+        if changed_bits & field.value.mask
+    }
@@ -0,0 +1,121 @@
+"""Compact storage of the TIC tags values."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .protocol import TAG_SLOTS, TAGS
+
+_slot_of = TAG_SLOTS.get
+_SLOTS_COUNT = len(TAGS)
+_NO_VALUES: tuple[None, ...] = (None,) * _SLOTS_COUNT
+_NO_VERSIONS: tuple[int, ...] = (0,) * _SLOTS_COUNT
+
+
+class TagStore:
+    """Value, typed value, timestamp and version of each TIC tag.
+
+    Known tags (see TAGS) are stored at a fixed slot of preallocated parallel lists: storing a value allocates nothing.
+    Unknown tags are stored aside in a fallback dict.
+    Versions are given by the caller, 0 meaning the tag is not stored.
+    A store is reused by clearing it (see clear()) rather than replaced by a new one.
+    """
+
+    __slots__ = ("_values", "_typed_values", "_timestamps", "_versions", "_extra")
+
+    def __init__(self) -> None:
+        """Init an empty store."""
+        self._values: list[str | None] = [None] * _SLOTS_COUNT
+        self._typed_values: list[Any] = [None] * _SLOTS_COUNT
+        self._timestamps: list[str | None] = [None] * _SLOTS_COUNT
+        self._versions: list[int] = [0] * _SLOTS_COUNT
+        self._extra: dict[str, tuple[str, Any, str | None, int]] = {}
+
+    def put(
+        self,
+        tag: str,
+        value: str,
+        timestamp: str | None = None,
+        version: int = 0,
+        typed_value: Any = None,
+    ) -> None:
+        """Store the value, timestamp, version and typed value of a tag."""
+        slot = _slot_of(tag)
+        if slot is None:
+            self._extra[tag] = (value, typed_value, timestamp, version)
+            return
+        self._values[slot] = value
+        self._typed_values[slot] = typed_value
+        self._timestamps[slot] = timestamp
+        self._versions[slot] = version
+
+    def get(self, tag: str) -> tuple[str | None, str | None]:
+        """Get the value and timestamp of a tag, (None, None) if the tag is not stored."""
+        slot = _slot_of(tag)
+        if slot is None:
+            value, _, timestamp, _ = self._extra.get(tag, (None, None, None, 0))
+            return value, timestamp
+        return self._values[slot], self._timestamps[slot]
+
+    def get_versioned(self, tag: str) -> tuple[str | None, str | None, int]:
+        """Get the value, timestamp and version of a tag, (None, None, 0) if the tag is not stored."""
+        slot = _slot_of(tag)
+        if slot is None:
+            value, _, timestamp, version = self._extra.get(tag, (None, None, None, 0))
+            return value, timestamp, version
+        return self._values[slot], self._timestamps[slot], self._versions[slot]
+
+    def get_typed(self, tag: str) -> tuple[Any, str | None, int]:
+        """Get the typed value, timestamp and version of a tag, (None, None, 0) if the tag is not stored."""
+        slot = _slot_of(tag)
+        if slot is None:
+            _, typed_value, timestamp, version = self._extra.get(
+                tag, (None, None, None, 0)
+            )
+            return typed_value, timestamp, version
+        return self._typed_values[slot], self._timestamps[slot], self._versions[slot]
+
+    def discard(self, tag: str) -> None:
+        """Remove a tag from the store, if present."""
+        slot = _slot_of(tag)
+        if slot is None:
+            self._extra.pop(tag, None)
+            return
+        self._values[slot] = None
+        self._typed_values[slot] = None
+        self._timestamps[slot] = None
+        self._versions[slot] = 0
+
+    def fill(self, other: TagStore) -> None:
+        """Store the tags of another store that this one does not store yet."""
+        values = self._values
+        other_values = other._values
+        for slot, value in enumerate(other_values):
+            if value is not None and values[slot] is None:
+                values[slot] = value
+                self._typed_values[slot] = other._typed_values[slot]
+                self._timestamps[slot] = other._timestamps[slot]
+                self._versions[slot] = other._versions[slot]
+        for tag, entry in other._extra.items():
+            self._extra.setdefault(tag, entry)
+
+    def clear(self) -> None:
+        """Remove every tag, keeping the preallocated lists."""
+        self._values[:] = _NO_VALUES
+        self._typed_values[:] = _NO_VALUES
+        self._timestamps[:] = _NO_VALUES
+        self._versions[:] = _NO_VERSIONS
+        self._extra.clear()
+
+    def tags(self) -> set[str]:
+        """Get the tags stored."""
+        tags = {tag for tag, value in zip(TAGS, self._values) if value is not None}
+        tags.update(self._extra)
+        return tags
+
+    def __contains__(self, tag: object) -> bool:
+        """Check if a tag is stored."""
+        slot = _slot_of(tag)  # type: ignore[call-overload]
+        if slot is None:
+            return tag in self._extra
+        return self._values[slot] is not None
@@ -0,0 +1,80 @@
+"""Benchmark the groups validation on a noisy line.
+
+Compares the previous validation (parse_group() raising InvalidChecksum, its message formatted for the error log of
+each bad group) with decode_group() returning a status, over standard mode groups with 0%, 5% and 20% of them
+corrupted by a flipped bit.
+
+Run it as a module: python -m tests.bench_corruption [groups]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from custom_components.linkytic.parser import (
+    InvalidGroup,
+    decode_group,
+    parse_group,
+    split_groups,
+)
+
+from .frames import build_frame
+
+
+def corrupt(payloads: list[bytes], ratio: float) -> list[bytes]:
+    """Flip one bit of the given ratio of the payloads."""
+    rng = random.Random(0)
+    corrupted = []
+    for payload in payloads:
+        if rng.random() < ratio:
+            data = bytearray(payload)
+            data[rng.randrange(len(data) - 1)] ^= 0x01
+            payload = bytes(data)
+        corrupted.append(payload)
+    return corrupted
+
+
+def with_exceptions(payloads: list[bytes]) -> int:
+    """Previous validation: exceptions formatted as soon as raised."""
+    valid = 0
+    for payload in payloads:
+        try:
+            parse_group(payload, True)
+        except InvalidGroup as exc:
+            "Failed to validate the checksum of line '%s': %s" % (repr(payload), exc)
+            continue
+        valid += 1
+    return valid
+
+
+def with_status(payloads: list[bytes]) -> int:
+    """Validation by status: nothing formatted for bad groups."""
+    valid = 0
+    for payload in payloads:
+        _, group = decode_group(payload, True)
+        if group is not None:
+            valid += 1
+    return valid
+
+
+def main(count: int) -> None:
+    """Print the CPU time per group of each validation for each corruption ratio."""
+    frame_payloads = [bytes(payload) for payload in split_groups(build_frame())]
+    payloads = (frame_payloads * (count // len(frame_payloads) + 1))[:count]
+    for ratio in (0.0, 0.05, 0.2):
+        corrupted = corrupt(payloads, ratio)
+        results = []
+        for validate in (with_exceptions, with_status):
+            start = time.process_time()
+            valid = validate(corrupted)
+            results.append((time.process_time() - start) / count * 1e9)
+        print(
+            f"{ratio:>4.0%} corrupted ({count - valid} bad groups):"
+            f" exceptions {results[0]:>6.0f} ns/group | status {results[1]:>6.0f} ns/group"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
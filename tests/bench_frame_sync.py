@@ -0,0 +1,114 @@
+"""Benchmark the stream decoding on a marginal link, by fault injection.
+
+Compares the previous line based decoding (lines split on LF, frames ended by the line holding ETX STX) with the
+FrameDecoder (synchronized on STX/ETX and LF/CR) over one hour of standard mode frames, a given ratio of their bytes
+being lost or having a bit flipped. Reports the groups lost per hour, the frames published while missing groups and
+the truncated frames merged into the previous ones.
+
+Run it as a module: python -m tests.bench_frame_sync [hours]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+
+from custom_components.linkytic.const import MODE_STANDARD_BAUD_RATE
+from custom_components.linkytic.parser import FrameDecoder, decode_group
+from custom_components.linkytic.protocol import FRAME_END
+
+from .frames import STANDARD_FRAME, build_frame
+
+# 7E1: 10 bits per byte on the wire
+BYTES_PER_SECOND = MODE_STANDARD_BAUD_RATE / 10
+
+
+def inject_faults(stream: bytes, ratio: float) -> bytes:
+    """Lose or flip a bit of the given ratio of the stream bytes."""
+    rng = random.Random(0)
+    faulty = bytearray()
+    for byte in stream:
+        if rng.random() < ratio:
+            if rng.random() < 0.5:
+                continue
+            byte ^= 1 << rng.randrange(7)
+        faulty.append(byte)
+    return bytes(faulty)
+
+
+def line_based(stream: bytes) -> tuple[int, int, int, int]:
+    """Previous decoding: return the valid groups, the frames published, those published while missing groups and the
+    frames merged (none: it publishes any frame end)."""
+    valid = published = incomplete = 0
+    frame_groups = 0
+    frames_read = -1  # the first frame is considered incomplete
+    for line in stream.split(b"\n")[1:]:  # the first line is skipped
+        payload = line.rstrip(FRAME_END)
+        if payload and decode_group(payload, True)[1] is not None:
+            valid += 1
+            frame_groups += 1
+        if FRAME_END in line + b"\n":
+            frames_read += 1
+            if frames_read >= 1:
+                published += 1
+                incomplete += frame_groups < len(STANDARD_FRAME)
+            frame_groups = 0
+    return valid, published, incomplete, 0
+
+
+def frame_sync(stream: bytes) -> tuple[int, int, int, int]:
+    """FrameDecoder: return the valid groups, the frames published, those published while missing groups and the frames
+    merged.
+
+    As done by the reader, a frame truncated or holding an invalid group is merged: its valid groups are published over
+    the previous frame, whose values are kept for the groups it lost.
+    """
+    valid = published = incomplete = merged = 0
+    frame_groups = 0
+    rejected = False
+
+    def on_group(payload: bytes) -> None:
+        nonlocal valid, frame_groups, rejected
+        if decode_group(payload, True)[1] is not None:
+            valid += 1
+            frame_groups += 1
+        else:
+            rejected = True
+
+    def on_frame_end(complete: bool) -> None:
+        nonlocal published, incomplete, merged, frame_groups, rejected
+        if complete and not rejected:
+            published += 1
+            incomplete += frame_groups < len(STANDARD_FRAME)
+        else:
+            merged += 1
+        frame_groups = 0
+        rejected = False
+
+    FrameDecoder(on_group, on_frame_end).feed(stream)
+    return valid, published, incomplete, merged
+
+
+def main(hours: float) -> None:
+    """Print the groups lost, the incomplete frames published and the frames merged per hour for each decoding and fault
+    ratio."""
+    frame = build_frame()
+    count = int(hours * 3600 * BYTES_PER_SECOND / len(frame))
+    stream = frame * count
+    print(
+        f"{hours}h of standard mode: {count} frames, {count * len(STANDARD_FRAME)} groups"
+    )
+    for ratio in (0.0, 1e-4, 1e-3, 5e-3):
+        faulty = inject_faults(stream, ratio)
+        for decode in (line_based, frame_sync):
+            valid, published, incomplete, merged = decode(faulty)
+            print(
+                f"{ratio:>7.2%} faulty bytes {decode.__name__:<10}:"
+                f" {(count * len(STANDARD_FRAME) - valid) / hours:>7.0f} groups lost/h"
+                f" | {published / hours:>6.0f} frames published/h, {incomplete / hours:>5.0f} incomplete,"
+                f" {merged / hours:>5.0f} merged"
+            )
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 1)
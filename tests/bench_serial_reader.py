@@ -0,0 +1,87 @@
+"""Benchmark the serial reader line mode against the buffered chunk mode.
+
+Run it as a module: python -m tests.bench_serial_reader [frames]
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+import time
+
+from custom_components.linkytic.serial_reader import LinkyTICReader
+
+from .frames import build_stream
+
+
+class FakeSerial(io.RawIOBase):
+    """In-memory serial port counting the reads reaching the "driver" (one syscall each on a real tty)."""
+
+    def __init__(self, data: bytes, chunk_size: int) -> None:
+        """Initialize the fake serial port: the driver makes chunk_size bytes available at a time."""
+        super().__init__()
+        self._data = memoryview(data)
+        self._pos = 0
+        self._chunk_size = chunk_size
+        self.reads = 0
+
+    @property
+    def in_waiting(self) -> int:
+        """Bytes available without blocking."""
+        return min(self._chunk_size, len(self._data) - self._pos)
+
+    @property
+    def is_open(self) -> bool:
+        """Always open."""
+        return True
+
+    def readable(self) -> bool:
+        """Readable stream."""
+        return True
+
+    def readinto(self, buffer) -> int:
+        """Copy the next available bytes into buffer."""
+        self.reads += 1
+        size = min(len(buffer), self.in_waiting)
+        buffer[:size] = self._data[self._pos : self._pos + size]
+        self._pos += size
+        return size
+
+
+def run(frames: int, buffered: bool, chunk_size: int) -> tuple[int, float]:
+    """Read frames through the reader, return the number of reads and the CPU time spent."""
+    reader = LinkyTICReader(
+        title="bench",
+        port=None,
+        std_mode=True,
+        producer_mode=False,
+        three_phase=False,
+        buffered=buffered,
+    )
+    fake = FakeSerial(build_stream(frames), chunk_size)
+    reader._reader = fake  # type: ignore[assignment]
+    start = time.process_time()
+    while fake.in_waiting:
+        reader._decoder.feed(reader._read_data())
+    elapsed = time.process_time() - start
+    assert reader._frames_read == frames - 1
+    return fake.reads, elapsed
+
+
+def main(frames: int) -> None:
+    """Print the reads and CPU time per frame for each mode."""
+    # At 9600 bauds a tty typically wakes up the reader every few dozen bytes
+    for buffered, chunk_size in ((False, 64), (True, 64), (True, 256)):
+        reads, elapsed = run(frames, buffered, chunk_size)
+        print(
+            "{:<9} driver chunk {:>4}B: {:>8.1f} reads/frame {:>8.1f} µs CPU/frame".format(
+                "buffered" if buffered else "readline",
+                chunk_size,
+                reads / frames,
+                elapsed / frames * 1e6,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,143 @@
+"""Benchmark the tags values storage over a replayed 24h capture.
+
+Compares the TagStore, recycled from frame to frame, with the previous storage (a {"value": ..., "timestamp": ...} dict
+per group) by replaying 24 hours worth of standard mode frames. Reports the CPU time, the memory blocks allocated per
+frame once the stores are set up, the memory retained and the memory peak.
+
+Run it as a module: python -m tests.bench_tag_store [hours]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+
+from custom_components.linkytic.const import MODE_STANDARD_BAUD_RATE
+from custom_components.linkytic.parser import parse_frame
+from custom_components.linkytic.tag_store import TagStore
+
+from .frames import build_frame
+
+# 7E1: 10 bits per byte on the wire
+BYTES_PER_SECOND = MODE_STANDARD_BAUD_RATE / 10
+# Frames replayed before measuring the memory peak and counting the allocations
+WARMUP_FRAMES = 3
+# Frames replayed while counting the allocations
+COUNTED_FRAMES = 100
+
+
+class Graveyard:
+    """Keeps the objects dropped while counting the allocations alive: a block allocated then freed is still counted.
+
+    Preallocated: keeping an object allocates nothing.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Init an empty graveyard for size objects."""
+        self._objects: list = [None] * size
+        self._count = 0
+        self.blocks = 0  # allocated blocks once the stores are set up
+
+    def keep(self, dropped: object) -> None:
+        """Keep an object dropped."""
+        self._objects[self._count] = dropped
+        self._count += 1
+
+
+class DictStore:
+    """Previous storage: a new dict per group replacing the previous one."""
+
+    graveyard: Graveyard | None = None
+
+    def __init__(self) -> None:
+        """Init an empty store."""
+        self._values: dict[str, dict[str, str | None]] = {}
+
+    def put(self, tag: str, value: str, timestamp: str | None = None) -> None:
+        """Store the value and timestamp of a tag."""
+        if self.graveyard is not None and tag in self._values:
+            self.graveyard.keep(self._values[tag])
+        self._values[tag] = {"value": value, "timestamp": timestamp}
+
+
+def replay(
+    store_class, frames: list, count: int, graveyard: Graveyard | None = None
+) -> tuple:
+    """Replay count frames (cycling over the given ones) with a snapshot store per frame and a persistent live store.
+
+    Stores that can be cleared are recycled as the reader does (the snapshot retired two frames back reads the next
+    frame), the others are allocated per frame. The stores dropped are kept by the graveyard, if any.
+    Returns the live, snapshot and retired stores.
+    """
+    recycle = hasattr(store_class, "clear")
+    live = store_class()
+    snapshot = retired = store_class()
+    for index in range(count):
+        if index == WARMUP_FRAMES and tracemalloc.is_tracing():
+            # Steady state: the stores are allocated, only the memory churned per frame raises the peak now
+            tracemalloc.reset_peak()
+        if index == WARMUP_FRAMES and graveyard is not None:
+            graveyard.blocks = sys.getallocatedblocks()
+        if recycle and retired is not snapshot:
+            frame = retired
+            frame.clear()
+        else:
+            frame = store_class()
+        for group in frames[index % len(frames)]:
+            live.put(group.tag, group.value, group.timestamp)
+            frame.put(group.tag, group.value, group.timestamp)
+        if graveyard is not None and not recycle:
+            graveyard.keep(snapshot)
+        retired, snapshot = (snapshot if recycle else frame), frame
+    return live, snapshot, retired
+
+
+def count_allocations(store_class, frames: list) -> float:
+    """Return the memory blocks allocated per frame by the stores, once set up by the warmup frames."""
+    graveyard = Graveyard(COUNTED_FRAMES * (2 * len(frames[0]) + 1))
+    DictStore.graveyard = graveyard
+    try:
+        stores = replay(store_class, frames, WARMUP_FRAMES + COUNTED_FRAMES, graveyard)
+        blocks = sys.getallocatedblocks() - graveyard.blocks
+    finally:
+        DictStore.graveyard = None
+    del stores
+    return blocks / COUNTED_FRAMES
+
+
+def measure(store_class, frames: list, count: int) -> tuple[float, float, int, int]:
+    """Return the CPU time spent replaying, the blocks allocated per frame, the memory still allocated at the end and the memory peak after the warmup."""
+    start = time.process_time()
+    replay(store_class, frames, count)
+    elapsed = time.process_time() - start
+    allocations = count_allocations(store_class, frames)
+    # Memory tracing slows down the replay: measure it on a separate run
+    tracemalloc.start()
+    stores = replay(store_class, frames, count)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del stores
+    return elapsed, allocations, current, peak
+
+
+def main(hours: float) -> None:
+    """Print CPU time and memory usage of each storage."""
+    raw_frame = build_frame()
+    count = int(hours * 3600 * BYTES_PER_SECOND / len(raw_frame))
+    # A few distinct frames so that values change over time
+    frames = [
+        parse_frame(raw_frame.replace(b"00974", b"%05d" % power), True)
+        for power in range(900, 1000, 10)
+    ]
+    print(f"{hours}h of standard mode: {count} frames, {count * len(frames[0])} groups")
+    for store_class in (DictStore, TagStore):
+        elapsed, allocations, current, peak = measure(store_class, frames, count)
+        print(
+            f"{store_class.__name__:<9} {elapsed / count * 1e6:>6.1f} µs CPU/frame"
+            f" | {allocations:>6.1f} blocks allocated/frame | retained {current / 1024:>6.1f} KiB | steady peak {peak / 1024:>6.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 24)
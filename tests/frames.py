@@ -0,0 +1,103 @@
+"""Helpers to build raw TIC frames for tests and benchmarks."""
+
+from __future__ import annotations
+
+from custom_components.linkytic.protocol import (
+    FRAME_END,
+    LINE_END,
+    MODE_HISTORIC_FIELD_SEPARATOR,
+    MODE_STANDARD_FIELD_SEPARATOR,
+)
+
+STANDARD_FRAME = (
+    ("ADSC", None, "041876097147"),
+    ("VTIC", None, "02"),
+    ("DATE", "E241017094512", ""),
+    ("NGTF", None, "     TEMPO      "),
+    ("LTARF", None, "    HP  BLEU    "),
+    ("EAST", None, "024785324"),
+    ("EASF01", None, "007634563"),
+    ("EASF02", None, "014253424"),
+    ("EASF03", None, "000634287"),
+    ("EASF04", None, "001544098"),
+    ("EASF05", None, "000184762"),
+    ("EASF06", None, "000534190"),
+    ("EASF07", None, "000000000"),
+    ("EASF08", None, "000000000"),
+    ("EASF09", None, "000000000"),
+    ("EASF10", None, "000000000"),
+    ("EASD01", None, "007818325"),
+    ("EASD02", None, "014792823"),
+    ("EASD03", None, "000000000"),
+    ("EASD04", None, "002174176"),
+    ("IRMS1", None, "004"),
+    ("URMS1", None, "236"),
+    ("PREF", None, "09"),
+    ("PCOUP", None, "09"),
+    ("SINSTS", None, "00974"),
+    ("SMAXSN", "E241017061924", "04572"),
+    ("SMAXSN-1", "E241016193040", "05233"),
+    ("CCASN", "E241017093000", "00952"),
+    ("CCASN-1", "E241017090000", "01068"),
+    ("UMOY1", "E241017094000", "235"),
+    ("STGE", None, "013AC501"),
+    ("MSG1", None, "PAS DE          MESSAGE         "),
+    ("PRM", None, "21499811542764"),
+    ("RELAIS", None, "000"),
+    ("NTARF", None, "02"),
+    ("NJOURF", None, "00"),
+    ("NJOURF+1", None, "00"),
+    ("PJOURF+1", None, "00004001 06004002 22004001 NONUTILE NONUTILE"),
+)
+
+HISTORIC_FRAME = (
+    ("ADCO", None, "031762120162"),
+    ("OPTARIF", None, "HC.."),
+    ("ISOUSC", None, "30"),
+    ("HCHC", None, "010140655"),
+    ("HCHP", None, "016342564"),
+    ("PTEC", None, "HP.."),
+    ("IINST", None, "003"),
+    ("IMAX", None, "090"),
+    ("PAPP", None, "00750"),
+    ("HHPHC", None, "A"),
+    ("MOTDETAT", None, "000000"),
+)
+
+
+def checksum(data: bytes) -> bytes:
+    """Compute the checksum character of a group payload."""
+    return bytes([(sum(data) & 0x3F) + 0x20])
+
+
+def build_group(
+    tag: str, value: str, timestamp: str | None = None, std_mode: bool = True
+) -> bytes:
+    """Build a group payload (without line delimiters) with its checksum."""
+    if std_mode:
+        sep = MODE_STANDARD_FIELD_SEPARATOR
+        fields = [tag, value] if timestamp is None else [tag, timestamp, value]
+        data = sep.join(field.encode("ascii") for field in fields) + sep
+        return data + checksum(data)
+    sep = MODE_HISTORIC_FIELD_SEPARATOR
+    data = tag.encode("ascii") + sep + value.encode("ascii")
+    return data + sep + checksum(data)
+
+
+def build_frame(
+    groups: tuple[tuple[str, str | None, str], ...] | None = None,
+    std_mode: bool = True,
+) -> bytes:
+    """Build a frame as read within a stream: LF + group + CR for each group, then ETX and the STX of the next frame."""
+    if groups is None:
+        groups = STANDARD_FRAME if std_mode else HISTORIC_FRAME
+    lines = [
+        LINE_END[-1:] + build_group(tag, value, timestamp, std_mode) + LINE_END[:1]
+        for tag, timestamp, value in groups
+    ]
+    return b"".join(lines) + FRAME_END[1:-1]
+
+
+def build_stream(frames: int, std_mode: bool = True) -> bytes:
+    """Build a continuous stream of frames, as read from the middle of a frame: the first frame is incomplete."""
+    return build_frame(std_mode=std_mode) * frames
@@ -0,0 +1,157 @@
+"""Test the push coordinator."""
+
+import asyncio
+from types import SimpleNamespace
+
+from custom_components.linkytic import entity as entity_module
+from custom_components.linkytic.coordinator import LinkyTICCoordinator
+from custom_components.linkytic.entity import (
+    LinkyTICEntity,
+    async_add_discovered_entities,
+    async_setup_entities,
+)
+
+from .frames import build_group, build_stream
+from .test_serial_reader import FakeLoop, feed, make_reader
+
+
+def run_scheduled(loop: FakeLoop) -> None:
+    """Run the callbacks scheduled in the fake event loop."""
+    while loop.scheduled:
+        scheduled_callback, args = loop.scheduled.pop(0)
+        scheduled_callback(*args)
+
+
+def test_listeners_called_per_frame():
+    reader = make_reader(real_time=True)
+    loop = FakeLoop()
+    reader._loop = loop  # type: ignore[assignment]
+    coordinator = LinkyTICCoordinator(SimpleNamespace(loop=loop), reader)  # type: ignore[arg-type]
+    coordinator.async_start()
+    calls: list[str | None] = []
+    for tag in ("IRMS1", "EAST", None):
+        coordinator.async_add_listener(tag, lambda forced, tag=tag: calls.append(tag))
+    remove_papp = coordinator.async_add_listener(
+        "PAPP", lambda forced: calls.append("PAPP")
+    )
+    # First frame: new values, then first full frame: everyone refreshes
+    feed(reader, build_stream(2))
+    run_scheduled(loop)
+    assert calls == ["EAST", "IRMS1", "IRMS1", "EAST", None, "PAPP"]
+    # Only the listeners of the changed tags are called
+    calls.clear()
+    remove_papp()
+    feed(
+        reader,
+        build_stream(1).replace(
+            build_group("IRMS1", "004"), build_group("IRMS1", "005")
+        ),
+    )
+    run_scheduled(loop)
+    assert calls == ["IRMS1"]
+    # Stopped coordinator: no more calls
+    calls.clear()
+    coordinator.async_stop()
+    feed(
+        reader,
+        build_stream(1).replace(
+            build_group("EAST", "024785324"), build_group("EAST", "024785325")
+        ),
+    )
+    run_scheduled(loop)
+    assert calls == []
+
+
+def test_entities_discovered():
+    reader = make_reader()
+    loop = FakeLoop()
+    reader._loop = loop  # type: ignore[assignment]
+    coordinator = LinkyTICCoordinator(SimpleNamespace(loop=loop), reader, True)  # type: ignore[arg-type]
+    coordinator.async_start()
+    entities = {}
+    for tag in ("EAST", "MSG2", "EASD05", None):
+        entities[tag] = LinkyTICEntity(reader)
+        entities[tag]._tag = tag
+    added: list[LinkyTICEntity] = []
+    async_add_discovered_entities(
+        coordinator,
+        entities.values(),
+        lambda new_entities: added.extend(new_entities),  # type: ignore[arg-type,misc]
+    )
+    # Entities without a tag are added right away, the others once a complete frame has been read
+    assert added == [entities[None]]
+    feed(reader, build_stream(1))
+    run_scheduled(loop)
+    assert added == [entities[None]]
+    feed(reader, build_stream(1))
+    run_scheduled(loop)
+    assert added == [entities[None], entities["EAST"]]
+    # A tag showing up later adds its entity
+    feed(
+        reader,
+        build_stream(1).replace(
+            build_group("NTARF", "02"),
+            build_group("NTARF", "02") + b"\r\n" + build_group("MSG2", "COUPURE"),
+        ),
+    )
+    run_scheduled(loop)
+    assert added == [entities[None], entities["EAST"], entities["MSG2"]]
+
+
+def test_entities_rebuilt(monkeypatch):
+    removed_from_registry: list[str] = []
+    monkeypatch.setattr(
+        entity_module.er,
+        "async_get",
+        lambda hass: SimpleNamespace(async_remove=removed_from_registry.append),
+    )
+    reader = make_reader()
+    coordinator = LinkyTICCoordinator(SimpleNamespace(loop=FakeLoop()), reader)  # type: ignore[arg-type]
+    tasks: list = []
+    config_entry = SimpleNamespace(
+        title="test",
+        async_on_unload=lambda _: None,
+        async_create_task=lambda hass, coro: tasks.append(coro),
+    )
+    built: list[tuple[str, str]] = []
+    removed: list[str] = []
+
+    def build_entities() -> list[LinkyTICEntity]:
+        entities = []
+        for unique_id, tag in built:
+            entity = LinkyTICEntity(reader)
+            entity._attr_unique_id, entity._tag = unique_id, tag
+            entity.entity_id = f"sensor.{unique_id}"
+            entity.registry_entry = SimpleNamespace()  # type: ignore[assignment]
+
+            async def async_remove(unique_id=unique_id) -> None:
+                removed.append(unique_id)
+
+            entity.async_remove = async_remove  # type: ignore[method-assign]
+            entities.append(entity)
+        return entities
+
+    added: list[LinkyTICEntity] = []
+
+    async def run() -> None:
+        built.extend([("index", "EAST"), ("current", "IRMS1"), ("power", "SINSTS")])
+        await async_setup_entities(
+            coordinator,
+            config_entry,  # type: ignore[arg-type]
+            build_entities,
+            lambda new_entities, update_before_add=False: added.extend(new_entities),  # type: ignore[arg-type,misc]
+        )
+        # Switched mode: the entities no longer built leave the registry, unless their unique id is built again
+        built[:] = [("index", "BASE"), ("current", "IRMS1")]
+        coordinator._async_reconfigured()
+        await tasks.pop()
+
+    asyncio.run(run())
+    assert removed == ["index", "power"]
+    assert removed_from_registry == ["sensor.power"]
+    assert [(entity.unique_id, entity._tag) for entity in added] == [
+        ("index", "EAST"),
+        ("current", "IRMS1"),
+        ("power", "SINSTS"),
+        ("index", "BASE"),
+    ]
@@ -0,0 +1,31 @@
+"""Test the device path watcher."""
+
+import os
+
+import pytest
+
+from custom_components.linkytic.device_watcher import DeviceWatcher
+
+
+def test_device_appears(tmp_path):
+    by_id = tmp_path / "serial" / "by-id"
+    device = by_id / "usb-TIC_Reader-if00-port0"
+    for tty in ("ttyUSB0", "ttyUSB1"):
+        (tmp_path / tty).touch()
+    watcher = DeviceWatcher(str(device))
+    if not watcher.start():
+        pytest.skip("inotify is not available")
+    try:
+        assert not watcher.wait(0)
+        # udev creates the directories along with the first device: the watch follows them down
+        by_id.mkdir(parents=True)
+        assert not watcher.wait(1)
+        os.symlink(tmp_path / "ttyUSB0", device)
+        assert watcher.wait(1)
+        # Removed then back (USB re-enumeration)
+        device.unlink()
+        assert not watcher.wait(1)
+        os.symlink(tmp_path / "ttyUSB1", device)
+        assert watcher.wait(1)
+    finally:
+        watcher.close()
@@ -0,0 +1,50 @@
+"""Test the integration setup."""
+
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.linkytic import async_save_ticmode, serial_reader
+from custom_components.linkytic.const import (
+    SETUP_TICMODE,
+    STALL_FRAME_PERIODS,
+    TICMODE_HISTORIC,
+    TICMODE_STANDARD,
+)
+
+from .frames import build_stream
+from .test_serial_reader import feed, make_reader
+
+
+def test_ticmode_saved_back(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(serial_reader.time, "monotonic", lambda: now)
+    updates: list[dict[str, Any]] = []
+
+    def async_update_entry(entry, data: dict[str, Any]) -> None:
+        updates.append(data)
+        entry.data = data
+
+    hass = SimpleNamespace(
+        config_entries=SimpleNamespace(async_update_entry=async_update_entry)
+    )
+    entry = SimpleNamespace(title="test", data={SETUP_TICMODE: TICMODE_STANDARD})
+    reader = make_reader()
+    reader.register_reconfigure_notif(
+        lambda: async_save_ticmode(hass, entry, reader)  # type: ignore[arg-type]
+    )
+    reader._reconnected()
+    feed(reader, build_stream(2))
+    # Switched to the historic mode by the options: nothing to save while it is not validated
+    entry.data = {SETUP_TICMODE: TICMODE_HISTORIC}
+    reader.reconfigure(False, False, False)
+    now += reader._frame_period
+    reader._check_stall()
+    assert not reader.std_mode and updates == []
+    # Never validated: the standard mode read again is saved back
+    now += STALL_FRAME_PERIODS * reader._frame_period
+    reader._check_stall()
+    assert reader.std_mode
+    assert updates == [{SETUP_TICMODE: TICMODE_STANDARD}]
+    # Validated modes are the ones set already
+    reader.reconfigure(True, True, False)
+    assert updates == [{SETUP_TICMODE: TICMODE_STANDARD}]
@@ -0,0 +1,218 @@
+"""Test the TIC groups and frames parser."""
+
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from custom_components.linkytic.parser import (
+    FrameDecoder,
+    Group,
+    GroupStatus,
+    InvalidChecksum,
+    InvalidGroup,
+    convert_value,
+    decode_group,
+    parse_frame,
+    parse_group,
+    parse_timestamp,
+    split_groups,
+)
+
+from .frames import HISTORIC_FRAME, STANDARD_FRAME, build_frame, build_group
+
+
+def test_parse_group_standard():
+    assert parse_group(b"EAST\t024785324\t2", True) == Group("EAST", "024785324")
+    assert parse_group(build_group("SMAXSN", "04572", "E241017061924"), True) == (
+        Group("SMAXSN", "04572", "E241017061924")
+    )
+    # Values may contain spaces in standard mode
+    assert parse_group(build_group("LTARF", "    HP  BLEU    "), True) == Group(
+        "LTARF", "    HP  BLEU    "
+    )
+
+
+def test_parse_group_historic():
+    assert parse_group(b"PAPP 00750 -", False) == Group("PAPP", "00750")
+    # Checksum has the same value as the field separator
+    assert parse_group(b"IINST 009  ", False) == Group("IINST", "009")
+
+
+def test_parse_group_invalid():
+    with pytest.raises(InvalidChecksum) as exc_info:
+        parse_group(b"EAST\t024785325\t2", True)
+    assert exc_info.value.tag == "EAST"
+    assert exc_info.value.value == "024785325"
+    with pytest.raises(InvalidGroup):
+        parse_group(b"EAST\t024785324", True)
+    with pytest.raises(InvalidGroup):
+        parse_group(b"PAPP 00750 -", True)
+    with pytest.raises(InvalidGroup):
+        parse_group(b"", False)
+
+
+def test_decode_group():
+    assert decode_group(b"EAST\t024785324\t2", True) == (
+        GroupStatus.VALID,
+        Group("EAST", "024785324"),
+    )
+    for group, std_mode, status in (
+        (b"EAST\t024785325\t2", True, GroupStatus.INVALID_CHECKSUM),
+        (b"EAST\t024785324", True, GroupStatus.MALFORMED),
+        (b"PAPP 00750 -", True, GroupStatus.MALFORMED),
+        (b"\xc9AST\t024785324\t6", True, GroupStatus.NON_ASCII),
+        (
+            build_group("PAPP", "00 750", std_mode=False),
+            False,
+            GroupStatus.INVALID_FIELDS,
+        ),
+    ):
+        assert decode_group(group, std_mode) == (status, None)
+
+
+def test_parse_frame():
+    for std_mode, groups in ((True, STANDARD_FRAME), (False, HISTORIC_FRAME)):
+        frame = build_frame(groups, std_mode)
+        assert parse_frame(frame, std_mode) == [
+            Group(tag, value, timestamp) for tag, timestamp, value in groups
+        ]
+
+
+def test_parse_frame_skips_invalid_groups():
+    frame = bytearray(build_frame(HISTORIC_FRAME, False))
+    # Corrupt the value of the second group
+    frame[frame.index(b"HC..")] = ord("X")
+    groups = parse_frame(memoryview(frame), False)
+    assert [group.tag for group in groups] == [
+        tag for tag, _, _ in HISTORIC_FRAME if tag != "OPTARIF"
+    ]
+
+
+def test_split_groups_does_not_copy():
+    frame = bytearray(build_frame())
+    payloads = split_groups(frame)
+    assert len(payloads) == len(STANDARD_FRAME)
+    assert all(payload.obj is frame for payload in payloads)
+
+
+def test_convert_value():
+    assert convert_value("EAST", "024785324") == 24785324
+    assert convert_value("EASF07", "000000000") == 0
+    # Scaled to the catalog unit (kVA -> VA)
+    assert convert_value("PREF", "09") == 9000
+    assert convert_value("LTARF", "    HP  BLEU    ") == "HP BLEU"
+    # Unknown tags are kept as strings
+    assert convert_value("UNKNOWN", " 0012 ") == "0012"
+    with pytest.raises(ValueError):
+        convert_value("PAPP", "0A750")
+
+
+def test_parse_timestamp():
+    summer = parse_timestamp("E241017094512")
+    assert summer == datetime(
+        2024, 10, 17, 9, 45, 12, tzinfo=timezone(timedelta(hours=2))
+    )
+    assert summer.utcoffset() == timedelta(hours=2)
+    # Cached per distinct timestamp
+    assert parse_timestamp("E241017094512") is summer
+    # Degraded meter clock (lowercase flag) and winter time
+    assert parse_timestamp("h241217094512").utcoffset() == timedelta(hours=1)
+    # No season flag: legal time of France
+    assert parse_timestamp(" 240717094512").utcoffset() == timedelta(hours=2)
+    for invalid in ("E2410170945", "E241317094512", "E24101709451X"):
+        with pytest.raises(ValueError):
+            parse_timestamp(invalid)
+
+
+def decode(*chunks: bytes) -> list:
+    """Decode the chunks of a stream: groups payloads and frame ends (True if complete)."""
+    events: list = []
+    decoder = FrameDecoder(events.append, events.append)
+    for chunk in chunks:
+        decoder.feed(chunk)
+    return events
+
+
+def test_frame_decoder():
+    frame = build_frame(HISTORIC_FRAME, False)
+    groups = [
+        build_group(tag, value, std_mode=False) for tag, _, value in HISTORIC_FRAME
+    ]
+    # The first frame is read from its middle: incomplete
+    stream = frame[20:] + frame
+    events = decode(stream)
+    assert events[-len(groups) - 1 :] == [*groups, True]
+    assert events.count(False) == 1
+    # Any chunk size
+    assert decode(*(stream[i : i + 7] for i in range(0, len(stream), 7))) == events
+
+
+def test_frame_decoder_resync():
+    frame = build_frame(HISTORIC_FRAME, False)
+    groups = [
+        build_group(tag, value, std_mode=False) for tag, _, value in HISTORIC_FRAME
+    ]
+    # Each case follows a first frame read without its STX (incomplete)
+    # Lost CR: the two groups are not smeared together, only one is lost
+    lost_cr = frame.replace(groups[2] + b"\r", groups[2], 1)
+    assert decode(frame, lost_cr) == [*groups, False, *groups[:2], *groups[3:], False]
+    # Lost LF: the group is lost
+    lost_lf = frame.replace(b"\n" + groups[2], groups[2], 1)
+    assert decode(frame, lost_lf) == [*groups, False, *groups[:2], *groups[3:], False]
+    # Lost ETX: the frame ends at the next STX
+    lost_etx = frame.replace(b"\x03", b"")
+    assert decode(frame, lost_etx, frame) == [
+        *groups,
+        False,
+        *groups,
+        False,
+        *groups,
+        True,
+    ]
+    # Lost STX: the next frame is not complete
+    lost_stx = frame.replace(b"\x02", b"")
+    assert decode(frame, lost_stx, frame) == [
+        *groups,
+        False,
+        *groups,
+        True,
+        *groups,
+        False,
+    ]
+    # Interrupted frame (EOT)
+    interrupted = frame[:30] + b"\x04" + frame[-2:]
+    assert decode(frame, interrupted, frame) == [
+        *groups,
+        False,
+        groups[0],
+        False,
+        *groups,
+        True,
+    ]
+
+
+# Loads the parser as a package of its own (the integration directory, without its __init__), Home Assistant and
+# pyserial being unavailable
+STANDALONE_PARSER = """
+import sys, types
+sys.modules["homeassistant"] = sys.modules["serial"] = None
+tic = types.ModuleType("tic")
+tic.__path__ = [sys.argv[1]]
+sys.modules["tic"] = tic
+from tic.parser import parse_frame
+print(parse_frame(b"\\nPAPP 00750 -\\r", False))
+"""
+
+
+def test_parser_standalone():
+    integration_dir = Path(__file__).parent.parent / "custom_components" / "linkytic"
+    result = subprocess.run(
+        [sys.executable, "-c", STANDALONE_PARSER, str(integration_dir)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[Group(tag='PAPP', value='00750', timestamp=None)]"
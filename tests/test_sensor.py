@@ -0,0 +1,183 @@
+"""Test the sensor entities."""
+
+import asyncio
+from types import SimpleNamespace
+
+from homeassistant.components.sensor import SensorExtraStoredData
+from homeassistant.components.sensor.const import SensorStateClass
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import State
+
+from custom_components.linkytic import sensor
+from custom_components.linkytic.const import DEADBAND_MAX_SILENCE, DOMAIN
+from custom_components.linkytic.sensor import (
+    ApparentPowerSensor,
+    EnergyIndexSensor,
+    LinkyTICSensor,
+    VoltageSensor,
+)
+from custom_components.linkytic.serial_reader import LinkyTICReader
+
+from .frames import build_group, build_stream
+from .test_serial_reader import feed, make_reader
+
+
+def test_deadband():
+    reader = make_reader()
+    papp = ApparentPowerSensor(
+        tag="SINSTS",
+        name="Puissance app. instantanée soutirée",
+        config_title="test",
+        config_uniq_id="test",
+        serial_reader=reader,
+        state_class=SensorStateClass.MEASUREMENT,
+    )
+    # First value and unavailability are always published
+    assert not papp._within_deadband(None, 1000)
+    assert not papp._within_deadband(1000, None)
+    # Absolute deadband on small values, relative one on large values
+    assert papp._within_deadband(100, 119)
+    assert not papp._within_deadband(100, 120)
+    assert papp._within_deadband(5000, 5099)
+    assert not papp._within_deadband(5000, 4900)
+    # Non measurement sensors (maximums, settings) are always published
+    pref = ApparentPowerSensor(
+        tag="PREF",
+        name="Puissance app. de référence",
+        config_title="test",
+        config_uniq_id="test",
+        serial_reader=reader,
+    )
+    assert not pref._within_deadband(9000, 9001)
+    # Deadbands are set per class in the options
+    urms = VoltageSensor(
+        tag="URMS1",
+        name="Tension efficace",
+        config_title="test",
+        config_uniq_id="test",
+        serial_reader=reader,
+        state_class=SensorStateClass.MEASUREMENT,
+    )
+    assert not urms._within_deadband(230, 233)
+    urms._coordinator = SimpleNamespace(deadbands={"voltage": (5, 0, 60)})  # type: ignore[assignment]
+    assert urms._within_deadband(230, 234)
+    assert not urms._within_deadband(230, 225)
+
+
+def test_deadband_publishing(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(sensor.time, "monotonic", lambda: now)
+    heartbeats: list[tuple[float, object]] = []
+    cancelled: list[float] = []
+
+    def call_later(hass, delay, action):
+        heartbeats.append((delay, action))
+        return lambda: cancelled.append(delay)
+
+    monkeypatch.setattr(sensor, "async_call_later", call_later)
+    reader = make_reader()
+    papp = ApparentPowerSensor(
+        tag="SINSTS",
+        name="Puissance app. instantanée soutirée",
+        config_title="test",
+        config_uniq_id="test",
+        serial_reader=reader,
+        state_class=SensorStateClass.MEASUREMENT,
+    )
+    papp.hass = SimpleNamespace()  # type: ignore[assignment]
+    written: list[int | None] = []
+    papp.async_write_ha_state = lambda: written.append(papp.native_value)  # type: ignore[method-assign]
+
+    def read(sinsts: str) -> None:
+        feed(
+            reader,
+            build_stream(1).replace(
+                build_group("SINSTS", "00974"), build_group("SINSTS", sinsts)
+            ),
+        )
+        papp.async_handle_notification(False)
+
+    feed(reader, build_stream(1))
+    read("00974")
+    assert written == [974]
+    # Small variation: held back, published by the heartbeat after the max silence unless a larger one comes first
+    now += 10
+    read("00990")
+    assert written == [974] and papp.native_value == 974
+    assert heartbeats[0][0] == DEADBAND_MAX_SILENCE - 10
+    read("01000")
+    assert written == [974, 1000] and cancelled == [DEADBAND_MAX_SILENCE - 10]
+    read("01010")
+    assert written == [974, 1000]
+    _, heartbeat = heartbeats[1]
+    heartbeat(None)  # type: ignore[operator]
+    assert written == [974, 1000, 1010]
+    # Unavailability is published right away
+    reader._reader.close()  # type: ignore[union-attr]
+    reader._reset_state()
+    papp.async_handle_notification(False)
+    assert len(written) == 4 and not papp.available
+
+
+def restore(entity: LinkyTICSensor, state: str, native_value: object) -> None:
+    """Add a sensor to a mocked hass, restoring the given last state and sensor data."""
+    entity.hass = SimpleNamespace(  # type: ignore[assignment]
+        data={DOMAIN: {"entry": SimpleNamespace(async_add_listener=lambda *_: None)}}
+    )
+    entity.platform = SimpleNamespace(config_entry=SimpleNamespace(entry_id="entry"))  # type: ignore[assignment]
+
+    async def async_get_last_state() -> State:
+        return State("sensor.test", state)
+
+    async def async_get_last_sensor_data() -> SensorExtraStoredData:
+        return SensorExtraStoredData(native_value, None)  # type: ignore[arg-type]
+
+    entity.async_get_last_state = async_get_last_state  # type: ignore[method-assign]
+    entity.async_get_last_sensor_data = async_get_last_sensor_data  # type: ignore[method-assign]
+    asyncio.run(entity.async_added_to_hass())
+
+
+def make_east(reader: LinkyTICReader) -> EnergyIndexSensor:
+    return EnergyIndexSensor(
+        tag="EAST",
+        name="Energie active soutirée totale",
+        config_title="test",
+        config_uniq_id="test",
+        serial_reader=reader,
+    )
+
+
+def test_restored_value_superseded():
+    reader = make_reader()
+    east = make_east(reader)
+    restore(east, "24780000", 24780000)
+    # Restored value: stale until a live one is read
+    assert east.native_value == 24780000 and east.available
+    assert east.extra_state_attributes == {"valeur restaurée": True}
+    east.update()
+    assert east.native_value == 24780000 and east._stale
+    feed(reader, build_stream(1))
+    east.update()
+    assert east.native_value == 24785324
+    assert not east._stale and east.extra_state_attributes is None
+
+
+def test_restored_unavailable():
+    reader = make_reader()
+    east = make_east(reader)
+    # A sensor unavailable when stopped stays so until a live value is read
+    restore(east, STATE_UNAVAILABLE, None)
+    assert not east.available and east.native_value is None
+    assert east.extra_state_attributes is None
+    feed(reader, build_stream(1))
+    east.update()
+    assert east.available and east.native_value == 24785324
+
+
+def test_read_value_not_restored():
+    reader = make_reader()
+    feed(reader, build_stream(1))
+    east = make_east(reader)
+    # A value read before the sensor is added is not overwritten by the restored one
+    restore(east, "24780000", 24780000)
+    assert east.native_value == 24785324 and not east._stale
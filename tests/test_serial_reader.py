@@ -0,0 +1,787 @@
+"""Test the serial reader frame handling."""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import serial
+
+from custom_components.linkytic import serial_reader
+from custom_components.linkytic.const import (
+    DID_REGNUMBER,
+    DID_TYPE_CODE,
+    HOLDOVER_DEFAULT,
+    INVALID_GROUPS_LOG_INTERVAL,
+    LANES_DEFAULT_INTERVALS,
+    MODE_STANDARD_BAUD_RATE,
+    MODE_STANDARD_FRAME_SIZE,
+    OPTIONS_LANE_SLOW,
+    POLLING_INTERVAL,
+    READER_STOP_TIMEOUT,
+    RECONNECT_DELAY_MAX,
+    RECONNECT_DELAY_MIN,
+    RECONNECT_FAILURE_ATTEMPTS,
+    STALL_FRAME_PERIODS,
+)
+from custom_components.linkytic.parser import GroupStatus
+from custom_components.linkytic.serial_reader import LinkyTICReader
+
+from .frames import STANDARD_FRAME, build_group, build_stream
+
+
+class FakeSerial:
+    """Minimal opened serial port."""
+
+    is_open = True
+
+    def close(self) -> None:
+        """Close the port."""
+        self.is_open = False
+
+
+def make_reader(
+    std_mode: bool = True, serial_number: str | None = None, real_time: bool = False
+) -> LinkyTICReader:
+    """Build a reader fed by hand with feed()."""
+    reader = LinkyTICReader(
+        title="test",
+        port=None,
+        std_mode=std_mode,
+        producer_mode=False,
+        three_phase=False,
+        real_time=real_time,
+        serial_number=serial_number,
+    )
+    reader._reader = FakeSerial()  # type: ignore[assignment]
+    return reader
+
+
+def feed(reader: LinkyTICReader, data: bytes) -> None:
+    """Feed raw bytes to the reader, as read from the serial connection."""
+    reader._decoder.feed(data)
+
+
+def test_values_published_per_frame():
+    reader = make_reader()
+    stream = build_stream(2)
+    # First frame is read from its middle: until a complete frame is published, values are read live
+    first_frame_end = stream.index(b"\x03\x02") + 2
+    feed(reader, stream[:first_frame_end])
+    assert not reader.has_read_full_frame
+    assert reader.get_values("EAST") == ("024785324", None)
+    assert reader.serial_number == "041876097147"
+    # End of the second frame: the whole frame is published at once
+    feed(reader, stream[first_frame_end:])
+    assert reader.has_read_full_frame
+    assert reader.get_values("IRMS1") == ("004", None)
+    assert reader.get_values("SMAXSN") == ("04572", "E241017061924")
+    # Half of the next frame: the snapshot is still the last complete frame, the live values move on
+    next_frame = build_stream(1).replace(
+        build_group("IRMS1", "004"), build_group("IRMS1", "005")
+    )
+    middle = next_frame.index(b"URMS1")
+    feed(reader, next_frame[:middle])
+    assert reader.get_values("IRMS1") == ("004", None)
+    assert reader.get_values("IRMS1", live=True) == ("005", None)
+    feed(reader, next_frame[middle:])
+    assert reader.get_values("IRMS1") == ("005", None)
+
+
+def test_stores_recycled():
+    reader = make_reader()
+    feed(reader, build_stream(1))
+    snapshots = []
+    for _ in range(6):
+        feed(reader, build_stream(1))
+        snapshots.append(reader._values)
+        assert reader.get_values("EAST") == ("024785324", None)
+    # Three stores in turn: the snapshot, the frame being read and the snapshot retired a frame ago
+    assert len({id(store) for store in snapshots}) == 3
+    assert snapshots[0] is snapshots[3] and reader._values is not reader._retired_values
+
+
+def test_versions_change_with_values():
+    reader = make_reader()
+    feed(reader, build_stream(2))
+    _, _, east_version = reader.get_versioned_values("EAST")
+    _, _, irms_version = reader.get_versioned_values("IRMS1")
+    assert east_version and irms_version and east_version != irms_version
+    # Same frame again: nothing changes
+    feed(reader, build_stream(1))
+    assert reader.get_versioned_values("EAST")[2] == east_version
+    assert reader.get_versioned_values("IRMS1")[2] == irms_version
+    # IRMS1 changes: only its version moves, and it moves forward
+    feed(
+        reader,
+        build_stream(1).replace(
+            build_group("IRMS1", "004"), build_group("IRMS1", "005")
+        ),
+    )
+    assert reader.get_versioned_values("EAST")[2] == east_version
+    value, _, version = reader.get_versioned_values("IRMS1")
+    assert value == "005" and version > irms_version
+    assert reader.get_versioned_values("PAPP") == (None, None, 0)
+
+
+class FakeLoop:
+    """Event loop recording the callbacks scheduled from the reader thread."""
+
+    def __init__(self) -> None:
+        """Init the fake loop."""
+        self.scheduled: list = []
+
+    def call_soon_threadsafe(self, callback, *args) -> None:
+        """Record a scheduled callback."""
+        self.scheduled.append((callback, args))
+
+
+def test_notifications_coalesced_per_frame():
+    reader = make_reader(real_time=True)
+    loop = FakeLoop()
+    reader._loop = loop  # type: ignore[assignment]
+    notified: list[dict[str, bool] | None] = []
+    reader.register_push_notif(notified.append)
+    feed(reader, build_stream(2))
+    # Nothing called from the reader itself
+    assert notified == []
+    for scheduled_callback, args in loop.scheduled:
+        scheduled_callback(*args)
+    loop.scheduled.clear()
+    # First frame: every tag read is new and notified right away (no complete frame yet)
+    assert notified[:-1] == [{tag: False} for tag, _, _ in STANDARD_FRAME]
+    # Second frame: first full frame, everything must be refreshed
+    assert notified[-1] is None
+    # Only changed values are notified
+    notified.clear()
+    feed(reader, build_stream(1))
+    assert loop.scheduled == []
+    feed(
+        reader,
+        build_stream(1).replace(
+            build_group("IRMS1", "004"), build_group("IRMS1", "005")
+        ),
+    )
+    assert len(loop.scheduled) == 1
+    scheduled_callback, args = loop.scheduled.pop()
+    scheduled_callback(*args)
+    assert notified == [{"IRMS1": False}]
+
+
+def test_rate_lanes(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(serial_reader.time, "monotonic", lambda: now)
+    reader = make_reader(real_time=True)
+    notified: list[dict[str, bool] | None] = []
+    reader.register_push_notif(notified.append)
+    feed(reader, build_stream(2))
+    notified.clear()
+    # Voltage (slow lane) changes within the interval of its first notification are deferred
+    for urms in ("237", "238"):
+        feed(
+            reader,
+            build_stream(1).replace(
+                build_group("URMS1", "236"), build_group("URMS1", urms)
+            ),
+        )
+    assert notified == []
+    # Then notified at the first frame end once the interval has elapsed
+    now += LANES_DEFAULT_INTERVALS[OPTIONS_LANE_SLOW]
+    same_voltage = build_stream(1).replace(
+        build_group("URMS1", "236"), build_group("URMS1", "238")
+    )
+    feed(reader, same_voltage)
+    assert notified == [{"URMS1": False}]
+    # Current (fast lane) changes are notified right away
+    notified.clear()
+    for irms in ("005", "006"):
+        feed(
+            reader,
+            same_voltage.replace(
+                build_group("IRMS1", "004"), build_group("IRMS1", irms)
+            ),
+        )
+    assert notified == [{"IRMS1": False}, {"IRMS1": False}]
+    # Without real time, every lane is notified at the polling interval at most
+    notified.clear()
+    reader.update_options(False, None)
+    for irms in ("007", "008"):
+        feed(
+            reader,
+            same_voltage.replace(
+                build_group("IRMS1", "004"), build_group("IRMS1", irms)
+            ),
+        )
+    assert notified == [{"IRMS1": False}]
+    notified.clear()
+    now += POLLING_INTERVAL
+    feed(reader, same_voltage)
+    assert notified == [{"IRMS1": False}]
+
+
+def test_decoded_status_shared():
+    reader = make_reader()
+    feed(reader, build_stream(2))
+    decoded = reader.get_decoded_status()
+    assert decoded is not None and decoded.register == 0x013AC501
+    # Decoded once per value
+    assert reader.get_decoded_status() is decoded
+    assert reader.get_decoded_status(live=True) is decoded
+    feed(
+        reader,
+        build_stream(1).replace(
+            build_group("STGE", "013AC501"), build_group("STGE", "053AC501")
+        ),
+    )
+    assert reader.get_decoded_status().register == 0x053AC501
+
+
+def test_status_changes():
+    reader = make_reader()
+    status_changes: list[dict] = []
+    reader.register_status_notif(status_changes.append)
+    feed(reader, build_stream(2))
+    assert status_changes == []
+    # Tomorrow is announced blue
+    feed(
+        reader,
+        build_stream(1).replace(
+            build_group("STGE", "013AC501"), build_group("STGE", "053AC501")
+        ),
+    )
+    assert status_changes == [
+        {
+            "serial_number": "041876097147",
+            "before": "013AC501",
+            "after": "053AC501",
+            "changes": {
+                "couleur_lendemain_contrat_tempo": {
+                    "before": "Pas d'annonce",
+                    "after": "Bleu",
+                }
+            },
+        }
+    ]
+
+
+def test_typed_values():
+    reader = make_reader()
+    # A current that can not be converted is rejected
+    feed(
+        reader,
+        build_stream(2).replace(
+            build_group("IRMS1", "004"), build_group("IRMS1", "0X4")
+        ),
+    )
+    assert reader.get_typed_values("IRMS1") == (None, None, 0)
+    feed(reader, build_stream(1))
+    assert reader.get_typed_values("IRMS1")[0] == 4
+    assert reader.get_typed_values("PREF")[0] == 9000
+    assert reader.get_typed_values("NGTF")[0] == "TEMPO"
+    assert reader.get_typed_values("SMAXSN")[:2] == (
+        4572,
+        datetime(2024, 10, 17, 6, 19, 24, tzinfo=timezone(timedelta(hours=2))),
+    )
+    # A group whose timestamp can not be parsed only drops its tag, without any new version
+    version = reader._version
+    feed(
+        reader,
+        build_stream(1).replace(
+            build_group("UMOY1", "235", "E241017094000"),
+            build_group("UMOY1", "236", "E241017099900"),
+        ),
+    )
+    assert reader.get_typed_values("UMOY1") == (None, None, 0)
+    assert reader._version == version
+    feed(reader, build_stream(1))
+    assert reader.get_typed_values("UMOY1")[0] == 235
+
+
+def test_unconvertible_value_dropped(caplog):
+    reader = make_reader()
+    # Only the tag is dropped: its frame is still complete and published
+    feed(
+        reader,
+        build_stream(3).replace(
+            build_group("IRMS1", "004"), build_group("IRMS1", "0X4")
+        ),
+    )
+    assert reader.has_read_full_frame
+    assert reader._frames_read > 0
+    assert reader.get_values("IRMS1") == (None, None)
+    assert reader.get_values("PREF")[0] == "09"
+    assert reader._invalid_groups.get(GroupStatus.INVALID_VALUE)
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
+
+
+def test_invalid_groups_reported(monkeypatch, caplog):
+    now = 1000.0
+    monkeypatch.setattr(serial_reader.time, "monotonic", lambda: now)
+    reader = make_reader()
+    corrupted = build_stream(2).replace(
+        build_group("IRMS1", "004"), build_group("IRMS1", "004")[:-1] + b"X"
+    )
+    # The first invalid group is reported right away, the following ones are aggregated
+    feed(reader, corrupted)
+    reports = [r for r in caplog.records if "invalid group" in r.getMessage()]
+    assert len(reports) == 1
+    assert "invalid_checksum: 1" in reports[0].getMessage()
+    caplog.clear()
+    feed(reader, corrupted)
+    assert not [r for r in caplog.records if "invalid group" in r.getMessage()]
+    # Once the interval has elapsed, the next frame end reports them
+    now += INVALID_GROUPS_LOG_INTERVAL
+    feed(reader, build_stream(1))
+    reports = [r for r in caplog.records if "invalid group" in r.getMessage()]
+    assert len(reports) == 1
+    assert "3 invalid group(s)" in reports[0].getMessage()
+
+
+def test_truncated_frame_merged():
+    reader = make_reader()
+    feed(reader, build_stream(2))
+    assert reader._frames_read == 1
+    # A frame losing a group end (CR) publishes its valid groups over the previous complete frame
+    truncated = (
+        build_stream(1)
+        .replace(build_group("EAST", "024785324"), build_group("EAST", "024785325"))
+        .replace(build_group("IRMS1", "004") + b"\r", build_group("IRMS1", "004"))
+    )
+    feed(reader, truncated)
+    assert reader._frames_read == 1
+    assert reader.get_values("EAST") == ("024785325", None)
+    # The group lost keeps its previous value: it is not considered as missing from the frame
+    assert reader.get_values("IRMS1") == ("004", None)
+    assert reader.get_values("IRMS1", live=True) == ("004", None)
+    # A frame with a rejected group is merged as well
+    corrupted = build_stream(1).replace(
+        build_group("EAST", "024785324"), build_group("EAST", "024785326")
+    )
+    corrupted = corrupted.replace(
+        build_group("IRMS1", "004"), build_group("IRMS1", "005")[:-1] + b"X"
+    )
+    feed(reader, corrupted)
+    assert reader._frames_read == 1
+    assert reader.get_values("EAST") == ("024785326", None)
+    assert reader.get_values("IRMS1") == ("004", None)
+    # Back in sync with the next frame
+    feed(reader, build_stream(1))
+    assert reader._frames_read == 2
+    assert reader.get_values("IRMS1") == ("004", None)
+
+
+def test_holdover(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(serial_reader.time, "monotonic", lambda: now)
+    reader = make_reader()
+    notified: list[dict[str, bool] | None] = []
+    reader.register_push_notif(notified.append)
+    stream = build_stream(2)
+    feed(reader, stream)
+    notified.clear()
+    # A serial error drops the frame being read, values stay valid and nobody is notified
+    cut = len(stream) * 3 // 4
+    feed(reader, stream[:cut])
+    reader._drop_connection()
+    assert reader.get_values("EAST") == ("024785324", None)
+    assert reader.serial_number == "041876097147"
+    assert notified == []
+    # Back within the window: the values are kept, the partial frame is not merged with the next one
+    now += HOLDOVER_DEFAULT - 1
+    reader._check_holdover()
+    reader._reader.is_open = True  # type: ignore[union-attr]
+    reader._reconnected()
+    feed(reader, stream[cut:])
+    assert reader._frames_read == 2
+    feed(reader, build_stream(1))
+    assert reader._frames_read == 3
+    assert reader.get_values("EAST") == ("024785324", None)
+    # Not back once the window has expired: the values are cleared and every consumer refreshes
+    reader._connection_lost()
+    now += HOLDOVER_DEFAULT
+    reader._check_holdover()
+    assert reader.get_values("EAST") == (None, None)
+    assert not reader.has_read_full_frame
+    assert notified == [None]
+
+
+def test_reconnect_backoff(monkeypatch, caplog):
+    monkeypatch.setattr(serial_reader.random, "uniform", lambda low, high: high)
+    reader = make_reader()
+    notified: list[dict[str, bool] | None] = []
+    reader.register_push_notif(notified.append)
+    delays = []
+    for _ in range(RECONNECT_FAILURE_ATTEMPTS):
+        delays.append(reader._reconnect_delay())
+        reader._reconnect_failed()
+    # Exponential backoff, capped
+    assert delays[:3] == [
+        RECONNECT_DELAY_MIN,
+        2 * RECONNECT_DELAY_MIN,
+        4 * RECONNECT_DELAY_MIN,
+    ]
+    reader._reconnect_attempts = reader._backoff_attempts = 100
+    assert reader._reconnect_delay() == RECONNECT_DELAY_MAX
+    reader._reconnect_attempts = reader._backoff_attempts = RECONNECT_FAILURE_ATTEMPTS
+    # The device path appearing again restarts the backoff, not the failure
+    reader._device_back()
+    assert reader._reconnect_delay() == RECONNECT_DELAY_MIN
+    reader._reconnect_failed()
+    assert reader._reconnect_delay() == 2 * RECONNECT_DELAY_MIN
+    # The failure is logged once and shown by a refresh, as its recovery
+    assert reader.connection_failed
+    assert len([r for r in caplog.records if r.levelname != "DEBUG"]) == 2
+    assert notified == [None]
+    reader._reconnected()
+    assert not reader.connection_failed
+    assert notified == [None, None]
+
+
+def test_stall_watchdog(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(serial_reader.time, "monotonic", lambda: now)
+    reader = make_reader()
+    notified: list[dict[str, bool] | None] = []
+    reader.register_push_notif(notified.append)
+    reader._reconnected()
+    feed(reader, build_stream(2))
+    notified.clear()
+    # Silent line: stalled after a few frame periods
+    stall_delay = (
+        STALL_FRAME_PERIODS * MODE_STANDARD_FRAME_SIZE * 10 / MODE_STANDARD_BAUD_RATE
+    )
+    now += stall_delay - 1
+    reader._check_stall()
+    assert reader.is_connected and not reader.stalled
+    now += 1
+    reader._check_stall()
+    assert reader.stalled and reader.stalls == 1
+    assert not reader.is_connected and not reader._reader.is_open  # type: ignore[union-attr]
+    assert notified == [None]
+    # Values are held over, the link is back with the first valid group read
+    assert reader.get_values("EAST") == ("024785324", None)
+    reader._reader.is_open = True  # type: ignore[union-attr]
+    reader._reconnected()
+    feed(reader, build_stream(1))
+    assert not reader.stalled and reader.is_connected
+    assert notified == [None, None]
+    # A noisy line (frames truncated by rejected groups) is still live
+    noisy = build_stream(1).replace(
+        build_group("IRMS1", "004"), build_group("IRMS1", "005")[:-1] + b"X"
+    )
+    frames_read = reader._frames_read
+    for _ in range(4):
+        now += stall_delay - 1
+        feed(reader, noisy)
+        reader._check_stall()
+    assert not reader.stalled and reader.stalls == 1
+    assert reader._frames_read == frames_read
+    # Valid groups without any frame end (lost frame boundaries) stall the link
+    now += 2 * stall_delay
+    reader._last_group_at = now
+    reader._check_stall()
+    assert reader.stalled and reader.stalls == 2
+
+
+def test_mode_handover(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(serial_reader.time, "monotonic", lambda: now)
+    reader = make_reader(std_mode=False)
+    reconfigured: list[bool] = []
+    reader.register_reconfigure_notif(lambda: reconfigured.append(reader.std_mode))
+    reader._reconnected()
+    feed(reader, build_stream(2, std_mode=False))
+    # The flags apply right away, the producer mode with the standard mode only
+    reader.reconfigure(False, True, True)
+    assert reader.three_phase and not reader.producer_mode
+    assert reconfigured == [False]
+    # The mode is handed over at the next frame boundary, at its baud rate
+    reader.reconfigure(True, True, True)
+    stream = build_stream(1, std_mode=False)
+    cut = len(stream) * 3 // 4
+    feed(reader, stream[:cut])
+    assert not reader.std_mode
+    feed(reader, stream[cut:])
+    assert reader.std_mode and reader.producer_mode
+    assert reader._reader.baudrate == MODE_STANDARD_BAUD_RATE  # type: ignore[union-attr]
+    assert reconfigured == [False]
+    # Validated by the first complete frame read in the new mode
+    feed(reader, build_stream(2))
+    assert reconfigured == [False, True]
+    assert reader.get_values("EAST") == ("024785324", None)
+    # Back to the previous mode if no frame can be read in the new one
+    reader.reconfigure(False, True, True)
+    now += reader._frame_period
+    reader._check_stall()
+    assert not reader.std_mode and not reader.producer_mode
+    assert not reader.mode_validated
+    now += STALL_FRAME_PERIODS * reader._frame_period
+    reader._check_stall()
+    assert reader.std_mode and reader.producer_mode and not reader.stalled
+    assert reader.mode_validated and reconfigured == [False, True, True]
+
+
+def test_wait_serial_number():
+    async def wait_serial_number() -> None:
+        reader = make_reader()
+        loop = asyncio.get_running_loop()
+        reader._loop = loop
+        reader._identified = loop.create_future()
+        # A waiter timing out does not prevent the next ones to be resolved
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(reader.async_wait_serial_number(), timeout=0.01)
+        waiter = asyncio.ensure_future(reader.async_wait_serial_number())
+        # Resolved (from the reader thread) as soon as the ADSC group is read
+        stream = build_stream(1)
+        feed(reader, stream[: stream.index(b"VTIC")])
+        assert await asyncio.wait_for(waiter, timeout=1) == "041876097147"
+        assert await reader.async_wait_serial_number() == "041876097147"
+
+    asyncio.run(wait_serial_number())
+
+
+def test_saved_serial_number():
+    # Identified by the serial number saved before anything is read
+    reader = make_reader(serial_number="041876097147")
+    assert reader.serial_number is None
+    assert reader.device_identification[DID_REGNUMBER] == "097147"
+    feed(reader, build_stream(1))
+    assert reader.serial_number == "041876097147"
+    # Replaced meter: identified by the serial number read
+    reader = make_reader(serial_number="041861234567")
+    assert reader.device_identification[DID_TYPE_CODE] == "61"
+    feed(reader, build_stream(1))
+    assert reader.serial_number == "041876097147"
+    assert reader.device_identification[DID_REGNUMBER] == "097147"
+    assert reader.device_identification[DID_TYPE_CODE] == "76"
+
+
+def make_pty_reader(slave: int) -> LinkyTICReader:
+    """Build a reader of the slave side of a pseudo terminal, fed by writing to its master side."""
+    return LinkyTICReader(
+        title="test",
+        port=os.ttyname(slave),
+        std_mode=True,
+        producer_mode=False,
+        three_phase=False,
+    )
+
+
+def reopenable_pty(monkeypatch) -> None:
+    """Open pseudo terminals in 8N1, reconnecting right away: once set, their line settings can not be changed to 7E1 again (on reopen, or with the read timeout)."""
+    monkeypatch.setattr(serial_reader, "BYTESIZE", serial.EIGHTBITS)
+    monkeypatch.setattr(serial_reader, "PARITY", serial.PARITY_NONE)
+    monkeypatch.setattr(serial_reader, "RECONNECT_DELAY_MIN", 0.01)
+
+
+async def wait_for(predicate: Callable[[], bool]) -> None:
+    """Wait (READER_STOP_TIMEOUT at most) for a condition to be met, letting the event loop run."""
+    deadline = time.monotonic() + READER_STOP_TIMEOUT
+    while not predicate():
+        assert time.monotonic() < deadline
+        await asyncio.sleep(0.01)
+
+
+def test_loop_transport():
+    async def read_frames() -> None:
+        master, slave = os.openpty()
+        try:
+            reader = make_pty_reader(slave)
+            await reader.async_start(asyncio.get_running_loop())
+            # Read from the event loop, without any thread
+            assert reader._loop_transport and not reader.is_alive()
+            # Reads never block the event loop, even woken up without any byte to read
+            started = time.monotonic()
+            reader._on_readable()
+            assert time.monotonic() - started < 0.5
+            os.write(master, build_stream(2))
+            await wait_for(lambda: reader.has_read_full_frame)
+            assert reader.get_values("EAST") == ("024785324", None)
+            await reader.async_stop("test")
+            assert not reader._reader.is_open  # type: ignore[union-attr]
+        finally:
+            os.close(master)
+            os.close(slave)
+
+    asyncio.run(read_frames())
+
+
+def test_loop_transport_reopened(monkeypatch):
+    reopenable_pty(monkeypatch)
+
+    async def reopen() -> None:
+        master, slave = os.openpty()
+        try:
+            reader = make_pty_reader(slave)
+            await reader.async_start(asyncio.get_running_loop())
+            port = reader._reader
+            assert port is not None
+
+            def read_error(size: int) -> bytes:
+                del port.read
+                raise serial.SerialException("device disconnected")
+
+            port.read = read_error  # type: ignore[method-assign]
+            os.write(master, build_stream(1))
+            # Dropped, then reopened and registered again within the event loop
+            await wait_for(lambda: reader._reopen_task is not None)
+            await wait_for(lambda: reader._fd is not None)
+            assert port.is_open and reader._reopen_task.done()  # type: ignore[union-attr]
+            os.write(master, build_stream(2))
+            await wait_for(lambda: reader.has_read_full_frame)
+            assert reader.is_connected and reader.get_values("EAST")[0] == "024785324"
+            await reader.async_stop("test")
+        finally:
+            os.close(master)
+            os.close(slave)
+
+    asyncio.run(reopen())
+
+
+class FakeWatcher:
+    """Device path watcher whose path appears when told to (see appear())."""
+
+    def __init__(self) -> None:
+        self._read, self._write = os.pipe()
+
+    def appear(self) -> None:
+        os.write(self._write, b"\0")
+
+    def fileno(self) -> int:
+        return self._read
+
+    def check(self) -> bool:
+        return bool(os.read(self._read, 1))
+
+    def close(self) -> None:
+        os.close(self._read)
+        os.close(self._write)
+
+
+def test_device_back(monkeypatch):
+    reopenable_pty(monkeypatch)
+    monkeypatch.setattr(serial_reader.random, "uniform", lambda low, high: high)
+
+    async def reopen() -> None:
+        master, slave = os.openpty()
+        try:
+            reader = make_pty_reader(slave)
+            await reader.async_start(asyncio.get_running_loop())
+            port = reader._reader
+            assert port is not None
+            watcher = FakeWatcher()
+            reader._watcher = watcher  # type: ignore[assignment]
+            # Reconnection failing for a while: the backoff has grown to seconds
+            reader._reconnect_attempts = reader._backoff_attempts = 8
+            open_port = port.open
+            opened: list[bool] = []
+
+            def open_once_ready() -> None:
+                # The device path appears before the device can be opened
+                opened.append(bool(opened))
+                if len(opened) == 1:
+                    raise serial.SerialException("permission denied")
+                open_port()
+
+            port.open = open_once_ready  # type: ignore[method-assign]
+            reader._drop_connection()
+            await asyncio.sleep(0.05)
+            assert not opened
+            appeared_at = time.monotonic()
+            watcher.appear()
+            # The next attempts do not wait for the long delay reached before
+            await wait_for(lambda: reader._fd is not None)
+            assert opened == [False, True]
+            assert time.monotonic() - appeared_at < 1
+            assert reader._reconnect_attempts == 0 and reader._watcher is None
+            await reader.async_stop("test")
+        finally:
+            os.close(master)
+            os.close(slave)
+
+    asyncio.run(reopen())
+
+
+def test_thread_fallback(monkeypatch):
+    def fileno(self) -> int:
+        raise OSError("not pollable")
+
+    # URL handlers (rfc2217://...) have no file descriptor to watch
+    monkeypatch.setattr(serial.Serial, "fileno", fileno)
+    # The read timeout is set back once the port is open
+    reopenable_pty(monkeypatch)
+
+    async def read_frames() -> None:
+        master, slave = os.openpty()
+        try:
+            reader = make_pty_reader(slave)
+            await reader.async_start(asyncio.get_running_loop())
+            assert reader.is_alive() and not reader._loop_transport
+            os.write(master, build_stream(2))
+            await wait_for(lambda: reader.has_read_full_frame)
+            assert reader.get_values("EAST") == ("024785324", None)
+            await reader.async_stop("test")
+            assert not reader.is_alive()
+        finally:
+            os.close(master)
+            os.close(slave)
+
+    asyncio.run(read_frames())
+
+
+def test_stopped_while_reopening(monkeypatch):
+    reopenable_pty(monkeypatch)
+
+    async def stop() -> None:
+        master, slave = os.openpty()
+        try:
+            reader = make_pty_reader(slave)
+            await reader.async_start(asyncio.get_running_loop())
+            port = reader._reader
+            assert port is not None
+            opening = threading.Event()
+            open_port = port.open
+
+            def slow_open() -> None:
+                opening.set()
+                time.sleep(0.2)
+                open_port()
+
+            port.open = slow_open  # type: ignore[method-assign]
+            reader._drop_connection()
+            await wait_for(opening.is_set)
+            # Cancelled while opening: the port is closed once open, before async_stop returns
+            await reader.async_stop("test")
+            assert reader._reopen_task.cancelled()  # type: ignore[union-attr]
+            assert not port.is_open and reader._fd is None
+        finally:
+            os.close(master)
+            os.close(slave)
+
+    asyncio.run(stop())
+
+
+def test_thread_stopped_right_away():
+    master, slave = os.openpty()
+    try:
+        reader = make_pty_reader(slave)
+        reader.start()
+        deadline = time.monotonic() + READER_STOP_TIMEOUT
+        while not reader.is_connected and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert reader.is_connected
+        # Blocked in a read (1s timeout): woken up by the stop
+        time.sleep(0.1)
+        stopping = time.monotonic()
+        reader.signalstop("test")
+        reader.join(READER_STOP_TIMEOUT)
+        assert not reader.is_alive()
+        assert time.monotonic() - stopping < 0.5
+        assert not reader.is_connected
+    finally:
+        os.close(master)
+        os.close(slave)
@@ -2,6 +2,7 @@
 
 from custom_components.linkytic.status_register import (
     StatusRegister,
+    decode_status_register,
     etat_euridis,
     organe_coupure,
     pointe_mobile,
@@ -91,6 +92,22 @@ def test_parse():
     for element in StatusRegister:
         assert EXPECTED[element] == element.value.get_status(STGE)
 
+
+def test_decode():
+    for stge in ("013AC501", "FFDFE7FD"):
+        decoded = decode_status_register(stge)
+        assert decoded is not None
+        assert decoded.register == int(stge, 16)
+        for element in StatusRegister:
+            try:
+                expected = element.value.get_status(stge)
+            except KeyError:
+                assert element not in decoded.fields
+            else:
+                assert decoded.fields[element] == expected
+    assert decode_status_register("not hex") is None
+
+
 def parse_stge(stge: str):
     for element in StatusRegister:
         print(element.name, element.value.get_status(stge))
@@ -0,0 +1,58 @@
+"""Test the tags values store."""
+
+from custom_components.linkytic.tag_store import TagStore
+
+
+def test_known_and_unknown_tags():
+    store = TagStore()
+    assert store.get("EAST") == (None, None)
+    store.put("EAST", "024785324")
+    store.put("SMAXSN", "04572", "E241017061924")
+    store.put("NOTATAG", "42")
+    # Empty values (DATE) are values too
+    store.put("DATE", "", "E241017094512")
+    assert store.get("EAST") == ("024785324", None)
+    assert store.get("SMAXSN") == ("04572", "E241017061924")
+    assert store.get("NOTATAG") == ("42", None)
+    assert store.get("DATE") == ("", "E241017094512")
+    assert store.tags() == {"EAST", "SMAXSN", "NOTATAG", "DATE"}
+    assert "DATE" in store and "NOTATAG" in store and "PAPP" not in store
+
+
+def test_discard():
+    store = TagStore()
+    store.put("EAST", "024785324")
+    store.put("NOTATAG", "42")
+    store.discard("EAST")
+    store.discard("NOTATAG")
+    store.discard("PAPP")
+    assert store.tags() == set()
+    assert store.get("EAST") == (None, None)
+
+
+def test_clear():
+    store = TagStore()
+    store.put("EAST", "024785324", version=3)
+    store.put("NOTATAG", "42")
+    values = store._values
+    store.clear()
+    assert store.tags() == set()
+    assert store.get_versioned("EAST") == (None, None, 0)
+    # Reused as is: nothing is allocated to store the next values
+    assert store._values is values
+    store.put("EAST", "024785325")
+    assert store.get("EAST") == ("024785325", None)
+
+
+def test_fill():
+    previous = TagStore()
+    previous.put("EAST", "024785324", version=3, typed_value=24785324)
+    previous.put("IRMS1", "004", version=2, typed_value=4)
+    previous.put("NOTATAG", "42")
+    store = TagStore()
+    store.put("EAST", "024785325", version=4, typed_value=24785325)
+    store.fill(previous)
+    # Only the tags missing from the store are taken from the other one
+    assert store.get_typed("EAST") == (24785325, None, 4)
+    assert store.get_typed("IRMS1") == (4, None, 2)
+    assert store.get("NOTATAG") == ("42", None)